@@ -479,20 +479,23 @@ pub fn inferCall(
                 }
 
                 // Check for nested numpy modules: np.random.*, np.linalg.*
-                // prefix is "np.random" or "numpy.random", etc.
-                if (std.mem.startsWith(u8, prefix, "np.random") or
-                    std.mem.startsWith(u8, prefix, "numpy.random"))
-                {
-                    if (NumpyRandomArrayFuncs.has(attr.attr)) return .numpy_array;
-                    // seed() and shuffle() return void (handled in codegen)
-                }
-                if (std.mem.startsWith(u8, prefix, "np.linalg") or
-                    std.mem.startsWith(u8, prefix, "numpy.linalg"))
-                {
-                    // Most linalg functions return scalars (norm, det)
-                    if (NumpyScalarFuncs.has(attr.attr)) return .float;
-                    // inv, solve, eig, svd return arrays
-                    return .numpy_array;
+                // prefix is "np.random" or "numpy.random", etc. - strip the alias once
+                const numpy_submodule: ?[]const u8 = if (std.mem.startsWith(u8, prefix, "np."))
+                    prefix["np.".len..]
+                else if (std.mem.startsWith(u8, prefix, "numpy."))
+                    prefix["numpy.".len..]
+                else
+                    null;
+                if (numpy_submodule) |submodule| {
+                    if (std.mem.startsWith(u8, submodule, "random")) {
+                        if (NumpyRandomArrayFuncs.has(attr.attr)) return .numpy_array;
+                        // seed() and shuffle() return void (handled in codegen)
+                    } else if (std.mem.startsWith(u8, submodule, "linalg")) {
+                        // Most linalg functions return scalars (norm, det)
+                        if (NumpyScalarFuncs.has(attr.attr)) return .float;
+                        // inv, solve, eig, svd return arrays
+                        return .numpy_array;
+                    }
                 }
                 // Check for os.path module
                 if (std.mem.eql(u8, prefix, "os.path") or std.mem.eql(u8, prefix, "path")) {
@@ -36,6 +36,26 @@ const NumpyAllocFuncs = std.StaticStringMap(void).initComptime(.{
     .{ "matmul", {} },
 });
 
+/// Modules whose module.func() calls pull in runtime support
+const CalledModule = enum { json, math, http, asyncio, numpy, collections };
+
+const CalledModules = std.StaticStringMap(CalledModule).initComptime(.{
+    .{ "json", .json },
+    .{ "math", .math },
+    .{ "http", .http },
+    .{ "asyncio", .asyncio },
+    .{ "numpy", .numpy },
+    .{ "np", .numpy },
+    .{ "collections", .collections },
+});
+
+/// collections types backed by hashmap_helper (called bare or as collections.X)
+const CollectionsMapTypes = std.StaticStringMap(void).initComptime(.{
+    .{ "Counter", {} },
+    .{ "defaultdict", {} },
+    .{ "OrderedDict", {} },
+});
+
 /// Analysis result - what the module needs
 pub const ModuleAnalysis = struct {
     needs_json: bool = false,
@@ -173,16 +193,16 @@ fn collectGlobalVars(stmts: []const ast.Node, globals: *std.ArrayList([]const u8
             }
         }
         // Recurse into nested blocks
-        if (stmt == .if_stmt) {
-            try collectGlobalVars(stmt.if_stmt.body, globals, allocator);
-            try collectGlobalVars(stmt.if_stmt.else_body, globals, allocator);
-        } else if (stmt == .for_stmt) {
-            try collectGlobalVars(stmt.for_stmt.body, globals, allocator);
-        } else if (stmt == .while_stmt) {
-            try collectGlobalVars(stmt.while_stmt.body, globals, allocator);
-        } else if (stmt == .function_def) {
+        switch (stmt) {
+            .if_stmt => |if_stmt| {
+                try collectGlobalVars(if_stmt.body, globals, allocator);
+                try collectGlobalVars(if_stmt.else_body, globals, allocator);
+            },
+            .for_stmt => |for_stmt| try collectGlobalVars(for_stmt.body, globals, allocator),
+            .while_stmt => |while_stmt| try collectGlobalVars(while_stmt.body, globals, allocator),
             // Nested functions
-            try collectGlobalVars(stmt.function_def.body, globals, allocator);
+            .function_def => |func| try collectGlobalVars(func.body, globals, allocator),
+            else => {},
         }
     }
 }
@@ -339,41 +359,44 @@ fn analyzeExpr(node: ast.Node) !ModuleAnalysis {
                 }
 
                 if (attr.value.* == .name) {
-                    const module_name = attr.value.name.id;
-
-                    if (std.mem.eql(u8, module_name, "json")) {
-                        analysis.needs_json = true;
-                        analysis.needs_runtime = true;
-                        analysis.needs_allocator = true;
-                    } else if (std.mem.eql(u8, module_name, "math")) {
-                        analysis.needs_runtime = true;
-                        analysis.needs_allocator = true;
-                    } else if (std.mem.eql(u8, module_name, "http")) {
-                        analysis.needs_http = true;
-                        analysis.needs_runtime = true;
-                        analysis.needs_allocator = true;
-                    } else if (std.mem.eql(u8, module_name, "asyncio")) {
-                        analysis.needs_async = true;
-                        analysis.needs_runtime = true;
-                        analysis.needs_allocator = true;
-                    } else if (std.mem.eql(u8, module_name, "numpy") or std.mem.eql(u8, module_name, "np")) {
-                        // NumPy functions that need allocator
-                        if (NumpyAllocFuncs.has(attr.attr)) {
+                    // One table lookup instead of comparing against each module name
+                    if (CalledModules.get(attr.value.name.id)) |module| switch (module) {
+                        .json => {
+                            analysis.needs_json = true;
+                            analysis.needs_runtime = true;
                             analysis.needs_allocator = true;
-                        }
-                    } else if (std.mem.eql(u8, module_name, "collections")) {
-                        // collections module functions need hashmap_helper
-                        if (std.mem.eql(u8, attr.attr, "Counter") or
-                            std.mem.eql(u8, attr.attr, "defaultdict") or
-                            std.mem.eql(u8, attr.attr, "OrderedDict"))
-                        {
-                            analysis.needs_hashmap_helper = true;
+                        },
+                        .math => {
+                            analysis.needs_runtime = true;
                             analysis.needs_allocator = true;
-                        } else if (std.mem.eql(u8, attr.attr, "deque")) {
-                            analysis.needs_std = true;
+                        },
+                        .http => {
+                            analysis.needs_http = true;
+                            analysis.needs_runtime = true;
                             analysis.needs_allocator = true;
-                        }
-                    }
+                        },
+                        .asyncio => {
+                            analysis.needs_async = true;
+                            analysis.needs_runtime = true;
+                            analysis.needs_allocator = true;
+                        },
+                        .numpy => {
+                            // NumPy functions that need allocator
+                            if (NumpyAllocFuncs.has(attr.attr)) {
+                                analysis.needs_allocator = true;
+                            }
+                        },
+                        .collections => {
+                            // collections module functions need hashmap_helper
+                            if (CollectionsMapTypes.has(attr.attr)) {
+                                analysis.needs_hashmap_helper = true;
+                                analysis.needs_allocator = true;
+                            } else if (std.mem.eql(u8, attr.attr, "deque")) {
+                                analysis.needs_std = true;
+                                analysis.needs_allocator = true;
+                            }
+                        },
+                    };
                 }
             }
 
@@ -397,10 +420,7 @@ fn analyzeExpr(node: ast.Node) !ModuleAnalysis {
                 }
 
                 // collections module functions need hashmap_helper
-                if (std.mem.eql(u8, func_name, "Counter") or
-                    std.mem.eql(u8, func_name, "defaultdict") or
-                    std.mem.eql(u8, func_name, "OrderedDict"))
-                {
+                if (CollectionsMapTypes.has(func_name)) {
                     analysis.needs_hashmap_helper = true;
                     analysis.needs_allocator = true;
                 }
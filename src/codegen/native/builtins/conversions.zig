@@ -617,14 +617,13 @@ pub fn genBytes(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
     if (arg_type == .int) {
         // bytes(n) creates a bytes object of n null bytes
         const alloc_name = if (self.symbol_table.currentScopeLevel() > 0) "__global_allocator" else "allocator";
-        try self.emit("blk: {\n");
-        try self.emitFmt("const _len: usize = @intCast(", .{});
+        try self.emit("blk: {\nconst _len: usize = @intCast(");
         try self.genExpr(args[0]);
-        try self.emit(");\n");
-        try self.emitFmt("const _buf = try {s}.alloc(u8, _len);\n", .{alloc_name});
-        try self.emit("@memset(_buf, 0);\n");
-        try self.emit("break :blk _buf;\n");
-        try self.emit("}");
+        try self.emitFmt(");\n" ++
+            "const _buf = try {s}.alloc(u8, _len);\n" ++
+            "@memset(_buf, 0);\n" ++
+            "break :blk _buf;\n" ++
+            "}}", .{alloc_name});
         return;
     }
 
@@ -660,14 +659,13 @@ pub fn genBytearray(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
     if (arg_type == .int) {
         // bytearray(n) creates a bytearray of n null bytes
         const alloc_name = if (self.symbol_table.currentScopeLevel() > 0) "__global_allocator" else "allocator";
-        try self.emit("blk: {\n");
-        try self.emitFmt("const _len: usize = @intCast(", .{});
+        try self.emit("blk: {\nconst _len: usize = @intCast(");
         try self.genExpr(args[0]);
-        try self.emit(");\n");
-        try self.emitFmt("const _buf = {s}.alloc(u8, _len) catch unreachable;\n", .{alloc_name});
-        try self.emit("@memset(_buf, 0);\n");
-        try self.emit("break :blk _buf;\n");
-        try self.emit("}");
+        try self.emitFmt(");\n" ++
+            "const _buf = {s}.alloc(u8, _len) catch unreachable;\n" ++
+            "@memset(_buf, 0);\n" ++
+            "break :blk _buf;\n" ++
+            "}}", .{alloc_name});
         return;
     }
 
@@ -801,15 +799,15 @@ pub fn genList(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
     try self.emit("list_blk: {\n");
     try self.emit("const _iterable = ");
     try self.genExpr(args[0]);
-    try self.emit(";\n");
-    try self.emit("const _ElemType = if (@typeInfo(@TypeOf(_iterable)) == .@\"struct\" and @hasField(@TypeOf(_iterable), \"items\")) @TypeOf(_iterable.items[0]) else @TypeOf(_iterable[0]);\n");
-    try self.emit("var _list = std.ArrayList(_ElemType){};\n");
-    try self.emit("const _slice = if (@typeInfo(@TypeOf(_iterable)) == .@\"struct\" and @hasField(@TypeOf(_iterable), \"items\")) _iterable.items else _iterable;\n");
-    try self.emit("for (_slice) |_item| {\n");
-    try self.emitFmt("try _list.append({s}, _item);\n", .{alloc_name});
-    try self.emit("}\n");
-    try self.emit("break :list_blk _list;\n");
-    try self.emit("}");
+    try self.emitFmt(";\n" ++
+        "const _ElemType = if (@typeInfo(@TypeOf(_iterable)) == .@\"struct\" and @hasField(@TypeOf(_iterable), \"items\")) @TypeOf(_iterable.items[0]) else @TypeOf(_iterable[0]);\n" ++
+        "var _list = std.ArrayList(_ElemType){{}};\n" ++
+        "const _slice = if (@typeInfo(@TypeOf(_iterable)) == .@\"struct\" and @hasField(@TypeOf(_iterable), \"items\")) _iterable.items else _iterable;\n" ++
+        "for (_slice) |_item| {{\n" ++
+        "try _list.append({s}, _item);\n" ++
+        "}}\n" ++
+        "break :list_blk _list;\n" ++
+        "}}", .{alloc_name});
 }
 
 /// Generate code for tuple(iterable)
@@ -943,10 +941,10 @@ pub fn genSet(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
         try self.genExpr(args[0]);
         try self.emit(") |_item| {\n");
     }
-    try self.emit("try _set.put(_item, {});\n");
-    try self.emit("}\n");
-    try self.emit("break :set_blk _set;\n");
-    try self.emit("}");
+    try self.emit("try _set.put(_item, {});\n" ++
+        "}\n" ++
+        "break :set_blk _set;\n" ++
+        "}");
 }
 
 /// Generate code for frozenset(iterable)
@@ -27,7 +27,7 @@ pub fn genComptimeEval(self: *NativeCodegen, source: []const u8) CodegenError!vo
         // If bytecode compilation fails, fall back to runtime eval
         std.debug.print("comptime eval fallback for '{s}': {}\n", .{ eval_source, err });
         try self.emit("try runtime.eval(__global_allocator, \"");
-        try escapeZigString(self, eval_source);
+        try self.emitEscapedString(eval_source);
         try self.emit("\")");
         return;
     };
@@ -60,7 +60,7 @@ pub fn genComptimeEval(self: *NativeCodegen, source: []const u8) CodegenError!vo
     const serialized = program.serialize(self.allocator) catch {
         try self.emit("// serialization failed\n");
         try self.emit("break :blk try runtime.eval(__global_allocator, \"");
-        try escapeZigString(self, source);
+        try self.emitEscapedString(source);
         try self.emit("\");\n}");
         return;
     };
@@ -108,20 +108,6 @@ fn emitInt(self: *NativeCodegen, value: anytype) CodegenError!void {
     try self.emit(result);
 }
 
-/// Helper to escape a string for Zig string literal
-fn escapeZigString(self: *NativeCodegen, source: []const u8) CodegenError!void {
-    for (source) |c| {
-        switch (c) {
-            '"' => try self.emit("\\\""),
-            '\\' => try self.emit("\\\\"),
-            '\n' => try self.emit("\\n"),
-            '\r' => try self.emit("\\r"),
-            '\t' => try self.emit("\\t"),
-            else => try self.output.append(self.allocator, c),
-        }
-    }
-}
-
 /// Generate code for eval(source, [globals, [locals]])
 /// Calls runtime.eval() which uses bytecode VM
 /// Returns *runtime.PyObject that can be used with len(), pyObjToInt(), etc.
@@ -165,18 +165,17 @@ pub fn tryDispatch(self: *NativeCodegen, call: ast.Node.Call) CodegenError!bool
     // Special handling for int() with keyword args (base=...)
     if (std.mem.eql(u8, func_name, "int") and call.keyword_args.len > 0) {
         // Convert keyword args to positional: int('101', base=X) -> int('101', X)
-        var combined_args = std.ArrayList(ast.Node){};
+        // Sized up front: the positional args plus at most one 'base'
+        var combined_args = try std.ArrayList(ast.Node).initCapacity(self.allocator, call.args.len + 1);
         defer combined_args.deinit(self.allocator);
 
         // Add positional args first
-        for (call.args) |arg| {
-            try combined_args.append(self.allocator, arg);
-        }
+        combined_args.appendSliceAssumeCapacity(call.args);
 
         // Find and add 'base' keyword arg as second positional
         for (call.keyword_args) |kwarg| {
             if (std.mem.eql(u8, kwarg.name, "base")) {
-                try combined_args.append(self.allocator, kwarg.value);
+                combined_args.appendAssumeCapacity(kwarg.value);
                 break;
             }
         }
@@ -208,6 +208,34 @@ const UnittestMethods = std.StaticStringMap(MethodHandler).initComptime(.{
     .{ "skipTest", unittest_mod.genSkipTest },
 });
 
+// Every method name the tables above handle (plus subTest) - O(1) rejection of
+// user-defined methods before probing each family (and type-inferring obj for sqlite)
+const DispatchedMethodNames = unionOfKeys(.{
+    StringMethods,
+    ListMethods,
+    DictMethods,
+    FileMethods,
+    StreamMethods,
+    HashMethods,
+    PandasColumnMethods,
+    SpecialMethods,
+    QueueMethods,
+    SqliteCursorMethods,
+    SqliteConnectionMethods,
+    UnittestMethods,
+}, &.{"subTest"});
+
+/// Build a name set from the keys of several StaticStringMaps at comptime
+fn unionOfKeys(comptime maps: anytype, comptime extra: []const []const u8) std.StaticStringMap(void) {
+    @setEvalBranchQuota(100_000);
+    comptime var kvs: []const struct { []const u8 } = &.{};
+    inline for (maps) |map| {
+        for (map.keys()) |key| kvs = kvs ++ .{.{key}};
+    }
+    for (extra) |key| kvs = kvs ++ .{.{key}};
+    return std.StaticStringMap(void).initComptime(kvs);
+}
+
 /// Try to dispatch method call (obj.method())
 /// Returns true if dispatched successfully
 pub fn tryDispatch(self: *NativeCodegen, call: ast.Node.Call) CodegenError!bool {
@@ -242,6 +270,9 @@ pub fn tryDispatch(self: *NativeCodegen, call: ast.Node.Call) CodegenError!bool
         return true;
     }
 
+    // Not a method any family below handles (e.g. user class methods)
+    if (!DispatchedMethodNames.has(method_name)) return false;
+
     // Try string methods first (most common)
     if (StringMethods.get(method_name)) |handler| {
         try handler(self, obj, call.args);
@@ -45,6 +45,23 @@ fn isCapturedByCurrentClass(self: *NativeCodegen, var_name: []const u8) bool {
     return false;
 }
 
+/// Python type names and singletons that are emitted as fixed Zig values
+const NameValues = std.StaticStringMap([]const u8).initComptime(.{
+    .{ "int", "i64" },
+    .{ "float", "f64" },
+    .{ "bool", "bool" },
+    // Type names used as values - emit a PyCallable factory for list storage
+    .{ "str", "runtime.builtins.str_factory" },
+    .{ "bytes", "runtime.builtins.bytes_factory" },
+    .{ "bytearray", "runtime.builtins.bytearray_factory" },
+    .{ "memoryview", "runtime.builtins.memoryview_factory" },
+    .{ "None", "null" },
+    .{ "NoneType", "null" },
+    // Python's NotImplemented singleton - used by binary operations
+    .{ "NotImplemented", "runtime.NotImplemented" },
+    .{ "object", "*runtime.PyObject" },
+});
+
 /// Main expression dispatcher
 pub fn genExpr(self: *NativeCodegen, node: ast.Node) CodegenError!void {
     switch (node) {
@@ -59,38 +76,15 @@ pub fn genExpr(self: *NativeCodegen, node: ast.Node) CodegenError!void {
                 return;
             }
 
-            // Handle Python type names as type values
-            if (std.mem.eql(u8, name_to_use, "int")) {
-                try self.emit("i64");
-            } else if (std.mem.eql(u8, name_to_use, "float")) {
-                try self.emit("f64");
-            } else if (std.mem.eql(u8, name_to_use, "bool")) {
-                try self.emit("bool");
-            } else if (std.mem.eql(u8, name_to_use, "str")) {
-                // str type as value - emit a PyCallable factory for list storage
-                try self.emit("runtime.builtins.str_factory");
-            } else if (std.mem.eql(u8, name_to_use, "bytes")) {
-                // bytes type as value - emit a PyCallable factory for list storage
-                try self.emit("runtime.builtins.bytes_factory");
-            } else if (std.mem.eql(u8, name_to_use, "bytearray")) {
-                // bytearray type as value - emit a PyCallable factory for list storage
-                try self.emit("runtime.builtins.bytearray_factory");
-            } else if (std.mem.eql(u8, name_to_use, "memoryview")) {
-                // memoryview type as value - emit a PyCallable factory for list storage
-                try self.emit("runtime.builtins.memoryview_factory");
-            } else if (std.mem.eql(u8, name_to_use, "None") or std.mem.eql(u8, name_to_use, "NoneType")) {
-                try self.emit("null");
-            } else if (std.mem.eql(u8, name_to_use, "NotImplemented")) {
-                // Python's NotImplemented singleton - used by binary operations
-                try self.emit("runtime.NotImplemented");
+            // Handle Python type names and singletons as values (one hash lookup)
+            if (NameValues.get(name_to_use)) |zig_value| {
+                try self.emit(zig_value);
             } else if (isPythonExceptionType(name_to_use)) {
                 // Python exception types - emit as integer enum value for storage in lists/tuples
                 // E.g., ValueError -> @intFromEnum(runtime.ExceptionTypeId.ValueError)
                 try self.emit("@intFromEnum(runtime.ExceptionTypeId.");
                 try self.emit(name_to_use);
                 try self.emit(")");
-            } else if (std.mem.eql(u8, name_to_use, "object")) {
-                try self.emit("*runtime.PyObject");
             } else if (isBuiltinFunction(name_to_use)) {
                 // Builtin functions as first-class values: len, callable, etc.
                 // Emit a function reference that can be passed around
@@ -305,17 +299,7 @@ fn genFString(self: *NativeCodegen, fstring: ast.Node.FString) CodegenError!void
         // Simple case: just concatenate literals
         try self.emit("\"");
         for (fstring.parts) |part| {
-            const lit = part.literal;
-            for (lit) |c| {
-                switch (c) {
-                    '"' => try self.emit("\\\""),
-                    '\\' => try self.emit("\\\\"),
-                    '\n' => try self.emit("\\n"),
-                    '\r' => try self.emit("\\r"),
-                    '\t' => try self.emit("\\t"),
-                    else => try self.output.writer(self.allocator).print("{c}", .{c}),
-                }
-            }
+            try self.emitEscapedString(part.literal);
         }
         try self.emit("\"");
         return;
@@ -441,126 +425,124 @@ fn genFString(self: *NativeCodegen, fstring: ast.Node.FString) CodegenError!void
     );
 }
 
+/// Python builtin functions that can be passed as first-class values
+const BuiltinFunctionNames = std.StaticStringMap(void).initComptime(.{
+    .{ "len", {} },
+    .{ "callable", {} },
+    .{ "print", {} },
+    .{ "repr", {} },
+    .{ "str", {} },
+    .{ "abs", {} },
+    .{ "max", {} },
+    .{ "min", {} },
+    .{ "sum", {} },
+    .{ "sorted", {} },
+    .{ "reversed", {} },
+    .{ "enumerate", {} },
+    .{ "zip", {} },
+    .{ "map", {} },
+    .{ "filter", {} },
+    .{ "range", {} },
+    .{ "list", {} },
+    .{ "dict", {} },
+    .{ "set", {} },
+    .{ "tuple", {} },
+    .{ "type", {} },
+    .{ "isinstance", {} },
+    .{ "issubclass", {} },
+    .{ "hasattr", {} },
+    .{ "getattr", {} },
+    .{ "setattr", {} },
+    .{ "delattr", {} },
+    .{ "id", {} },
+    .{ "hash", {} },
+    .{ "ord", {} },
+    .{ "chr", {} },
+    .{ "hex", {} },
+    .{ "oct", {} },
+    .{ "bin", {} },
+    .{ "round", {} },
+    .{ "pow", {} },
+    .{ "divmod", {} },
+    .{ "all", {} },
+    .{ "any", {} },
+    .{ "iter", {} },
+    .{ "next", {} },
+    .{ "open", {} },
+    .{ "input", {} },
+    .{ "format", {} },
+    .{ "vars", {} },
+    .{ "dir", {} },
+    .{ "globals", {} },
+    .{ "locals", {} },
+    .{ "eval", {} },
+    .{ "exec", {} },
+    .{ "compile", {} },
+    .{ "staticmethod", {} },
+    .{ "classmethod", {} },
+    .{ "property", {} },
+    .{ "super", {} },
+    .{ "object", {} },
+    .{ "slice", {} },
+    .{ "memoryview", {} },
+    .{ "bytearray", {} },
+    .{ "frozenset", {} },
+    .{ "complex", {} },
+    .{ "ascii", {} },
+    .{ "breakpoint", {} },
+    .{ "__import__", {} },
+    // collections module builtins (from collections import ...)
+    .{ "deque", {} },
+    .{ "Counter", {} },
+    .{ "defaultdict", {} },
+    .{ "OrderedDict", {} },
+});
+
 /// Check if a name is a Python builtin function that can be passed as first-class value
 fn isBuiltinFunction(name: []const u8) bool {
-    const builtins = [_][]const u8{
-        "len",
-        "callable",
-        "print",
-        "repr",
-        "str",
-        "abs",
-        "max",
-        "min",
-        "sum",
-        "sorted",
-        "reversed",
-        "enumerate",
-        "zip",
-        "map",
-        "filter",
-        "range",
-        "list",
-        "dict",
-        "set",
-        "tuple",
-        "type",
-        "isinstance",
-        "issubclass",
-        "hasattr",
-        "getattr",
-        "setattr",
-        "delattr",
-        "id",
-        "hash",
-        "ord",
-        "chr",
-        "hex",
-        "oct",
-        "bin",
-        "round",
-        "pow",
-        "divmod",
-        "all",
-        "any",
-        "iter",
-        "next",
-        "open",
-        "input",
-        "format",
-        "vars",
-        "dir",
-        "globals",
-        "locals",
-        "eval",
-        "exec",
-        "compile",
-        "staticmethod",
-        "classmethod",
-        "property",
-        "super",
-        "object",
-        "slice",
-        "memoryview",
-        "bytearray",
-        "frozenset",
-        "complex",
-        "ascii",
-        "breakpoint",
-        "__import__",
-        // collections module builtins (from collections import ...)
-        "deque",
-        "Counter",
-        "defaultdict",
-        "OrderedDict",
-    };
-    for (builtins) |b| {
-        if (std.mem.eql(u8, name, b)) return true;
-    }
-    return false;
+    return BuiltinFunctionNames.has(name);
 }
 
+/// Python exception type names
+const ExceptionTypeNames = std.StaticStringMap(void).initComptime(.{
+    .{ "TypeError", {} },
+    .{ "ValueError", {} },
+    .{ "KeyError", {} },
+    .{ "IndexError", {} },
+    .{ "ZeroDivisionError", {} },
+    .{ "AttributeError", {} },
+    .{ "NameError", {} },
+    .{ "FileNotFoundError", {} },
+    .{ "IOError", {} },
+    .{ "RuntimeError", {} },
+    .{ "StopIteration", {} },
+    .{ "NotImplementedError", {} },
+    .{ "AssertionError", {} },
+    .{ "OverflowError", {} },
+    .{ "ImportError", {} },
+    .{ "ModuleNotFoundError", {} },
+    .{ "OSError", {} },
+    .{ "PermissionError", {} },
+    .{ "TimeoutError", {} },
+    .{ "ConnectionError", {} },
+    .{ "RecursionError", {} },
+    .{ "MemoryError", {} },
+    .{ "LookupError", {} },
+    .{ "ArithmeticError", {} },
+    .{ "BufferError", {} },
+    .{ "EOFError", {} },
+    .{ "GeneratorExit", {} },
+    .{ "SystemExit", {} },
+    .{ "KeyboardInterrupt", {} },
+    .{ "Exception", {} },
+    .{ "BaseException", {} },
+    .{ "SyntaxError", {} },
+    .{ "UnicodeError", {} },
+    .{ "UnicodeDecodeError", {} },
+    .{ "UnicodeEncodeError", {} },
+});
+
 /// Check if a name is a Python exception type
 fn isPythonExceptionType(name: []const u8) bool {
-    const exceptions = [_][]const u8{
-        "TypeError",
-        "ValueError",
-        "KeyError",
-        "IndexError",
-        "ZeroDivisionError",
-        "AttributeError",
-        "NameError",
-        "FileNotFoundError",
-        "IOError",
-        "RuntimeError",
-        "StopIteration",
-        "NotImplementedError",
-        "AssertionError",
-        "OverflowError",
-        "ImportError",
-        "ModuleNotFoundError",
-        "OSError",
-        "PermissionError",
-        "TimeoutError",
-        "ConnectionError",
-        "RecursionError",
-        "MemoryError",
-        "LookupError",
-        "ArithmeticError",
-        "BufferError",
-        "EOFError",
-        "GeneratorExit",
-        "SystemExit",
-        "KeyboardInterrupt",
-        "Exception",
-        "BaseException",
-        "SyntaxError",
-        "UnicodeError",
-        "UnicodeDecodeError",
-        "UnicodeEncodeError",
-    };
-    for (exceptions) |e| {
-        if (std.mem.eql(u8, name, e)) return true;
-    }
-    return false;
+    return ExceptionTypeNames.has(name);
 }
@@ -6,7 +6,6 @@ const CodegenError = @import("../main.zig").CodegenError;
 const dispatch = @import("../dispatch.zig");
 const lambda_mod = @import("lambda.zig");
 const zig_keywords = @import("zig_keywords");
-const allocator_analyzer = @import("../statements/functions/allocator_analyzer.zig");
 const import_registry = @import("../import_registry.zig");
 const generators = @import("../statements/functions/generators.zig");
 
@@ -190,30 +189,29 @@ pub fn genCall(self: *NativeCodegen, call: ast.Node.Call) CodegenError!void {
     if (call.func.* == .attribute) {
         const attr = call.func.attribute;
 
+        // Resolve self.method() once: the enclosing class keys the lookups below
+        // (non-null only when current_class_name is set)
+        const is_self_call = attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self");
+        const self_class_name: ?[]const u8 = if (is_self_call) self.current_class_name else null;
+
         // Check if this is a class-level type attribute call (e.g., self.int_class(...))
         // Type attributes are static functions, not methods, so we call them via @This()
-        if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-            // Check if current_class_name is set and if this attr is a type attribute
-            if (self.current_class_name) |class_name| {
-                const type_attr_key = std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class_name, attr.attr }) catch null;
-                if (type_attr_key) |key| {
-                    if (self.class_type_attrs.get(key)) |type_value| {
-                        // This is a type attribute - call as @This().attr_name(args)
-                        try self.emit("@This().");
-                        try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), attr.attr);
-                        try self.emit("(");
-                        for (call.args, 0..) |arg, i| {
-                            if (i > 0) try self.emit(", ");
-                            try genExpr(self, arg);
-                        }
-                        // For int type attributes with optional base param, add null if not provided
-                        if (std.mem.eql(u8, type_value, "int") and call.args.len == 1) {
-                            try self.emit(", null");
-                        }
-                        try self.emit(")");
-                        return;
-                    }
+        if (self_class_name) |class_name| {
+            if (self.getClassTypeAttr(class_name, attr.attr)) |type_value| {
+                // This is a type attribute - call as @This().attr_name(args)
+                try self.emit("@This().");
+                try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), attr.attr);
+                try self.emit("(");
+                for (call.args, 0..) |arg, i| {
+                    if (i > 0) try self.emit(", ");
+                    try genExpr(self, arg);
+                }
+                // For int type attributes with optional base param, add null if not provided
+                if (std.mem.eql(u8, type_value, "int") and call.args.len == 1) {
+                    try self.emit(", null");
                 }
+                try self.emit(")");
+                return;
             }
         }
 
@@ -251,18 +249,10 @@ pub fn genCall(self: *NativeCodegen, call: ast.Node.Call) CodegenError!void {
             const obj_type = self.type_inferrer.inferExpr(attr.value.*) catch .unknown;
             if (obj_type == .class_instance) {
                 const class_name = obj_type.class_instance;
-                // Look up method in class registry
-                if (self.class_registry.findMethod(class_name, attr.attr)) |method_info| {
+                // Look up method in class registry (allocator analysis is cached there)
+                if (self.class_registry.resolveMethodCall(class_name, attr.attr)) |method_call| {
                     is_class_method_call = true;
-                    // Get the method's FunctionDef from the class and check if it needs allocator
-                    if (self.class_registry.getClass(method_info.class_name)) |class_def| {
-                        for (class_def.body) |stmt| {
-                            if (stmt == .function_def and std.mem.eql(u8, stmt.function_def.name, attr.attr)) {
-                                class_method_needs_alloc = allocator_analyzer.functionNeedsAllocator(stmt.function_def);
-                                break;
-                            }
-                        }
-                    }
+                    class_method_needs_alloc = method_call.needs_allocator;
                 }
             }
             // Check if this is a nested class instance method call (obj.method() where obj = Inner())
@@ -277,18 +267,13 @@ pub fn genCall(self: *NativeCodegen, call: ast.Node.Call) CodegenError!void {
             }
             // Check if this is a self.method() call within the current class
             // These need allocator if the method signature requires it
-            if (!is_class_method_call and attr.value.* == .name and
-                std.mem.eql(u8, attr.value.name.id, "self"))
-            {
+            if (!is_class_method_call and is_self_call) {
                 if (self.current_class_name) |class_name| {
-                    // Look up method in class registry for current class
-                    if (self.class_registry.getClass(class_name)) |class_def| {
-                        for (class_def.body) |stmt| {
-                            if (stmt == .function_def and std.mem.eql(u8, stmt.function_def.name, attr.attr)) {
-                                is_class_method_call = true;
-                                class_method_needs_alloc = allocator_analyzer.functionNeedsAllocator(stmt.function_def);
-                                break;
-                            }
+                    // Look up method in class registry for current class (not inherited)
+                    if (self.class_registry.resolveMethodCall(class_name, attr.attr)) |method_call| {
+                        if (std.mem.eql(u8, method_call.class_name, class_name)) {
+                            is_class_method_call = true;
+                            class_method_needs_alloc = method_call.needs_allocator;
                         }
                     }
                 }
@@ -397,19 +382,13 @@ pub fn genCall(self: *NativeCodegen, call: ast.Node.Call) CodegenError!void {
 
             // Add null for missing optional parameters when calling self.method()
             // Look up method signature to check if we need to fill in defaults
-            if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                if (self.current_class_name) |class_name| {
-                    var method_key_buf: [512]u8 = undefined;
-                    const method_key = std.fmt.bufPrint(&method_key_buf, "{s}.{s}", .{ class_name, attr.attr }) catch null;
-                    if (method_key) |key| {
-                        if (self.function_signatures.get(key)) |sig| {
-                            const provided_args = call.args.len + call.keyword_args.len;
-                            const missing_args = if (sig.total_params > provided_args) sig.total_params - provided_args else 0;
-                            for (0..missing_args) |j| {
-                                if (provided_args > 0 or j > 0) try self.emit(", ");
-                                try self.emit("null");
-                            }
-                        }
+            if (self_class_name) |class_name| {
+                if (self.getMethodSignature(class_name, attr.attr)) |sig| {
+                    const provided_args = call.args.len + call.keyword_args.len;
+                    const missing_args = if (sig.total_params > provided_args) sig.total_params - provided_args else 0;
+                    for (0..missing_args) |j| {
+                        if (provided_args > 0 or j > 0) try self.emit(", ");
+                        try self.emit("null");
                     }
                 }
             }
@@ -670,39 +649,27 @@ pub fn genCall(self: *NativeCodegen, call: ast.Node.Call) CodegenError!void {
             }
         }
 
-        // Check if function has default parameters
-        const func_sig = self.function_signatures.get(raw_func_name);
-        const has_defaults = if (func_sig) |sig| sig.total_params > sig.required_params else false;
+        // Count the default parameters this call leaves out (padded with null below)
+        const provided_args = call.args.len + call.keyword_args.len;
+        const missing_defaults: usize = if (self.function_signatures.get(raw_func_name)) |sig|
+            if (sig.total_params > sig.required_params) sig.total_params -| provided_args else 0
+        else
+            0;
 
         // Add regular arguments - wrap in slice for vararg functions
         if (is_vararg_func) {
-            // Check if any args are starred (unpacked)
-            var has_starred = false;
-            for (call.args) |arg| {
-                if (arg == .starred) {
-                    has_starred = true;
-                    break;
-                }
-            }
+            // Find the first starred (unpacked) arg in the same pass that detects one
+            const starred_arg: ?ast.Node = for (call.args) |arg| {
+                if (arg == .starred) break arg;
+            } else null;
 
-            if (has_starred) {
+            if (starred_arg) |arg| {
                 // Build slice at runtime by concatenating unpacked arrays
                 // For now: if there's a starred arg, just pass it directly (assume single starred arg)
-                var found_starred = false;
-                for (call.args) |arg| {
-                    if (arg == .starred) {
-                        // Generate the value with & prefix to convert array to slice
-                        // *[1,2] becomes &[_]i64{1, 2} which is []const i64
-                        try self.emit("&");
-                        try genExpr(self, arg.starred.value.*);
-                        found_starred = true;
-                        break;
-                    }
-                }
-                if (!found_starred) {
-                    // Shouldn't happen, but handle gracefully
-                    try self.emit("&[_]i64{}");
-                }
+                // Generate the value with & prefix to convert array to slice
+                // *[1,2] becomes &[_]i64{1, 2} which is []const i64
+                try self.emit("&");
+                try genExpr(self, arg.starred.value.*);
             } else {
                 // Normal case: wrap args in slice
                 try self.emit("&[_]i64{");
@@ -755,31 +722,23 @@ pub fn genCall(self: *NativeCodegen, call: ast.Node.Call) CodegenError!void {
                 }
 
                 // Pad with null for missing default parameters
-                if (has_defaults) {
-                    if (func_sig) |sig| {
-                        const provided_args = call.args.len + call.keyword_args.len;
-                        if (provided_args < sig.total_params) {
-                            var i: usize = provided_args;
-                            while (i < sig.total_params) : (i += 1) {
-                                if (i > 0) try self.emit(", ");
-                                try self.emit("null");
-                            }
-                        }
-                    }
+                // Only the very first argument goes without a separator, so that
+                // case is peeled off instead of tested on every iteration
+                var pad = missing_defaults;
+                if (pad > 0 and provided_args == 0) {
+                    try self.emit("null");
+                    pad -= 1;
                 }
+                for (0..pad) |_| try self.emit(", null");
 
                 // Special case: calling a variable that's a renamed type attribute (e.g., int_class -> _local_int_class)
                 // If this is an int type attribute, it needs a second null arg for the base parameter
                 if (self.var_renames.get(raw_func_name)) |_| {
                     // Check if this is a type attribute of int type
                     if (self.current_class_name) |class_name| {
-                        var type_attr_key_buf: [512]u8 = undefined;
-                        const type_attr_key = std.fmt.bufPrint(&type_attr_key_buf, "{s}.{s}", .{ class_name, raw_func_name }) catch null;
-                        if (type_attr_key) |key| {
-                            if (self.class_type_attrs.get(key)) |type_value| {
-                                if (std.mem.eql(u8, type_value, "int") and call.args.len == 1) {
-                                    try self.emit(", null");
-                                }
+                        if (self.getClassTypeAttr(class_name, raw_func_name)) |type_value| {
+                            if (std.mem.eql(u8, type_value, "int") and call.args.len == 1) {
+                                try self.emit(", null");
                             }
                         }
                     }
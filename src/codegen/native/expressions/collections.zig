@@ -169,11 +169,10 @@ pub fn genList(self: *NativeCodegen, list: ast.Node.List) CodegenError!void {
 /// Generate comptime-optimized list literal
 fn genListComptime(self: *NativeCodegen, list: ast.Node.List) CodegenError!void {
     // Generate unique block label
-    const label = try std.fmt.allocPrint(self.allocator, "list_{d}", .{@intFromPtr(list.elts.ptr)});
-    defer self.allocator.free(label);
+    const label_id = self.block_label_counter;
+    self.block_label_counter += 1;
 
-    try self.emit(label);
-    try self.emit(": {\n");
+    try self.emitFmt("list_{d}: {{\n", .{label_id});
     self.indent();
     try self.emitIndent();
 
@@ -227,9 +226,7 @@ fn genListComptime(self: *NativeCodegen, list: ast.Node.List) CodegenError!void
     try self.emit("}\n");
 
     try self.emitIndent();
-    try self.emit("break :");
-    try self.emit(label);
-    try self.emit(" _list;\n");
+    try self.emitFmt("break :list_{d} _list;\n", .{label_id});
     self.dedent();
     try self.emitIndent();
     try self.emit("}");
@@ -237,11 +234,10 @@ fn genListComptime(self: *NativeCodegen, list: ast.Node.List) CodegenError!void
 
 /// Generate runtime list literal (fallback path)
 fn genListRuntime(self: *NativeCodegen, list: ast.Node.List) CodegenError!void {
-    const runtime_label = try std.fmt.allocPrint(self.allocator, "list_{d}", .{@intFromPtr(list.elts.ptr)});
-    defer self.allocator.free(runtime_label);
+    const label_id = self.block_label_counter;
+    self.block_label_counter += 1;
 
-    try self.emit(runtime_label);
-    try self.emit(": {\n");
+    try self.emitFmt("list_{d}: {{\n", .{label_id});
     self.indent();
     try self.emitIndent();
 
@@ -258,10 +254,14 @@ fn genListRuntime(self: *NativeCodegen, list: ast.Node.List) CodegenError!void {
     try elem_type.toZigType(self.allocator, &self.output);
     try self.emit("){};\n");
 
+    // Element count is known statically - allocate once, then append without growth checks
+    try self.emitIndent();
+    try self.emitFmt("try _list.ensureTotalCapacityPrecise(__global_allocator, {d});\n", .{list.elts.len});
+
     // Append each element (with type coercion if needed)
     for (list.elts) |elem| {
         try self.emitIndent();
-        try self.emit("try _list.append(__global_allocator, ");
+        try self.emit("_list.appendAssumeCapacity(");
 
         // Check if we need to cast this element
         const this_type = try self.type_inferrer.inferExpr(elem);
@@ -282,9 +282,7 @@ fn genListRuntime(self: *NativeCodegen, list: ast.Node.List) CodegenError!void {
     }
 
     try self.emitIndent();
-    try self.emit("break :");
-    try self.emit(runtime_label);
-    try self.emit(" _list;\n");
+    try self.emitFmt("break :list_{d} _list;\n", .{label_id});
     self.dedent();
     try self.emitIndent();
     try self.emit("}");
@@ -299,11 +297,10 @@ pub fn genSet(self: *NativeCodegen, set_node: ast.Node.Set) CodegenError!void {
     }
 
     // Generate unique block label
-    const label = try std.fmt.allocPrint(self.allocator, "set_{d}", .{@intFromPtr(set_node.elts.ptr)});
-    defer self.allocator.free(label);
+    const label_id = self.block_label_counter;
+    self.block_label_counter += 1;
 
-    try self.emit(label);
-    try self.emit(": {\n");
+    try self.emitFmt("set_{d}: {{\n", .{label_id});
     self.indent();
     try self.emitIndent();
 
@@ -333,9 +330,7 @@ pub fn genSet(self: *NativeCodegen, set_node: ast.Node.Set) CodegenError!void {
     }
 
     try self.emitIndent();
-    try self.emit("break :");
-    try self.emit(label);
-    try self.emit(" _set;\n");
+    try self.emitFmt("break :set_{d} _set;\n", .{label_id});
     self.dedent();
     try self.emitIndent();
     try self.emit("}");
@@ -5,6 +5,29 @@ const NativeCodegen = @import("../main.zig").NativeCodegen;
 const CodegenError = @import("../main.zig").CodegenError;
 const hashmap_helper = @import("hashmap_helper");
 
+/// Whether a comprehension source can be iterated directly (no `.items`):
+/// string literals, const array variables, anytype params and string variables
+fn isDirectIterable(self: *NativeCodegen, iter: ast.Node) bool {
+    return switch (iter) {
+        // String literals are directly iterable (they're Zig arrays)
+        .constant => |c| c.value == .string,
+        .name => |n| self.isArrayVar(n.id) or
+            self.anytype_params.contains(n.id) or
+            if (self.getVarType(n.id)) |vt| vt == .string else false,
+        else => false,
+    };
+}
+
+/// Close every `for`/`if` block opened above `base_indent`, one "}" per level,
+/// leaving the indent level restored to `base_indent`
+fn closeBlocksTo(self: *NativeCodegen, base_indent: usize) CodegenError!void {
+    while (self.indent_level > base_indent) {
+        self.dedent();
+        try self.emitIndent();
+        try self.emit("}\n");
+    }
+}
+
 /// Generate expression with variable substitutions for comprehensions
 fn genExprWithSubs(
     self: *NativeCodegen,
@@ -76,25 +99,30 @@ pub fn genListComp(self: *NativeCodegen, listcomp: ast.Node.ListComp) CodegenErr
     const parent = @import("../expressions.zig");
     const genExpr = parent.genExpr;
 
-    // Generate unique ID for this comprehension to avoid variable shadowing
-    const comp_id = self.output.items.len;
-
     // Get unique block label to avoid nested block conflicts
+    // Also used to mangle loop variables so nested comprehensions don't shadow
     const label_id = self.block_label_counter;
     self.block_label_counter += 1;
 
     // Build variable substitution map for this comprehension
+    // Mangled names are owned by the map and freed once the body is emitted
     var subs = hashmap_helper.StringHashMap([]const u8).init(self.allocator);
-    defer subs.deinit();
+    defer {
+        for (subs.values()) |mangled| self.allocator.free(mangled);
+        subs.deinit();
+    }
 
     // Generate: comp_N: { ... }
-    try self.emit(try std.fmt.allocPrint(self.allocator, "comp_{d}: {{\n", .{label_id}));
+    try self.emitFmt("comp_{d}: {{\n", .{label_id});
     self.indent();
 
     // Generate: var __comp_result = std.ArrayList(i64){};
     try self.emitIndent();
     try self.emit("var __comp_result = std.ArrayList(i64){};\n");
 
+    // Indent level the loops open from; closing braces unwind back to it
+    const loops_base_indent = self.indent_level;
+
     // Generate nested loops for each generator
     for (listcomp.generators, 0..) |gen, gen_idx| {
         // Check if this is a range() call
@@ -108,8 +136,15 @@ pub fn genListComp(self: *NativeCodegen, listcomp: ast.Node.ListComp) CodegenErr
             const args = gen.iter.call.args;
 
             // Create mangled name and add to substitution map
-            const mangled_name = try std.fmt.allocPrint(self.allocator, "__comp_{s}_{d}", .{ orig_var_name, comp_id });
-            try subs.put(orig_var_name, mangled_name);
+            // The name only depends on the label, so a repeated target reuses it
+            const mangled_entry = try subs.getOrPut(orig_var_name);
+            if (!mangled_entry.found_existing) {
+                mangled_entry.value_ptr.* = std.fmt.allocPrint(self.allocator, "__comp_{s}_{d}", .{ orig_var_name, label_id }) catch |err| {
+                    _ = subs.swapRemove(orig_var_name);
+                    return err;
+                };
+            }
+            const mangled_name = mangled_entry.value_ptr.*;
 
             // Parse range arguments
             var start_val: i64 = 0;
@@ -133,36 +168,19 @@ pub fn genListComp(self: *NativeCodegen, listcomp: ast.Node.ListComp) CodegenErr
 
             // Generate: var __comp_<orig>_<id>: i64 = <start>;
             try self.emitIndent();
-            try self.output.writer(self.allocator).print("var {s}: i64 = {d};\n", .{ mangled_name, start_val });
+            try self.emitFmt("var {s}: i64 = {d};\n", .{ mangled_name, start_val });
 
             // Generate: while (__comp_<orig>_<id> < <stop>) {
             try self.emitIndent();
-            try self.output.writer(self.allocator).print("while ({s} < {d}) {{\n", .{ mangled_name, stop_val });
+            try self.emitFmt("while ({s} < {d}) {{\n", .{ mangled_name, stop_val });
             self.indent();
 
             // Defer increment: defer __comp_<orig>_<id> += <step>;
             try self.emitIndent();
-            try self.output.writer(self.allocator).print("defer {s} += {d};\n", .{ mangled_name, step_val });
+            try self.emitFmt("defer {s} += {d};\n", .{ mangled_name, step_val });
         } else {
             // Regular iteration - check if source is constant array, ArrayList, or anytype param
-            const is_direct_iterable = blk: {
-                // String literals are directly iterable (they're Zig arrays)
-                if (gen.iter.* == .constant) {
-                    if (gen.iter.constant.value == .string) break :blk true;
-                }
-                if (gen.iter.* == .name) {
-                    const var_name = gen.iter.name.id;
-                    // Const array variables can be iterated directly
-                    if (self.isArrayVar(var_name)) break :blk true;
-                    // anytype parameters should also be iterated directly (no .items)
-                    if (self.anytype_params.contains(var_name)) break :blk true;
-                    // String variables are directly iterable
-                    if (self.getVarType(var_name)) |vt| {
-                        if (vt == .string) break :blk true;
-                    }
-                }
-                break :blk false;
-            };
+            const is_direct_iterable = isDirectIterable(self, gen.iter.*);
 
             try self.emitIndent();
             if (is_direct_iterable) {
@@ -229,24 +247,12 @@ pub fn genListComp(self: *NativeCodegen, listcomp: ast.Node.ListComp) CodegenErr
     try self.emit(");\n");
 
     // Close all if conditions and for loops
-    for (listcomp.generators) |gen| {
-        // Close if conditions for this generator
-        for (gen.ifs) |_| {
-            self.dedent();
-            try self.emitIndent();
-            try self.emit("}\n");
-        }
-
-        // Close for loop
-        self.dedent();
-        try self.emitIndent();
-        try self.emit("}\n");
-    }
+    try closeBlocksTo(self, loops_base_indent);
 
     // Generate: break :comp_N __comp_result;
     // Return the ArrayList itself (not a slice) so caller can use .items or .append
     try self.emitIndent();
-    try self.emit(try std.fmt.allocPrint(self.allocator, "break :comp_{d} __comp_result;\n", .{label_id}));
+    try self.emitFmt("break :comp_{d} __comp_result;\n", .{label_id});
 
     self.dedent();
     try self.emitIndent();
@@ -266,7 +272,7 @@ pub fn genDictComp(self: *NativeCodegen, dictcomp: ast.Node.DictComp) CodegenErr
     self.block_label_counter += 1;
 
     // Generate: dict_N: { ... }
-    try self.emit(try std.fmt.allocPrint(self.allocator, "dict_{d}: {{\n", .{label_id}));
+    try self.emitFmt("dict_{d}: {{\n", .{label_id});
     self.indent();
 
     // Generate HashMap instead of ArrayList for compatibility with print(dict)
@@ -277,6 +283,9 @@ pub fn genDictComp(self: *NativeCodegen, dictcomp: ast.Node.DictComp) CodegenErr
         try self.emit("var __dict_result = hashmap_helper.StringHashMap(i64).init(__global_allocator);\n");
     }
 
+    // Indent level the loops open from; closing braces unwind back to it
+    const loops_base_indent = self.indent_level;
+
     // Generate nested loops for each generator
     for (dictcomp.generators, 0..) |gen, gen_idx| {
         // Check if this is a range() call
@@ -322,24 +331,7 @@ pub fn genDictComp(self: *NativeCodegen, dictcomp: ast.Node.DictComp) CodegenErr
             try self.output.writer(self.allocator).print("defer {s} += {d};\n", .{ var_name, step_val });
         } else {
             // Regular iteration - check if source is constant array, ArrayList, or anytype param
-            const is_direct_iterable = blk: {
-                // String literals are directly iterable (they're Zig arrays)
-                if (gen.iter.* == .constant) {
-                    if (gen.iter.constant.value == .string) break :blk true;
-                }
-                if (gen.iter.* == .name) {
-                    const var_name_inner = gen.iter.name.id;
-                    // Const array variables can be iterated directly
-                    if (self.isArrayVar(var_name_inner)) break :blk true;
-                    // anytype parameters should also be iterated directly (no .items)
-                    if (self.anytype_params.contains(var_name_inner)) break :blk true;
-                    // String variables are directly iterable
-                    if (self.getVarType(var_name_inner)) |vt| {
-                        if (vt == .string) break :blk true;
-                    }
-                }
-                break :blk false;
-            };
+            const is_direct_iterable = isDirectIterable(self, gen.iter.*);
 
             try self.emitIndent();
             if (is_direct_iterable) {
@@ -408,23 +400,11 @@ pub fn genDictComp(self: *NativeCodegen, dictcomp: ast.Node.DictComp) CodegenErr
     try self.emit(");\n");
 
     // Close all if conditions and for loops
-    for (dictcomp.generators) |gen| {
-        // Close if conditions for this generator
-        for (gen.ifs) |_| {
-            self.dedent();
-            try self.emitIndent();
-            try self.emit("}\n");
-        }
-
-        // Close for loop
-        self.dedent();
-        try self.emitIndent();
-        try self.emit("}\n");
-    }
+    try closeBlocksTo(self, loops_base_indent);
 
     // Generate: break :dict_N __dict_result;
     try self.emitIndent();
-    try self.emit(try std.fmt.allocPrint(self.allocator, "break :dict_{d} __dict_result;\n", .{label_id}));
+    try self.emitFmt("break :dict_{d} __dict_result;\n", .{label_id});
 
     self.dedent();
     try self.emitIndent();
@@ -444,7 +424,7 @@ pub fn genGenExp(self: *NativeCodegen, genexp: ast.Node.GenExp) CodegenError!voi
     self.block_label_counter += 1;
 
     // Generate: gen_N: { ... }
-    try self.emit(try std.fmt.allocPrint(self.allocator, "gen_{d}: {{\n", .{label_id}));
+    try self.emitFmt("gen_{d}: {{\n", .{label_id});
     self.indent();
 
     // Determine element type from the expression being yielded
@@ -454,6 +434,9 @@ pub fn genGenExp(self: *NativeCodegen, genexp: ast.Node.GenExp) CodegenError!voi
     try self.emitIndent();
     try self.output.writer(self.allocator).print("var __comp_result = std.ArrayList({s}){{}};\n", .{elem_type});
 
+    // Indent level the loops open from; closing braces unwind back to it
+    const loops_base_indent = self.indent_level;
+
     // Generate nested loops for each generator
     for (genexp.generators, 0..) |gen, gen_idx| {
         // Check if this is a range() call
@@ -499,24 +482,7 @@ pub fn genGenExp(self: *NativeCodegen, genexp: ast.Node.GenExp) CodegenError!voi
             try self.output.writer(self.allocator).print("defer {s} += {d};\n", .{ var_name, step_val });
         } else {
             // Regular iteration - check if source is constant array, ArrayList, or anytype param
-            const is_direct_iterable = blk: {
-                // String literals are directly iterable (they're Zig arrays)
-                if (gen.iter.* == .constant) {
-                    if (gen.iter.constant.value == .string) break :blk true;
-                }
-                if (gen.iter.* == .name) {
-                    const var_name_gen = gen.iter.name.id;
-                    // Const array variables can be iterated directly
-                    if (self.isArrayVar(var_name_gen)) break :blk true;
-                    // anytype parameters should also be iterated directly (no .items)
-                    if (self.anytype_params.contains(var_name_gen)) break :blk true;
-                    // String variables are directly iterable
-                    if (self.getVarType(var_name_gen)) |vt| {
-                        if (vt == .string) break :blk true;
-                    }
-                }
-                break :blk false;
-            };
+            const is_direct_iterable = isDirectIterable(self, gen.iter.*);
 
             try self.emitIndent();
             if (is_direct_iterable) {
@@ -582,29 +548,32 @@ pub fn genGenExp(self: *NativeCodegen, genexp: ast.Node.GenExp) CodegenError!voi
     try self.emit(");\n");
 
     // Close all if conditions and for loops
-    for (genexp.generators) |gen| {
-        // Close if conditions for this generator
-        for (gen.ifs) |_| {
-            self.dedent();
-            try self.emitIndent();
-            try self.emit("}\n");
-        }
-
-        // Close for loop
-        self.dedent();
-        try self.emitIndent();
-        try self.emit("}\n");
-    }
+    try closeBlocksTo(self, loops_base_indent);
 
     // Generate: break :gen_N __comp_result;
     try self.emitIndent();
-    try self.emit(try std.fmt.allocPrint(self.allocator, "break :gen_{d} __comp_result;\n", .{label_id}));
+    try self.emitFmt("break :gen_{d} __comp_result;\n", .{label_id});
 
     self.dedent();
     try self.emitIndent();
     try self.emit("}");
 }
 
+/// Built-in functions known to return an integer
+const IntReturningBuiltins = std.StaticStringMap(void).initComptime(.{
+    .{ "len", {} },
+    .{ "int", {} },
+    .{ "ord", {} },
+});
+
+/// Built-in functions known to return a bool
+const BoolReturningBuiltins = std.StaticStringMap(void).initComptime(.{
+    .{ "isinstance", {} },
+    .{ "callable", {} },
+    .{ "hasattr", {} },
+    .{ "bool", {} },
+});
+
 /// Check if an expression evaluates to an integer type
 fn isIntExpr(node: ast.Node) bool {
     return switch (node) {
@@ -614,10 +583,7 @@ fn isIntExpr(node: ast.Node) bool {
         .call => |c| {
             // len(), int(), etc return int
             if (c.func.* == .name) {
-                const name = c.func.name.id;
-                return std.mem.eql(u8, name, "len") or
-                    std.mem.eql(u8, name, "int") or
-                    std.mem.eql(u8, name, "ord");
+                return IntReturningBuiltins.has(c.func.name.id);
             }
             return false;
         },
@@ -635,11 +601,7 @@ fn isBoolExpr(node: ast.Node) bool {
         .call => |c| {
             // isinstance(), callable(), etc return bool
             if (c.func.* == .name) {
-                const name = c.func.name.id;
-                return std.mem.eql(u8, name, "isinstance") or
-                    std.mem.eql(u8, name, "callable") or
-                    std.mem.eql(u8, name, "hasattr") or
-                    std.mem.eql(u8, name, "bool");
+                return BoolReturningBuiltins.has(c.func.name.id);
             }
             return false;
         },
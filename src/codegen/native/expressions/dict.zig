@@ -84,15 +84,14 @@ pub fn genDict(self: *NativeCodegen, dict: ast.Node.Dict) CodegenError!void {
 
 /// Generate comptime-optimized dict literal
 fn genDictComptime(self: *NativeCodegen, dict: ast.Node.Dict, alloc_name: []const u8) CodegenError!void {
-    const label = try std.fmt.allocPrint(self.allocator, "dict_{d}", .{@intFromPtr(dict.keys.ptr)});
-    defer self.allocator.free(label);
+    const label_id = self.block_label_counter;
+    self.block_label_counter += 1;
 
     // Infer key type from first key
     const key_type = try self.type_inferrer.inferExpr(dict.keys[0]);
     const uses_int_keys = key_type == .int;
 
-    try self.emit(label);
-    try self.emit(": {\n");
+    try self.emitFmt("dict_{d}: {{\n", .{label_id});
     self.indent();
     try self.emitIndent();
 
@@ -126,6 +125,10 @@ fn genDictComptime(self: *NativeCodegen, dict: ast.Node.Dict, alloc_name: []cons
     try self.emit(alloc_name);
     try self.emit(");\n");
 
+    // Entry count is known - size the table once so the inserts never rehash
+    try self.emitIndent();
+    try self.emit("try _dict.ensureTotalCapacity(_kvs.len);\n");
+
     // Inline loop - unrolled at compile time
     try self.emitIndent();
     try self.emit("inline for (_kvs) |kv| {\n");
@@ -189,18 +192,16 @@ fn genDictComptime(self: *NativeCodegen, dict: ast.Node.Dict, alloc_name: []cons
     try self.emitIndent();
     if (uses_int_keys) {
         // Cast comptime_int key to i64 for AutoHashMap
-        try self.emit("try _dict.put(@as(i64, kv[0]), cast_val);\n");
+        try self.emit("_dict.putAssumeCapacity(@as(i64, kv[0]), cast_val);\n");
     } else {
-        try self.emit("try _dict.put(kv[0], cast_val);\n");
+        try self.emit("_dict.putAssumeCapacity(kv[0], cast_val);\n");
     }
     self.dedent();
     try self.emitIndent();
     try self.emit("}\n");
 
     try self.emitIndent();
-    try self.emit("break :");
-    try self.emit(label);
-    try self.emit(" _dict;\n");
+    try self.emitFmt("break :dict_{d} _dict;\n", .{label_id});
     self.dedent();
     try self.emitIndent();
     try self.emit("}");
@@ -233,11 +234,11 @@ fn genDictRuntime(self: *NativeCodegen, dict: ast.Node.Dict, alloc_name: []const
 
     // Infer value type - check if all values have same type
     var val_type: @import("../../../analysis/native_types.zig").NativeType = .unknown;
+    var all_same = true;
     if (dict.values.len > 0) {
         val_type = try getEntryValueType(self, dict.keys[0], dict.values[0]);
 
         // Check if all values have consistent type
-        var all_same = true;
         for (dict.keys[1..], dict.values[1..]) |key, value| {
             const this_type = try getEntryValueType(self, key, value);
             // Simple type equality check
@@ -269,18 +270,18 @@ fn genDictRuntime(self: *NativeCodegen, dict: ast.Node.Dict, alloc_name: []const
     // Track if we need to convert values to strings
     const need_str_conversion = val_type == .string;
 
-    // Check if we have mixed types (need memory management)
-    var has_mixed_types = false;
-    if (need_str_conversion and dict.values.len > 0) {
-        const first_type = try getEntryValueType(self, dict.keys[0], dict.values[0]);
-        for (dict.keys[1..], dict.values[1..]) |key, value| {
-            const this_type = try getEntryValueType(self, key, value);
-            if (@as(std.meta.Tag(@TypeOf(first_type)), first_type) != @as(std.meta.Tag(@TypeOf(this_type)), this_type)) {
-                has_mixed_types = true;
-                break;
-            }
-        }
+    // Mixed types were widened to string above (need memory management)
+    const has_mixed_types = !all_same;
+
+    // Size the table for the literal entries up front. Unpacked dicts (**other)
+    // add an unknown number of entries, so only skip capacity checks without them
+    var literal_entries: usize = 0;
+    for (dict.keys) |key| {
+        if (key != .constant or key.constant.value != .none) literal_entries += 1;
     }
+    const has_unpacking = literal_entries != dict.keys.len;
+    try self.emitIndent();
+    try self.emitFmt("try map.ensureTotalCapacity({d});\n", .{literal_entries});
 
     // Add all key-value pairs
     for (dict.keys, dict.values) |key, value| {
@@ -309,7 +310,7 @@ fn genDictRuntime(self: *NativeCodegen, dict: ast.Node.Dict, alloc_name: []const
         }
 
         try self.emitIndent();
-        try self.emit("try map.put(");
+        try self.emit(if (has_unpacking) "try map.put(" else "map.putAssumeCapacity(");
         try genExpr(self, key);
         try self.emit(", ");
 
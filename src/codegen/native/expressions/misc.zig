@@ -20,35 +20,21 @@ pub fn genTuple(self: *NativeCodegen, tuple: ast.Node.Tuple) CodegenError!void {
         return;
     }
 
-    // Generate as array literal for homogeneous tuples (allows inline for iteration)
-    // Check if all elements are the same type
+    // Generate as array literal for homogeneous string tuples (allows inline for iteration)
+    // Only string tuples get the array form, so skip inferring the rest when the first isn't one
     const first_type = self.type_inferrer.inferExpr(tuple.elts[0]) catch .unknown;
-    var all_same_type = true;
-    for (tuple.elts[1..]) |elem| {
+    const all_same_string = first_type == .string and for (tuple.elts[1..]) |elem| {
         const elem_type = self.type_inferrer.inferExpr(elem) catch .unknown;
-        if (!std.meta.eql(elem_type, first_type)) {
-            all_same_type = false;
-            break;
-        }
-    }
-
-    if (all_same_type and first_type == .string) {
-        // Homogeneous string tuple: generate as array for iteration
-        try self.emit("[_][]const u8{ ");
-        for (tuple.elts, 0..) |elem, i| {
-            if (i > 0) try self.emit(", ");
-            try genExpr(self, elem);
-        }
-        try self.emit(" }");
-    } else {
-        // Heterogeneous tuple: use anonymous tuple syntax
-        try self.emit(".{ ");
-        for (tuple.elts, 0..) |elem, i| {
-            if (i > 0) try self.emit(", ");
-            try genExpr(self, elem);
-        }
-        try self.emit(" }");
+        if (!std.meta.eql(elem_type, first_type)) break false;
+    } else true;
+
+    // Homogeneous string tuple: array for iteration; otherwise anonymous tuple syntax
+    try self.emit(if (all_same_string) "[_][]const u8{ " else ".{ ");
+    for (tuple.elts, 0..) |elem, i| {
+        if (i > 0) try self.emit(", ");
+        try genExpr(self, elem);
     }
+    try self.emit(" }");
 }
 
 /// Generate array/dict subscript with tuple support (a[b])
@@ -243,14 +229,11 @@ pub fn genAttribute(self: *NativeCodegen, attr: ast.Node.Attribute) CodegenError
         // Check if this is a class-level type attribute reference (e.g., int_class = self.int_class)
         // Type attributes are static functions, so we return a function pointer via @This()
         if (self.current_class_name) |class_name| {
-            const type_attr_key = std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class_name, attr.attr }) catch null;
-            if (type_attr_key) |key| {
-                if (self.class_type_attrs.get(key)) |_| {
-                    // Return a reference to the static function: @This().attr_name
-                    try self.emit("@This().");
-                    try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), attr.attr);
-                    return;
-                }
+            if (self.getClassTypeAttr(class_name, attr.attr)) |_| {
+                // Return a reference to the static function: @This().attr_name
+                try self.emit("@This().");
+                try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), attr.attr);
+                return;
             }
         }
     }
@@ -346,8 +329,7 @@ fn isDynamicAttribute(self: *NativeCodegen, attr: ast.Node.Attribute) !bool {
     }
 
     // Check if this is a class-level type attribute (e.g., int_class = int)
-    const type_attr_key = std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class_name, attr.attr }) catch return true;
-    if (self.class_type_attrs.get(type_attr_key)) |_| {
+    if (self.getClassTypeAttr(class_name, attr.attr)) |_| {
         return false; // Known type attribute (a method)
     }
 
@@ -43,22 +43,35 @@ fn genExprWrapped(self: *NativeCodegen, expr: ast.Node) CodegenError!void {
     }
 }
 
-/// Recursively collect all parts of a string concatenation chain
-fn collectConcatParts(self: *NativeCodegen, node: ast.Node, parts: *std.ArrayList(ast.Node)) CodegenError!void {
-    if (node == .binop and node.binop.op == .Add) {
-        const left_type = try self.inferExprScoped(node.binop.left.*);
-        const right_type = try self.inferExprScoped(node.binop.right.*);
-
-        // Only flatten if this is string concatenation
-        if (left_type == .string or right_type == .string) {
-            try collectConcatParts(self, node.binop.left.*, parts);
-            try collectConcatParts(self, node.binop.right.*, parts);
-            return;
+/// Collect all parts of a string concatenation chain
+/// Uses an explicit worklist: `a + b + ... + z` nests on the left, so recursion
+/// would cost one stack frame per operand.
+/// `binop` is the root the caller already classified as a string concat.
+fn collectConcatParts(self: *NativeCodegen, binop: ast.Node.BinOp, parts: *std.ArrayList(ast.Node)) CodegenError!void {
+    var stack = std.ArrayList(ast.Node){};
+    defer stack.deinit(self.allocator);
+    try stack.append(self.allocator, binop.right.*);
+    try stack.append(self.allocator, binop.left.*);
+
+    while (stack.pop()) |cur| {
+        if (cur == .binop and cur.binop.op == .Add) {
+            // Only flatten if this is string concatenation. Infer the right
+            // operand first: it is usually a leaf, and a string there means the
+            // deep left side never has to be inferred.
+            const is_string_concat = (try self.inferExprScoped(cur.binop.right.*)) == .string or
+                (try self.inferExprScoped(cur.binop.left.*)) == .string;
+
+            if (is_string_concat) {
+                // Push right first so the left operand is visited first
+                try stack.append(self.allocator, cur.binop.right.*);
+                try stack.append(self.allocator, cur.binop.left.*);
+                continue;
+            }
         }
-    }
 
-    // Base case: not a string concatenation binop, add to parts
-    try parts.append(self.allocator, node);
+        // Not a string concatenation binop, add to parts
+        try parts.append(self.allocator, cur);
+    }
 }
 
 const NativeType = @import("../../../analysis/native_types/core.zig").NativeType;
@@ -295,35 +308,32 @@ fn genBigIntBinOpRightBig(self: *NativeCodegen, binop: ast.Node.BinOp, left_type
 
 /// Generate binary operations (+, -, *, /, %, //)
 pub fn genBinOp(self: *NativeCodegen, binop: ast.Node.BinOp) CodegenError!void {
-    // Check for BigInt operations first
+    // Infer operand types once - every special case below dispatches on them
     // Use scope-aware type inference to prevent cross-function type pollution
-    const bigint_left_type = try self.inferExprScoped(binop.left.*);
-    const bigint_right_type = try self.inferExprScoped(binop.right.*);
+    const left_type = try self.inferExprScoped(binop.left.*);
+    const right_type = try self.inferExprScoped(binop.right.*);
 
+    // Check for BigInt operations first
     // If left operand is BigInt, use BigInt method calls
-    if (bigint_left_type == .bigint) {
-        try genBigIntBinOp(self, binop, bigint_left_type, bigint_right_type);
+    if (left_type == .bigint) {
+        try genBigIntBinOp(self, binop, left_type, right_type);
         return;
     }
 
     // If right operand is BigInt (e.g., 0 - bigint), convert left to BigInt and use BigInt ops
-    if (bigint_right_type == .bigint) {
-        try genBigIntBinOpRightBig(self, binop, bigint_left_type, bigint_right_type);
+    if (right_type == .bigint) {
+        try genBigIntBinOpRightBig(self, binop, left_type, right_type);
         return;
     }
 
     // Check if this is string concatenation
     if (binop.op == .Add) {
-        // Use scope-aware type inference to prevent cross-function type pollution
-        const left_type = try self.inferExprScoped(binop.left.*);
-        const right_type = try self.inferExprScoped(binop.right.*);
-
         if (left_type == .string or right_type == .string) {
             // Flatten nested concatenations to avoid intermediate allocations
             var parts = std.ArrayList(ast.Node){};
             defer parts.deinit(self.allocator);
 
-            try collectConcatParts(self, ast.Node{ .binop = binop }, &parts);
+            try collectConcatParts(self, binop, &parts);
 
             // Get allocator name based on scope
             const alloc_name = if (self.symbol_table.currentScopeLevel() > 0) "__global_allocator" else "allocator";
@@ -357,9 +367,6 @@ pub fn genBinOp(self: *NativeCodegen, binop: ast.Node.BinOp) CodegenError!void {
 
     // Check if this is string multiplication (str * n or n * str)
     if (binop.op == .Mult) {
-        const left_type = try self.inferExprScoped(binop.left.*);
-        const right_type = try self.inferExprScoped(binop.right.*);
-
         // str * n -> repeat string n times
         if (left_type == .string and (right_type == .int or right_type == .unknown)) {
             const alloc_name = if (self.symbol_table.currentScopeLevel() > 0) "__global_allocator" else "allocator";
@@ -404,7 +411,6 @@ pub fn genBinOp(self: *NativeCodegen, binop: ast.Node.BinOp) CodegenError!void {
     // Special handling for modulo / string formatting
     if (binop.op == .Mod) {
         // Check if this is Python string formatting: "%d" % value
-        const left_type = try self.inferExprScoped(binop.left.*);
         if (left_type == .string or (binop.left.* == .constant and binop.left.constant.value == .string)) {
             // Python string formatting: "format" % value(s)
             try genStringFormat(self, binop);
@@ -460,7 +466,6 @@ pub fn genBinOp(self: *NativeCodegen, binop: ast.Node.BinOp) CodegenError!void {
     // Special handling for division - can throw ZeroDivisionError
     if (binop.op == .Div) {
         // Check if this is Path / string (path join)
-        const left_type = try self.inferExprScoped(binop.left.*);
         if (left_type == .path) {
             // Path / "component" -> Path.join("component")
             try genExpr(self, binop.left.*);
@@ -529,9 +534,6 @@ pub fn genBinOp(self: *NativeCodegen, binop: ast.Node.BinOp) CodegenError!void {
 
     // Matrix multiplication (@) - call __matmul__ or __rmatmul__ method on object
     if (binop.op == .MatMul) {
-        const left_type = try self.inferExprScoped(binop.left.*);
-        const right_type = try self.inferExprScoped(binop.right.*);
-
         if (left_type == .class_instance or left_type == .unknown) {
             // Left is a class, call __matmul__: try left.__matmul__(allocator, right)
             try self.emit("try ");
@@ -581,9 +583,6 @@ pub fn genBinOp(self: *NativeCodegen, binop: ast.Node.BinOp) CodegenError!void {
     }
 
     // Check for type mismatches between usize and i64
-    const left_type = try self.inferExprScoped(binop.left.*);
-    const right_type = try self.inferExprScoped(binop.right.*);
-
     const left_is_usize = (left_type == .usize);
     const left_is_int = (left_type == .int);
     const right_is_usize = (right_type == .usize);
@@ -948,12 +947,10 @@ pub fn genCompare(self: *NativeCodegen, compare: ast.Node.Compare) CodegenError!
                         break :blk true;
                     }
                     // Also check if it's a method parameter with optional type
-                    // (function_signatures tracks methods with defaults)
+                    // (class_method_signatures tracks methods with defaults)
                     if (self.current_class_name) |class_name| {
                         if (self.current_function_name) |func_name| {
-                            var key_buf: [512]u8 = undefined;
-                            const key = std.fmt.bufPrint(&key_buf, "{s}.{s}", .{ class_name, func_name }) catch "";
-                            if (self.function_signatures.get(key)) |_| {
+                            if (self.getMethodSignature(class_name, func_name)) |_| {
                                 // This method has optional params - assume the variable could be optional
                                 break :blk true;
                             }
@@ -52,7 +52,7 @@ fn isSingleCharString(node: ast.Node) bool {
 /// If in_slice_context is true and we have __s available, convert negatives to __s.items.len - abs(index) for lists
 /// Note: This assumes __s is available in the current scope (from the enclosing blk: { const __s = ... })
 /// For lists, __s.items.len is used; for strings/arrays, __s.len is used
-pub fn genSliceIndex(self: *NativeCodegen, node: ast.Node, in_slice_context: bool, is_list: bool) CodegenError!void {
+pub fn genSliceIndex(self: *NativeCodegen, node: ast.Node, comptime in_slice_context: bool, is_list: bool) CodegenError!void {
     if (!in_slice_context) {
         try genExpr(self, node);
         return;
@@ -86,9 +86,9 @@ pub fn genSubscript(self: *NativeCodegen, subscript: ast.Node.Subscript) Codegen
         // Wrap the entire subscript in a block with unique label
         const label_id = self.block_label_counter;
         self.block_label_counter += 1;
-        try self.emit(try std.fmt.allocPrint(self.allocator, "sub_{d}: {{ const __base = ", .{label_id}));
+        try self.emitFmt("sub_{d}: {{ const __base = ", .{label_id});
         try genExpr(self, subscript.value.*);
-        try self.emit(try std.fmt.allocPrint(self.allocator, "; break :sub_{d} ", .{label_id}));
+        try self.emitFmt("; break :sub_{d} ", .{label_id});
 
         switch (subscript.slice) {
             .index => {
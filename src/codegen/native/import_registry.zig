@@ -68,6 +68,7 @@ pub const ImportInfo = struct {
 
 pub const ImportRegistry = struct {
     allocator: std.mem.Allocator,
+    /// Modules registered at runtime, consulted before the built-in table
     registry: hashmap_helper.StringHashMap(ImportInfo),
 
     pub fn init(allocator: std.mem.Allocator) ImportRegistry {
@@ -123,7 +124,7 @@ pub const ImportRegistry = struct {
 
     /// Look up how to import a Python module
     pub fn lookup(self: *ImportRegistry, python_module: []const u8) ?ImportInfo {
-        return self.registry.get(python_module);
+        return self.registry.get(python_module) orelse BuiltinImports.get(python_module);
     }
 
     /// Get Zig import statement for a Python module
@@ -213,118 +214,149 @@ const ZlibFuncMeta = std.StaticStringMap(FunctionMeta).initComptime(.{
 // Registry initialization
 // ============================================================================
 
-/// Initialize registry with built-in Python→Zig mappings
-pub fn createDefaultRegistry(allocator: std.mem.Allocator) !ImportRegistry {
-    var registry = ImportRegistry.init(allocator);
+const BuiltinEntry = struct { []const u8, ImportInfo };
+
+fn builtin(
+    comptime python_module: []const u8,
+    comptime strategy: ImportStrategy,
+    comptime zig_import: ?[]const u8,
+    comptime c_library: ?[]const u8,
+) BuiltinEntry {
+    return builtinWithMeta(python_module, strategy, zig_import, c_library, false, null);
+}
+
+fn builtinWithMeta(
+    comptime python_module: []const u8,
+    comptime strategy: ImportStrategy,
+    comptime zig_import: ?[]const u8,
+    comptime c_library: ?[]const u8,
+    comptime needs_init: bool,
+    comptime func_meta: ?*const std.StaticStringMap(FunctionMeta),
+) BuiltinEntry {
+    return .{ python_module, ImportInfo{
+        .python_module = python_module,
+        .strategy = strategy,
+        .zig_import = zig_import,
+        .c_library = c_library,
+        .python_source = null,
+        .needs_init = needs_init,
+        .func_meta = func_meta,
+    } };
+}
 
+/// Built-in Python→Zig mappings, fixed at compile time
+const BuiltinImports = std.StaticStringMap(ImportInfo).initComptime(.{
     // Tier 1: Zig implementations (performance-critical)
     // Note: runtime is imported as @import("./runtime.zig") at module level
-    try registry.register("json", .zig_runtime, "runtime.json", null);
-    try registry.register("http", .zig_runtime, "runtime.http", null);
-    try registry.register("asyncio", .zig_runtime, "runtime.async", null);
-    try registry.registerWithMeta("re", .zig_runtime, "runtime.re", null, false, &ReFuncMeta);
-    try registry.registerWithMeta("sys", .zig_runtime, "runtime.sys", null, false, &SysFuncMeta);
-    try registry.registerWithMeta("time", .zig_runtime, "runtime.time", null, false, &TimeFuncMeta);
-    try registry.registerWithMeta("math", .zig_runtime, "runtime.math", null, false, &MathFuncMeta);
-    try registry.register("unittest", .zig_runtime, "runtime.unittest", null);
-    try registry.register("flask", .zig_runtime, "runtime.flask", null);
+    builtin("json", .zig_runtime, "runtime.json", null),
+    builtin("http", .zig_runtime, "runtime.http", null),
+    builtin("asyncio", .zig_runtime, "runtime.async", null),
+    builtinWithMeta("re", .zig_runtime, "runtime.re", null, false, &ReFuncMeta),
+    builtinWithMeta("sys", .zig_runtime, "runtime.sys", null, false, &SysFuncMeta),
+    builtinWithMeta("time", .zig_runtime, "runtime.time", null, false, &TimeFuncMeta),
+    builtinWithMeta("math", .zig_runtime, "runtime.math", null, false, &MathFuncMeta),
+    builtin("unittest", .zig_runtime, "runtime.unittest", null),
+    builtin("flask", .zig_runtime, "runtime.flask", null),
     // requests: needs_init=true, has function metadata
-    try registry.registerWithMeta("requests", .zig_runtime, "runtime.requests", null, true, &RequestsFuncMeta);
+    builtinWithMeta("requests", .zig_runtime, "runtime.requests", null, true, &RequestsFuncMeta),
 
     // Tier 2: C library wrappers
-    try registry.registerWithMeta("numpy", .c_library, "@import(\"./c_interop/c_interop.zig\").numpy", "blas", false, &NumpyFuncMeta);
-    try registry.registerWithMeta("sqlite3", .c_library, "@import(\"./c_interop/c_interop.zig\").sqlite3", "sqlite3", false, &Sqlite3FuncMeta);
-    try registry.registerWithMeta("zlib", .c_library, "@import(\"./c_interop/c_interop.zig\").zlib", "z", false, &ZlibFuncMeta);
-    try registry.register("ssl", .c_library, "@import(\"./c_interop/c_interop.zig\").ssl", "ssl");
-    try registry.register("hashlib", .zig_runtime, "runtime.hashlib", null); // Uses Zig std.crypto
-    try registry.register("io", .zig_runtime, "runtime.io", null); // io.StringIO, io.BytesIO
-    try registry.register("struct", .zig_runtime, "std", null); // struct module is inline codegen
-    try registry.register("base64", .zig_runtime, "std", null); // base64 uses std.base64
-    try registry.register("pickle", .zig_runtime, "runtime.pickle", null);
-    try registry.register("hmac", .zig_runtime, "std", null); // hmac uses std.crypto.auth.hmac
-    try registry.register("socket", .zig_runtime, "std", null); // socket uses std.posix
-    try registry.register("os", .zig_runtime, "std", null); // os uses std.fs and std.process
-    try registry.register("random", .zig_runtime, null, null); // random module (inline codegen only)
-    try registry.register("collections", .zig_runtime, null, null); // collections module (inline codegen only)
-    try registry.register("collections.abc", .zig_runtime, null, null); // collections.abc module (inline codegen only)
-    try registry.register("functools", .zig_runtime, "std", null); // functools module
-    try registry.register("itertools", .zig_runtime, null, null); // itertools module (inline codegen only)
-    try registry.register("logging", .zig_runtime, "std", null); // logging module
-    try registry.register("threading", .zig_runtime, "std", null); // threading module
-    try registry.register("queue", .zig_runtime, "std", null); // queue module
-    try registry.register("copy", .zig_runtime, "std", null); // copy module
-    try registry.register("operator", .zig_runtime, null, null); // operator module (inline codegen only)
-    try registry.register("typing", .zig_runtime, "std", null); // typing module (no-ops)
-    try registry.register("contextlib", .zig_runtime, "std", null); // contextlib module
-    try registry.register("string", .zig_runtime, "std", null); // string module
-    try registry.register("shutil", .zig_runtime, "std", null); // shutil module
-    try registry.register("glob", .zig_runtime, "std", null); // glob module
-    try registry.register("fnmatch", .zig_runtime, "std", null); // fnmatch module
-    try registry.register("secrets", .zig_runtime, "std", null); // secrets module
-    try registry.register("csv", .zig_runtime, "std", null); // csv module
-    try registry.register("configparser", .zig_runtime, "std", null); // configparser module
-    try registry.register("argparse", .zig_runtime, "std", null); // argparse module
-    try registry.register("zipfile", .zig_runtime, "std", null); // zipfile module
-    try registry.register("gzip", .zig_runtime, "std", "z"); // gzip module (uses zlib)
-    try registry.register("textwrap", .zig_runtime, "std", null); // textwrap module
-    try registry.register("uuid", .zig_runtime, "std", null); // uuid module
-    try registry.register("tempfile", .zig_runtime, "std", null); // tempfile module
-    try registry.register("subprocess", .zig_runtime, "std", null); // subprocess module
-    try registry.register("heapq", .zig_runtime, "std", null); // heapq module
-    try registry.register("bisect", .zig_runtime, "std", null); // bisect module
-    try registry.register("statistics", .zig_runtime, "std", null); // statistics module
-    try registry.register("decimal", .zig_runtime, "std", null); // decimal module
-    try registry.register("fractions", .zig_runtime, "std", null); // fractions module
-    try registry.register("cmath", .zig_runtime, "std", null); // cmath module
-    try registry.register("html", .zig_runtime, "std", null); // html module
-    try registry.register("xml", .zig_runtime, "std", null); // xml module
-    try registry.register("email", .zig_runtime, "std", null); // email module
-    try registry.register("signal", .zig_runtime, "std", null); // signal module
-    try registry.register("multiprocessing", .zig_runtime, "std", null); // multiprocessing module
-    try registry.register("operator", .zig_runtime, "std", null); // operator module
-    try registry.register("array", .zig_runtime, null, null); // array module - inline only
-    try registry.register("weakref", .zig_runtime, "std", null); // weakref module
-    try registry.register("types", .zig_runtime, "std", null); // types module
-    try registry.register("abc", .zig_runtime, "std", null); // abc module
-    try registry.register("inspect", .zig_runtime, "std", null); // inspect module
-    try registry.register("dataclasses", .zig_runtime, "std", null); // dataclasses module
-    try registry.register("enum", .zig_runtime, "std", null); // enum module
-    try registry.register("atexit", .zig_runtime, "std", null); // atexit module
-    try registry.register("warnings", .zig_runtime, "std", null); // warnings module
-    try registry.register("traceback", .zig_runtime, "std", null); // traceback module
-    try registry.register("pprint", .zig_runtime, "std", null); // pprint module
-    try registry.register("platform", .zig_runtime, "std", null); // platform module
-    try registry.register("locale", .zig_runtime, "std", null); // locale module
-    try registry.register("codecs", .zig_runtime, "std", null); // codecs module
-    try registry.register("calendar", .zig_runtime, "std", null); // calendar module
-    try registry.register("binascii", .zig_runtime, "std", null); // binascii module
-    try registry.register("errno", .zig_runtime, "std", null); // errno module
-    try registry.register("gc", .zig_runtime, "std", null); // gc module
-    try registry.register("select", .zig_runtime, "std", null); // select module
-    try registry.register("mmap", .zig_runtime, "std", null); // mmap module
-    try registry.register("fcntl", .zig_runtime, "std", null); // fcntl module
+    builtinWithMeta("numpy", .c_library, "@import(\"./c_interop/c_interop.zig\").numpy", "blas", false, &NumpyFuncMeta),
+    builtinWithMeta("sqlite3", .c_library, "@import(\"./c_interop/c_interop.zig\").sqlite3", "sqlite3", false, &Sqlite3FuncMeta),
+    builtinWithMeta("zlib", .c_library, "@import(\"./c_interop/c_interop.zig\").zlib", "z", false, &ZlibFuncMeta),
+    builtin("ssl", .c_library, "@import(\"./c_interop/c_interop.zig\").ssl", "ssl"),
+    builtin("hashlib", .zig_runtime, "runtime.hashlib", null), // Uses Zig std.crypto
+    builtin("io", .zig_runtime, "runtime.io", null), // io.StringIO, io.BytesIO
+    builtin("struct", .zig_runtime, "std", null), // struct module is inline codegen
+    builtin("base64", .zig_runtime, "std", null), // base64 uses std.base64
+    builtin("pickle", .zig_runtime, "runtime.pickle", null),
+    builtin("hmac", .zig_runtime, "std", null), // hmac uses std.crypto.auth.hmac
+    builtin("socket", .zig_runtime, "std", null), // socket uses std.posix
+    builtin("os", .zig_runtime, "std", null), // os uses std.fs and std.process
+    builtin("random", .zig_runtime, null, null), // random module (inline codegen only)
+    builtin("collections", .zig_runtime, null, null), // collections module (inline codegen only)
+    builtin("collections.abc", .zig_runtime, null, null), // collections.abc module (inline codegen only)
+    builtin("functools", .zig_runtime, "std", null), // functools module
+    builtin("itertools", .zig_runtime, null, null), // itertools module (inline codegen only)
+    builtin("logging", .zig_runtime, "std", null), // logging module
+    builtin("threading", .zig_runtime, "std", null), // threading module
+    builtin("queue", .zig_runtime, "std", null), // queue module
+    builtin("copy", .zig_runtime, "std", null), // copy module
+    builtin("typing", .zig_runtime, "std", null), // typing module (no-ops)
+    builtin("contextlib", .zig_runtime, "std", null), // contextlib module
+    builtin("string", .zig_runtime, "std", null), // string module
+    builtin("shutil", .zig_runtime, "std", null), // shutil module
+    builtin("glob", .zig_runtime, "std", null), // glob module
+    builtin("fnmatch", .zig_runtime, "std", null), // fnmatch module
+    builtin("secrets", .zig_runtime, "std", null), // secrets module
+    builtin("csv", .zig_runtime, "std", null), // csv module
+    builtin("configparser", .zig_runtime, "std", null), // configparser module
+    builtin("argparse", .zig_runtime, "std", null), // argparse module
+    builtin("zipfile", .zig_runtime, "std", null), // zipfile module
+    builtin("gzip", .zig_runtime, "std", "z"), // gzip module (uses zlib)
+    builtin("textwrap", .zig_runtime, "std", null), // textwrap module
+    builtin("uuid", .zig_runtime, "std", null), // uuid module
+    builtin("tempfile", .zig_runtime, "std", null), // tempfile module
+    builtin("subprocess", .zig_runtime, "std", null), // subprocess module
+    builtin("heapq", .zig_runtime, "std", null), // heapq module
+    builtin("bisect", .zig_runtime, "std", null), // bisect module
+    builtin("statistics", .zig_runtime, "std", null), // statistics module
+    builtin("decimal", .zig_runtime, "std", null), // decimal module
+    builtin("fractions", .zig_runtime, "std", null), // fractions module
+    builtin("cmath", .zig_runtime, "std", null), // cmath module
+    builtin("html", .zig_runtime, "std", null), // html module
+    builtin("xml", .zig_runtime, "std", null), // xml module
+    builtin("email", .zig_runtime, "std", null), // email module
+    builtin("signal", .zig_runtime, "std", null), // signal module
+    builtin("multiprocessing", .zig_runtime, "std", null), // multiprocessing module
+    builtin("operator", .zig_runtime, "std", null), // operator module
+    builtin("array", .zig_runtime, null, null), // array module - inline only
+    builtin("weakref", .zig_runtime, "std", null), // weakref module
+    builtin("types", .zig_runtime, "std", null), // types module
+    builtin("abc", .zig_runtime, "std", null), // abc module
+    builtin("inspect", .zig_runtime, "std", null), // inspect module
+    builtin("dataclasses", .zig_runtime, "std", null), // dataclasses module
+    builtin("enum", .zig_runtime, "std", null), // enum module
+    builtin("atexit", .zig_runtime, "std", null), // atexit module
+    builtin("warnings", .zig_runtime, "std", null), // warnings module
+    builtin("traceback", .zig_runtime, "std", null), // traceback module
+    builtin("pprint", .zig_runtime, "std", null), // pprint module
+    builtin("platform", .zig_runtime, "std", null), // platform module
+    builtin("locale", .zig_runtime, "std", null), // locale module
+    builtin("codecs", .zig_runtime, "std", null), // codecs module
+    builtin("calendar", .zig_runtime, "std", null), // calendar module
+    builtin("binascii", .zig_runtime, "std", null), // binascii module
+    builtin("errno", .zig_runtime, "std", null), // errno module
+    builtin("gc", .zig_runtime, "std", null), // gc module
+    builtin("select", .zig_runtime, "std", null), // select module
+    builtin("mmap", .zig_runtime, "std", null), // mmap module
+    builtin("fcntl", .zig_runtime, "std", null), // fcntl module
 
     // Additional Tier 1: OS and filesystem modules
-    try registry.register("pathlib", .zig_runtime, "runtime.pathlib", null);
+    builtin("pathlib", .zig_runtime, "runtime.pathlib", null),
 
     // Tier 3: Mark as compile_python (will be handled later)
-    try registry.register("urllib", .compile_python, null, null);
-    try registry.register("datetime", .zig_runtime, "runtime.datetime", null); // datetime uses runtime.datetime
+    builtin("urllib", .compile_python, null, null),
+    builtin("datetime", .zig_runtime, "runtime.datetime", null), // datetime uses runtime.datetime
 
     // Dynamic features (unsupported - require runtime)
-    try registry.register("importlib", .unsupported, null, null);
+    builtin("importlib", .unsupported, null, null),
 
     // Test support modules (for CPython unittest compatibility)
-    try registry.register("test", .zig_runtime, "runtime.test_support", null);
-    try registry.register("test.support", .zig_runtime, "runtime.test_support", null);
-    try registry.register("test.support.os_helper", .zig_runtime, "runtime.test_support.os_helper", null);
-    try registry.register("test.support.import_helper", .zig_runtime, "runtime.test_support.import_helper", null);
-    try registry.register("test.support.warnings_helper", .zig_runtime, "runtime.test_support.warnings_helper", null);
-    try registry.register("test.support.threading_helper", .zig_runtime, "runtime.test_support.threading_helper", null);
-    try registry.register("test.support.socket_helper", .zig_runtime, "runtime.test_support.socket_helper", null);
-    try registry.register("test.support.script_helper", .zig_runtime, "runtime.test_support.script_helper", null);
-    try registry.register("test.support.hashlib_helper", .zig_runtime, "runtime.test_support.hashlib_helper", null);
-    try registry.register("test.support.numbers", .zig_runtime, "runtime.test_support.numbers", null);
-
-    return registry;
+    builtin("test", .zig_runtime, "runtime.test_support", null),
+    builtin("test.support", .zig_runtime, "runtime.test_support", null),
+    builtin("test.support.os_helper", .zig_runtime, "runtime.test_support.os_helper", null),
+    builtin("test.support.import_helper", .zig_runtime, "runtime.test_support.import_helper", null),
+    builtin("test.support.warnings_helper", .zig_runtime, "runtime.test_support.warnings_helper", null),
+    builtin("test.support.threading_helper", .zig_runtime, "runtime.test_support.threading_helper", null),
+    builtin("test.support.socket_helper", .zig_runtime, "runtime.test_support.socket_helper", null),
+    builtin("test.support.script_helper", .zig_runtime, "runtime.test_support.script_helper", null),
+    builtin("test.support.hashlib_helper", .zig_runtime, "runtime.test_support.hashlib_helper", null),
+    builtin("test.support.numbers", .zig_runtime, "runtime.test_support.numbers", null),
+});
+
+/// Initialize registry with built-in Python→Zig mappings
+/// The built-ins are a comptime table, so this only sets up the runtime overlay
+pub fn createDefaultRegistry(allocator: std.mem.Allocator) !ImportRegistry {
+    return ImportRegistry.init(allocator);
 }
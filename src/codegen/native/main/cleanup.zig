@@ -98,6 +98,12 @@ pub fn deinit(self: *NativeCodegen) void {
     freeMapKeys(self.allocator, &self.function_signatures);
     self.function_signatures.deinit();
 
+    // Clean up class_method_signatures tracking (keys are AST refs)
+    for (self.class_method_signatures.values()) |*sigs| {
+        sigs.deinit();
+    }
+    self.class_method_signatures.deinit();
+
     // Clean up global_vars tracking
     freeMapKeys(self.allocator, &self.global_vars);
     self.global_vars.deinit();
@@ -150,6 +156,12 @@ pub fn deinit(self: *NativeCodegen) void {
     // Clean up nested_class_bases tracking (keys/values are AST refs)
     self.nested_class_bases.deinit();
 
+    // Clean up class_type_attrs tracking (keys/values are AST refs)
+    for (self.class_type_attrs.values()) |*attrs| {
+        attrs.deinit();
+    }
+    self.class_type_attrs.deinit();
+
     // Clean up comptime_evals tracking
     freeMapKeys(self.allocator, &self.comptime_evals);
     self.comptime_evals.deinit();
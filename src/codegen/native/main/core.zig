@@ -17,6 +17,7 @@ const cleanup = @import("cleanup.zig");
 const hashmap_helper = @import("hashmap_helper");
 const FnvVoidMap = hashmap_helper.StringHashMap(void);
 const FnvStringMap = hashmap_helper.StringHashMap([]const u8);
+const FnvClassAttrMap = hashmap_helper.StringHashMap(FnvStringMap);
 const FnvFuncDefMap = hashmap_helper.StringHashMap(ast.Node.FunctionDef);
 
 // Function signature info for default parameter handling
@@ -25,6 +26,7 @@ const FuncSignature = struct {
     required_params: usize, // params without defaults
 };
 const FnvFuncSigMap = hashmap_helper.StringHashMap(FuncSignature);
+const FnvClassSigMap = hashmap_helper.StringHashMap(FnvFuncSigMap);
 
 /// Info about a single test method
 pub const TestMethodInfo = struct {
@@ -69,6 +71,17 @@ pub const FromImportInfo = struct {
     asnames: []?[]const u8,
 };
 
+/// Zig string-literal escape sequence for each byte (null = emit byte as-is)
+const zig_string_escapes = blk: {
+    var table = [_]?[]const u8{null} ** 256;
+    table['"'] = "\\\"";
+    table['\\'] = "\\\\";
+    table['\n'] = "\\n";
+    table['\r'] = "\\r";
+    table['\t'] = "\\t";
+    break :blk table;
+};
+
 pub const NativeCodegen = struct {
     allocator: std.mem.Allocator,
     output: std.ArrayList(u8),
@@ -202,6 +215,10 @@ pub const NativeCodegen = struct {
     // Maps function name -> FuncSignature (e.g., "foo" -> {total: 2, required: 1})
     function_signatures: FnvFuncSigMap,
 
+    // Track method signatures with default params, keyed like class_type_attrs:
+    // class name -> method name -> FuncSignature (names are AST refs, not copied)
+    class_method_signatures: FnvClassSigMap,
+
     // Track imported module names (for mymath.add() -> needs allocator)
     // Maps module name -> void (e.g., "mymath" -> {})
     imported_modules: FnvVoidMap,
@@ -262,8 +279,9 @@ pub const NativeCodegen = struct {
     nested_class_bases: FnvStringMap,
 
     // Track class-level type attributes (e.g., int_class = int)
-    // Maps "ClassName.attr_name" -> type_name (e.g., "IntStrDigitLimitsTests.int_class" -> "int")
-    class_type_attrs: FnvStringMap,
+    // Maps class name -> attr_name -> type_name (e.g., IntStrDigitLimitsTests -> int_class -> "int"),
+    // so lookups are two hash probes with no "Class.attr" key to format
+    class_type_attrs: FnvClassAttrMap,
 
     // Current class being generated (for super() support)
     // Set during class method generation, null otherwise
@@ -378,6 +396,7 @@ pub const NativeCodegen = struct {
             .kwarg_functions = FnvVoidMap.init(allocator),
             .kwarg_params = FnvVoidMap.init(allocator),
             .function_signatures = FnvFuncSigMap.init(allocator),
+            .class_method_signatures = FnvClassSigMap.init(allocator),
             .imported_modules = FnvVoidMap.init(allocator),
             .mutation_info = null,
             .in_assert_raises_context = false,
@@ -392,7 +411,7 @@ pub const NativeCodegen = struct {
             .nested_class_names = FnvVoidMap.init(allocator),
             .bigint_vars = FnvVoidMap.init(allocator),
             .nested_class_bases = FnvStringMap.init(allocator),
-            .class_type_attrs = FnvStringMap.init(allocator),
+            .class_type_attrs = FnvClassAttrMap.init(allocator),
             .current_class_name = null,
             .current_class_captures = null,
             .inside_init_method = false,
@@ -541,11 +560,23 @@ pub const NativeCodegen = struct {
         try self.output.writer(self.allocator).print(fmt, args);
     }
 
-    pub fn emitIndent(self: *NativeCodegen) CodegenError!void {
-        var i: usize = 0;
-        while (i < self.indent_level) : (i += 1) {
-            try self.emit("    ");
+    /// Emit string contents escaped for a Zig string literal (quotes not included)
+    /// Runs of bytes that need no escaping are appended as whole slices
+    pub fn emitEscapedString(self: *NativeCodegen, s: []const u8) CodegenError!void {
+        var start: usize = 0;
+        for (s, 0..) |c, i| {
+            if (zig_string_escapes[c]) |escaped| {
+                try self.emit(s[start..i]);
+                try self.emit(escaped);
+                start = i + 1;
+            }
         }
+        try self.emit(s[start..]);
+    }
+
+    /// Emit the current indentation as one fill (4 spaces per level)
+    pub fn emitIndent(self: *NativeCodegen) CodegenError!void {
+        try self.output.appendNTimes(self.allocator, ' ', self.indent_level * 4);
     }
 
     pub fn indent(self: *NativeCodegen) void {
@@ -564,6 +595,12 @@ pub const NativeCodegen = struct {
         return buf.toOwnedSlice(self.allocator);
     }
 
+    /// Emit the Zig type for a NativeType straight into the output
+    /// Avoids the temporary string nativeTypeToZigType allocates (and the caller frees)
+    pub fn emitZigType(self: *NativeCodegen, native_type: NativeType) !void {
+        try native_type.toZigType(self.allocator, &self.output);
+    }
+
     /// Get the inferred type of a variable from type inference
     /// Checks local scope first (to avoid type shadowing from other methods),
     /// then falls back to global type inference.
@@ -682,6 +719,32 @@ pub const NativeCodegen = struct {
         return self.class_registry.findMethod(class_name, method_name);
     }
 
+    /// Get a class-level type attribute's type name (e.g., int_class = int -> "int")
+    pub fn getClassTypeAttr(self: *NativeCodegen, class_name: []const u8, attr_name: []const u8) ?[]const u8 {
+        const attrs = self.class_type_attrs.get(class_name) orelse return null;
+        return attrs.get(attr_name);
+    }
+
+    /// Register a class-level type attribute (names are AST refs, not copied)
+    pub fn putClassTypeAttr(self: *NativeCodegen, class_name: []const u8, attr_name: []const u8, type_name: []const u8) !void {
+        const attrs = try self.class_type_attrs.getOrPut(class_name);
+        if (!attrs.found_existing) attrs.value_ptr.* = FnvStringMap.init(self.allocator);
+        try attrs.value_ptr.put(attr_name, type_name);
+    }
+
+    /// Get a method's param counts (only recorded for methods with default params)
+    pub fn getMethodSignature(self: *NativeCodegen, class_name: []const u8, method_name: []const u8) ?FuncSignature {
+        const sigs = self.class_method_signatures.get(class_name) orelse return null;
+        return sigs.get(method_name);
+    }
+
+    /// Register a method's param counts (names are AST refs, not copied)
+    pub fn putMethodSignature(self: *NativeCodegen, class_name: []const u8, method_name: []const u8, sig: FuncSignature) !void {
+        const sigs = try self.class_method_signatures.getOrPut(class_name);
+        if (!sigs.found_existing) sigs.value_ptr.* = FnvFuncSigMap.init(self.allocator);
+        try sigs.value_ptr.put(method_name, sig);
+    }
+
     /// Get the parent class name for a given class (for super() support)
     pub fn getParentClassName(self: *NativeCodegen, class_name: []const u8) ?[]const u8 {
         return self.class_registry.inheritance.get(class_name);
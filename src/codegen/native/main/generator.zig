@@ -90,21 +90,22 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
         try imported_roots.put(root_mod_name, {});
     }
 
-    // PHASE 2: Register all classes for inheritance support
+    // PHASE 2: One pass over the top-level statements to
+    // - register all classes for inheritance support
+    // - register async functions for comptime optimization analysis
+    // - detect optional import patterns (try: import X except: X = None); this
+    //   MUST happen before class/function generation so methods using X can be skipped
     for (module.body) |stmt| {
-        if (stmt == .class_def) {
-            try self.class_registry.registerClass(stmt.class_def.name, stmt.class_def);
-        }
-    }
-
-    // PHASE 2.1: Register async functions for comptime optimization analysis
-    for (module.body) |stmt| {
-        if (stmt == .function_def) {
-            const func = stmt.function_def;
-            if (func.is_async) {
-                const func_name_copy = try self.allocator.dupe(u8, func.name);
-                try self.async_function_defs.put(func_name_copy, func);
-            }
+        switch (stmt) {
+            .class_def => |class| try self.class_registry.registerClass(class.name, class),
+            .function_def => |func| {
+                if (func.is_async) {
+                    const func_name_copy = try self.allocator.dupe(u8, func.name);
+                    try self.async_function_defs.put(func_name_copy, func);
+                }
+            },
+            .try_stmt => |try_node| try markOptionalImport(self, try_node),
+            else => {},
         }
     }
 
@@ -217,35 +218,6 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
     // PHASE 3.6: Generate from-import symbol re-exports
     try from_imports_gen.generateFromImports(self);
 
-    // PHASE 3.8: Pre-pass to detect optional import patterns (try: import X except: X = None)
-    // This MUST happen before class/function generation so methods using X can be skipped
-    for (module.body) |stmt| {
-        if (stmt == .try_stmt) {
-            // Check if this is an optional import pattern
-            const try_node = stmt.try_stmt;
-            if (try_node.body.len == 1 and try_node.body[0] == .import_stmt) {
-                const mod_name = try_node.body[0].import_stmt.module;
-                // Check if module is not in registry (unavailable)
-                if (self.import_registry.lookup(mod_name) == null) {
-                    // Check if except handler assigns to None
-                    for (try_node.handlers) |handler| {
-                        for (handler.body) |h_stmt| {
-                            if (h_stmt == .assign and h_stmt.assign.targets.len > 0) {
-                                if (h_stmt.assign.targets[0] == .name) {
-                                    const var_name = h_stmt.assign.targets[0].name.id;
-                                    if (std.mem.eql(u8, var_name, mod_name)) {
-                                        // This is an optional import pattern - mark as skipped
-                                        try self.markSkippedModule(mod_name);
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
-
     // PHASE 4: Define __name__ constant (for if __name__ == "__main__" support)
     try self.emit("const __name__ = \"__main__\";\n");
 
@@ -253,15 +225,7 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
     try self.emit("const __file__: []const u8 = \"");
     if (self.source_file_path) |path| {
         // Escape special characters in the path
-        for (path) |c| {
-            if (c == '\\') {
-                try self.emit("\\\\");
-            } else if (c == '"') {
-                try self.emit("\\\"");
-            } else {
-                try self.output.append(self.allocator, c);
-            }
-        }
+        try self.emitEscapedString(path);
     } else {
         try self.emit("<unknown>");
     }
@@ -273,15 +237,7 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
         try self.emit("// metal0 metadata for runtime eval subprocess\n");
         try self.emit("pub const __metal0_source_dir: []const u8 = \"");
         // Escape any special characters in the path
-        for (dir) |c| {
-            if (c == '\\') {
-                try self.emit("\\\\");
-            } else if (c == '"') {
-                try self.emit("\\\"");
-            } else {
-                try self.output.append(self.allocator, c);
-            }
-        }
+        try self.emitEscapedString(dir);
         try self.emit("\";\n\n");
     }
 
@@ -540,7 +496,11 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
         defer self.allocator.free(current_output);
 
         // Rebuild output with lambdas first
+        // The rebuilt output is the old one plus the lambdas, so size it up front
+        var lambdas_len: usize = 0;
+        for (self.lambda_functions.items) |lambda_code| lambdas_len += lambda_code.len;
         self.output = std.ArrayList(u8){};
+        try self.output.ensureTotalCapacity(self.allocator, current_output.len + lambdas_len + 1);
 
         // Add imports
         try self.emit("const std = @import(\"std\");\n");
@@ -585,15 +545,7 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
         // Add __file__ constant
         try self.emit("const __file__: []const u8 = \"");
         if (self.source_file_path) |path| {
-            for (path) |c| {
-                if (c == '\\') {
-                    try self.emit("\\\\");
-                } else if (c == '"') {
-                    try self.emit("\\\"");
-                } else {
-                    try self.output.append(self.allocator, c);
-                }
-            }
+            try self.emitEscapedString(path);
         } else {
             try self.emit("<unknown>");
         }
@@ -605,25 +557,13 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
         }
 
         // Find where class/function definitions start (after imports, __name__, __file__)
-        // Parse current_output to extract everything after imports and magic constants
-        var lines = std.mem.splitScalar(u8, current_output, '\n');
-        var skip_count: usize = 0;
-        while (lines.next()) |line| {
-            skip_count += 1;
-            if (std.mem.indexOf(u8, line, "const __file__") != null) {
-                // Skip this line and the blank line after
-                _ = lines.next(); // blank line
-                skip_count += 1;
-                break;
-            }
-        }
-
-        // Append the rest of the original output (class/func defs + main)
-        var lines2 = std.mem.splitScalar(u8, current_output, '\n');
-        var i: usize = 0;
-        while (lines2.next()) |line| : (i += 1) {
-            if (i >= skip_count) {
-                try self.emit(line);
+        // and append the rest of the original output (class/func defs + main) as one slice
+        if (std.mem.indexOf(u8, current_output, "const __file__")) |file_pos| {
+            // Skip the __file__ line and the blank line after it
+            const file_line_end = std.mem.indexOfScalarPos(u8, current_output, file_pos, '\n');
+            const blank_line_end = if (file_line_end) |end| std.mem.indexOfScalarPos(u8, current_output, end + 1, '\n') else null;
+            if (blank_line_end) |end| {
+                try self.emit(current_output[end + 1 ..]);
                 try self.emit("\n");
             }
         }
@@ -632,6 +572,28 @@ pub fn generate(self: *NativeCodegen, module: ast.Node.Module) ![]const u8 {
     return self.output.toOwnedSlice(self.allocator);
 }
 
+/// Mark X skipped if try_node is an optional import (try: import X except: X = None)
+fn markOptionalImport(self: *NativeCodegen, try_node: ast.Node.Try) !void {
+    if (try_node.body.len != 1 or try_node.body[0] != .import_stmt) return;
+    const mod_name = try_node.body[0].import_stmt.module;
+    // Check if module is not in registry (unavailable)
+    if (self.import_registry.lookup(mod_name) != null) return;
+    // Check if except handler assigns to None
+    for (try_node.handlers) |handler| {
+        for (handler.body) |h_stmt| {
+            if (h_stmt == .assign and h_stmt.assign.targets.len > 0) {
+                if (h_stmt.assign.targets[0] == .name) {
+                    const var_name = h_stmt.assign.targets[0].name.id;
+                    if (std.mem.eql(u8, var_name, mod_name)) {
+                        // This is an optional import pattern - mark as skipped
+                        try self.markSkippedModule(mod_name);
+                    }
+                }
+            }
+        }
+    }
+}
+
 pub fn generateStmt(self: *NativeCodegen, node: ast.Node) CodegenError!void {
     switch (node) {
         .assign => |assign| try statements.genAssign(self, assign),
@@ -6,20 +6,17 @@ const NativeCodegen = core.NativeCodegen;
 const statements = @import("../statements.zig");
 const import_resolver = @import("../../../import_resolver.zig");
 const fnv_hash = @import("fnv_hash");
+const parse_cache = @import("../../../parse_cache.zig");
 
 const hashmap_helper = @import("hashmap_helper");
 const FnvVoidMap = hashmap_helper.StringHashMap(void);
 
+const NativeType = @import("../../../analysis/native_types.zig").NativeType;
+const NativeTypeHints = @import("../statements/functions/generators/signature.zig").NativeTypeHints;
+
 /// Infer return type from type string
-fn inferReturnTypeFromString(
-    type_name: []const u8,
-) @import("../../../analysis/native_types.zig").NativeType {
-    if (std.mem.eql(u8, type_name, "int")) return .int;
-    if (std.mem.eql(u8, type_name, "float")) return .float;
-    if (std.mem.eql(u8, type_name, "str")) return .{ .string = .runtime };
-    if (std.mem.eql(u8, type_name, "bool")) return .bool;
-
-    return .int;
+fn inferReturnTypeFromString(type_name: []const u8) NativeType {
+    return NativeTypeHints.get(type_name) orelse .int;
 }
 
 /// Compile a Python module as an inlined Zig struct
@@ -77,36 +74,20 @@ fn compileModuleAsStructWithPrefix(
     // Analyze if this is a package with submodules
     const pkg_info = try import_resolver.analyzePackage(py_path, aa);
 
-    // Read source (handle both relative and absolute paths)
-    const source = blk: {
-        // Try as absolute path first
-        if (std.fs.path.isAbsolute(py_path)) {
-            const file = std.fs.openFileAbsolute(py_path, .{}) catch |err| {
-                std.debug.print("Error: Cannot read file '{s}': {}\n", .{ py_path, err });
-                return error.ModuleNotFound;
-            };
-            defer file.close();
-            break :blk try file.readToEndAlloc(aa, 10 * 1024 * 1024);
-        } else {
-            // Relative path
-            break :blk try std.fs.cwd().readFileAlloc(aa, py_path, 10 * 1024 * 1024);
+    // Parse (shared with compileModule, which usually parsed it earlier this build)
+    const tree = parse_cache.parseFile(py_path) catch |err| {
+        if (err == error.FileNotFound) {
+            std.debug.print("Error: Cannot read file '{s}': {}\n", .{ py_path, err });
+            return error.ModuleNotFound;
         }
+        return err;
     };
 
-    // Lex, parse, analyze
-    const lexer_mod = @import("../../../lexer.zig");
-    const parser_mod = @import("../../../parser.zig");
+    // Analyze
     const semantic_types_mod = @import("../../../analysis/types.zig");
     const lifetime_analysis_mod = @import("../../../analysis/lifetime.zig");
     const native_types_mod = @import("../../../analysis/native_types.zig");
 
-    var lex = try lexer_mod.Lexer.init(aa, source);
-    const tokens = try lex.tokenize();
-
-    var p = parser_mod.Parser.init(aa, tokens);
-    defer p.deinit();
-    const tree = try p.parse();
-
     if (tree != .module) return error.InvalidAST;
 
     var semantic_info = semantic_types_mod.SemanticInfo.init(aa);
@@ -314,13 +295,13 @@ pub fn collectImports(
                 // Build resolved path
                 if (module_part.len > 0) {
                     // .app -> dir/app.py
-                    const resolved_path = std.fmt.allocPrint(self.allocator, "{s}/{s}.py", .{ parent_dir, module_part }) catch continue;
+                    const resolved_path = std.mem.concat(self.allocator, u8, &.{ parent_dir, "/", module_part, ".py" }) catch continue;
                     defer self.allocator.free(resolved_path);
 
                     // Check if file exists
                     std.fs.cwd().access(resolved_path, .{}) catch {
                         // Try as package: dir/app/__init__.py
-                        const pkg_path = std.fmt.allocPrint(self.allocator, "{s}/{s}/__init__.py", .{ parent_dir, module_part }) catch continue;
+                        const pkg_path = std.mem.concat(self.allocator, u8, &.{ parent_dir, "/", module_part, "/__init__.py" }) catch continue;
                         defer self.allocator.free(pkg_path);
                         std.fs.cwd().access(pkg_path, .{}) catch {
                             // Not found - skip
@@ -395,7 +376,7 @@ pub fn collectImports(
                 try imports.append(self.allocator, python_module);
             } else {
                 // Check if module was already compiled by import_scanner (e.g., stdlib modules)
-                const compiled_path = try std.fmt.allocPrint(self.allocator, ".build/{s}.zig", .{python_module});
+                const compiled_path = try std.mem.concat(self.allocator, u8, &.{ ".build/", python_module, ".zig" });
                 defer self.allocator.free(compiled_path);
                 const already_compiled = std.fs.cwd().access(compiled_path, .{}) != error.FileNotFound;
 
@@ -30,6 +30,21 @@ fn emitObjExpr(self: *NativeCodegen, obj: ast.Node) CodegenError!void {
     }
 }
 
+/// Emit `try <obj>.<method>(__global_allocator, ` - the shared prefix of allocating list calls
+fn emitAllocatingCall(self: *NativeCodegen, obj: ast.Node, comptime method: []const u8) CodegenError!void {
+    try self.emit("try ");
+    try emitObjExpr(self, obj);
+    try self.emit("." ++ method ++ "(__global_allocator, ");
+}
+
+/// Emit obj and return a copy of its generated code (caller frees), so templates that
+/// mention obj several times re-emit the text instead of regenerating the subtree
+fn emitObjCaptured(self: *NativeCodegen, obj: ast.Node) CodegenError![]const u8 {
+    const start = self.output.items.len;
+    try self.genExpr(obj);
+    return try self.allocator.dupe(u8, self.output.items[start..]);
+}
+
 /// Generate code for list.append(item)
 /// NOTE: Zig arrays are fixed size, need ArrayList for dynamic appending
 pub fn genAppend(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
@@ -38,9 +53,7 @@ pub fn genAppend(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenE
     }
 
     // Generate: try list.append(__global_allocator, item)
-    try self.emit("try ");
-    try emitObjExpr(self, obj);
-    try self.emit(".append(__global_allocator, ");
+    try emitAllocatingCall(self, obj, "append");
     try self.genExpr(args[0]);
     try self.emit(")");
 }
@@ -72,9 +85,8 @@ pub fn genExtend(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenE
     // Check if argument is a list literal - use & slice syntax
     if (arg == .list) {
         // Generate: try list.appendSlice(__global_allocator, &[_]T{...})
-        try self.emit("try ");
-        try emitObjExpr(self, obj);
-        try self.emit(".appendSlice(__global_allocator, &");
+        try emitAllocatingCall(self, obj, "appendSlice");
+        try self.emit("&");
         try self.genExpr(arg);
         try self.emit(")");
     } else if (producesBlockExpression(arg)) {
@@ -83,15 +95,13 @@ pub fn genExtend(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenE
         // Generate: { const __temp = expr; try list.appendSlice(__global_allocator, __temp.items); }
         try self.emit("{ const __list_temp = ");
         try self.genExpr(arg);
-        try self.emit("; try ");
-        try emitObjExpr(self, obj);
-        try self.emit(".appendSlice(__global_allocator, __list_temp.items); }");
+        try self.emit("; ");
+        try emitAllocatingCall(self, obj, "appendSlice");
+        try self.emit("__list_temp.items); }");
     } else {
         // Assume ArrayList variable - use .items
         // Generate: try list.appendSlice(__global_allocator, other.items)
-        try self.emit("try ");
-        try emitObjExpr(self, obj);
-        try self.emit(".appendSlice(__global_allocator, ");
+        try emitAllocatingCall(self, obj, "appendSlice");
         try self.genExpr(arg);
         try self.emit(".items)");
     }
@@ -104,9 +114,8 @@ pub fn genInsert(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenE
 
     // Generate: try list.insert(__global_allocator, @intCast(index), item)
     // Need @intCast because index may be i64 from floor division, but insert needs usize
-    try self.emit("try ");
-    try emitObjExpr(self, obj);
-    try self.emit(".insert(__global_allocator, @intCast(");
+    try emitAllocatingCall(self, obj, "insert");
+    try self.emit("@intCast(");
     try self.genExpr(args[0]);
     try self.emit("), ");
     try self.genExpr(args[1]);
@@ -120,11 +129,12 @@ pub fn genRemove(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenE
 
     // Generate: { const idx = std.mem.indexOfScalar(T, list.items, item).?; _ = list.orderedRemove(idx); }
     try self.emit("{ const __idx = std.mem.indexOfScalar(i64, ");
-    try self.genExpr(obj);
+    const obj_code = try emitObjCaptured(self, obj);
+    defer self.allocator.free(obj_code);
     try self.emit(".items, ");
     try self.genExpr(args[0]);
     try self.emit(").?; _ = ");
-    try self.genExpr(obj);
+    try self.emit(obj_code);
     try self.emit(".orderedRemove(__idx); }");
 }
 
@@ -206,9 +216,8 @@ pub fn genAppendleft(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) Code
     if (args.len != 1) return;
 
     // Generate: try deque.insert(__global_allocator, 0, item)
-    try self.emit("try ");
-    try emitObjExpr(self, obj);
-    try self.emit(".insert(__global_allocator, 0, ");
+    try emitAllocatingCall(self, obj, "insert");
+    try self.emit("0, ");
     try self.genExpr(args[0]);
     try self.emit(")");
 }
@@ -254,11 +263,12 @@ pub fn genRotate(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenE
     // Generate: std.mem.rotate(T, deque.items, n)
     // Note: std.mem.rotate rotates left, so we need to negate for Python's right rotation
     try self.emit("std.mem.rotate(@TypeOf(");
-    try self.genExpr(obj);
+    const obj_code = try emitObjCaptured(self, obj);
+    defer self.allocator.free(obj_code);
     try self.emit(".items[0]), ");
-    try self.genExpr(obj);
+    try self.emit(obj_code);
     try self.emit(".items, @as(usize, @intCast(");
-    try self.genExpr(obj);
+    try self.emit(obj_code);
     try self.emit(".items.len)) -% @as(usize, @intCast(");
     if (args.len > 0) {
         try self.genExpr(args[0]);
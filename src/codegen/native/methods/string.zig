@@ -103,36 +103,29 @@ pub fn genSplit(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenEr
 /// Converts string to uppercase
 pub fn genUpper(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
-
-    // Generate block expression (use _idx to avoid shadowing user variables)
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
-    try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    const _result = try __global_allocator.alloc(u8, _text.len);\n");
-    try self.emit("    for (_text, 0..) |_c, _idx| {\n");
-    try self.emit("        _result[_idx] = std.ascii.toUpper(_c);\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk _result;\n");
-    try self.emit("}");
+    try genCaseMap(self, obj, "toUpper");
 }
 
 /// Generate code for text.lower()
 /// Converts string to lowercase
 pub fn genLower(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
+    try genCaseMap(self, obj, "toLower");
+}
 
-    // Generate block expression (use _idx to avoid shadowing user variables)
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
+/// Emit a block expression mapping each byte through std.ascii.<convert>.
+/// The template is concatenated at comptime (use _idx to avoid shadowing
+/// user variables).
+fn genCaseMap(self: *NativeCodegen, obj: ast.Node, comptime convert: []const u8) CodegenError!void {
+    try self.emit("blk: {\n    const _text = ");
     try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    const _result = try __global_allocator.alloc(u8, _text.len);\n");
-    try self.emit("    for (_text, 0..) |_c, _idx| {\n");
-    try self.emit("        _result[_idx] = std.ascii.toLower(_c);\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk _result;\n");
-    try self.emit("}");
+    try self.emit(";\n" ++
+        "    const _result = try __global_allocator.alloc(u8, _text.len);\n" ++
+        "    for (_text, 0..) |_c, _idx| {\n" ++
+        "        _result[_idx] = std.ascii." ++ convert ++ "(_c);\n" ++
+        "    }\n" ++
+        "    break :blk _result;\n" ++
+        "}");
 }
 
 /// Generate code for text.strip()
@@ -37,51 +37,21 @@ pub fn genIsdigit(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) Codegen
 /// Returns true if all characters are alphabetic
 pub fn genIsalpha(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
-
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
-    try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    if (_text.len == 0) break :blk false;\n");
-    try self.emit("    for (_text) |c| {\n");
-    try self.emit("        if (!std.ascii.isAlphabetic(c)) break :blk false;\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk true;\n");
-    try self.emit("}");
+    try genAllChars(self, obj, "false", "isAlphabetic");
 }
 
 /// Generate code for text.isalnum()
 /// Returns true if all characters are alphanumeric
 pub fn genIsalnum(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
-
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
-    try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    if (_text.len == 0) break :blk false;\n");
-    try self.emit("    for (_text) |c| {\n");
-    try self.emit("        if (!std.ascii.isAlphanumeric(c)) break :blk false;\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk true;\n");
-    try self.emit("}");
+    try genAllChars(self, obj, "false", "isAlphanumeric");
 }
 
 /// Generate code for text.isspace()
 /// Returns true if all characters are whitespace
 pub fn genIsspace(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
-
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
-    try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    if (_text.len == 0) break :blk false;\n");
-    try self.emit("    for (_text) |c| {\n");
-    try self.emit("        if (!std.ascii.isWhitespace(c)) break :blk false;\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk true;\n");
-    try self.emit("}");
+    try genAllChars(self, obj, "false", "isWhitespace");
 }
 
 /// Generate code for text.islower()
@@ -126,17 +96,7 @@ pub fn genIsupper(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) Codegen
 /// Returns true if all characters are ASCII
 pub fn genIsascii(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
-
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
-    try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    if (_text.len == 0) break :blk true;\n");
-    try self.emit("    for (_text) |c| {\n");
-    try self.emit("        if (!std.ascii.isASCII(c)) break :blk false;\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk true;\n");
-    try self.emit("}");
+    try genAllChars(self, obj, "true", "isASCII");
 }
 
 /// Generate code for text.istitle()
@@ -172,15 +132,25 @@ pub fn genIstitle(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) Codegen
 /// Returns true if all characters are printable
 pub fn genIsprintable(self: *NativeCodegen, obj: ast.Node, args: []ast.Node) CodegenError!void {
     _ = args;
+    try genAllChars(self, obj, "true", "isPrint");
+}
 
-    try self.emit("blk: {\n");
-    try self.emit("    const _text = ");
+/// Emit an "every byte satisfies std.ascii.<predicate>" block expression.
+/// The template is concatenated at comptime: three emits per call instead of
+/// one per generated line.
+fn genAllChars(
+    self: *NativeCodegen,
+    obj: ast.Node,
+    comptime empty_result: []const u8,
+    comptime predicate: []const u8,
+) CodegenError!void {
+    try self.emit("blk: {\n    const _text = ");
     try self.genExpr(obj);
-    try self.emit(";\n");
-    try self.emit("    if (_text.len == 0) break :blk true;\n");
-    try self.emit("    for (_text) |c| {\n");
-    try self.emit("        if (!std.ascii.isPrint(c)) break :blk false;\n");
-    try self.emit("    }\n");
-    try self.emit("    break :blk true;\n");
-    try self.emit("}");
+    try self.emit(";\n" ++
+        "    if (_text.len == 0) break :blk " ++ empty_result ++ ";\n" ++
+        "    for (_text) |c| {\n" ++
+        "        if (!std.ascii." ++ predicate ++ "(c)) break :blk false;\n" ++
+        "    }\n" ++
+        "    break :blk true;\n" ++
+        "}");
 }
@@ -10,6 +10,31 @@ const typeHandling = @import("assign/type_handling.zig");
 const valueGen = @import("assign/value_generation.zig");
 const zig_keywords = @import("zig_keywords");
 
+/// Label prefixes emitted by expression generators for labeled blocks ("sub_0: {", ...)
+const labeled_block_prefixes = [_][]const u8{ "sub_", "slice_", "comp_", "dict_", "gen_", "idx_", "str_", "arr_" };
+
+/// Bytes that precede the '_' of some labeled_block_prefixes entry (derived at comptime,
+/// so the table stays the only list of prefixes)
+const labeled_block_prefix_tails = blk: {
+    var tails = [_]bool{false} ** 256;
+    for (labeled_block_prefixes) |prefix| tails[prefix[prefix.len - 2]] = true;
+    break :blk tails;
+};
+
+/// Check if generated code contains any labeled_block_prefixes entry in one pass:
+/// every prefix ends in '_', so only underscores after a tail byte are compared
+fn containsLabeledBlockPrefix(generated: []const u8) bool {
+    var pos: usize = 1;
+    while (std.mem.indexOfScalarPos(u8, generated, pos, '_')) |underscore| : (pos = underscore + 1) {
+        if (!labeled_block_prefix_tails[generated[underscore - 1]]) continue;
+        const head = generated[0 .. underscore + 1];
+        for (labeled_block_prefixes) |prefix| {
+            if (std.mem.endsWith(u8, head, prefix)) return true;
+        }
+    }
+    return false;
+}
+
 /// Check if an expression results in a BigInt
 /// This detects expressions that produce BigInt values at runtime
 fn isBigIntExpression(expr: ast.Node) bool {
@@ -56,7 +81,10 @@ pub fn genAnnAssign(self: *NativeCodegen, ann_assign: ast.Node.AnnAssign) Codege
 /// Generate assignment statement with automatic defer cleanup
 pub fn genAssign(self: *NativeCodegen, assign: ast.Node.Assign) CodegenError!void {
     // Infer type from the current value expression
-    var value_type = try self.inferExprScoped(assign.value.*);
+    // (kept separately: the bigint and dynamic attribute paths need the
+    // value's own type, not the widened variable type chosen below)
+    const inferred_value_type = try self.inferExprScoped(assign.value.*);
+    var value_type = inferred_value_type;
 
     // For variable declarations and reassignments, use the scoped widened type
     // from the type inferrer. This ensures the variable can hold all values
@@ -104,185 +132,312 @@ pub fn genAssign(self: *NativeCodegen, assign: ast.Node.Assign) CodegenError!voi
     }
 
     for (assign.targets) |target| {
-        if (target == .name) {
-            var var_name = target.name.id;
-            const original_var_name = var_name; // Keep for usage checks (before any renaming)
-
-            // Check if this is assigning a type attribute to a variable with the same name
-            // e.g., int_class = self.int_class -> would shadow the int_class function
-            // In this case, rename the local variable to avoid shadowing
-            if (assign.value.* == .attribute) {
-                const attr = assign.value.attribute;
-                if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                    if (std.mem.eql(u8, attr.attr, var_name)) {
-                        // Check if this is a type attribute
-                        if (self.current_class_name) |class_name| {
-                            const type_attr_key = std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class_name, var_name }) catch null;
-                            if (type_attr_key) |key| {
-                                if (self.class_type_attrs.get(key)) |_| {
-                                    // Rename the local variable to avoid shadowing
-                                    const renamed = std.fmt.allocPrint(self.allocator, "_local_{s}", .{var_name}) catch var_name;
-                                    try self.var_renames.put(var_name, renamed);
-                                    var_name = renamed;
+        switch (target) {
+            .name => |name_target| {
+                var var_name = name_target.id;
+                const original_var_name = var_name; // Keep for usage checks (before any renaming)
+
+                // Value-kind specific handling - dispatch once on the union tag
+                switch (assign.value.*) {
+                    // Check if this is assigning a type attribute to a variable with the same name
+                    // e.g., int_class = self.int_class -> would shadow the int_class function
+                    // In this case, rename the local variable to avoid shadowing
+                    .attribute => |attr| {
+                        if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
+                            if (std.mem.eql(u8, attr.attr, var_name)) {
+                                // Check if this is a type attribute
+                                if (self.current_class_name) |class_name| {
+                                    if (self.getClassTypeAttr(class_name, var_name)) |_| {
+                                        // Rename the local variable to avoid shadowing
+                                        const renamed = std.mem.concat(self.allocator, u8, &.{ "_local_", var_name }) catch var_name;
+                                        try self.var_renames.put(var_name, renamed);
+                                        var_name = renamed;
+                                    }
                                 }
                             }
                         }
-                    }
+                    },
+                    // Track nested class instances: obj = Inner() -> obj is instance of Inner
+                    // This is used to pass allocator to method calls on nested class instances
+                    .call => |call_value| {
+                        if (call_value.func.* == .name) {
+                            const class_name = call_value.func.name.id;
+                            if (self.nested_class_captures.contains(class_name)) {
+                                // This is a nested class constructor call
+                                try self.nested_class_instances.put(var_name, class_name);
+                            }
+                        }
+                    },
+                    // Special case: ellipsis assignment (x = ...)
+                    // Emit as explicit discard to avoid "unused variable" error
+                    .ellipsis_literal => {
+                        try self.emitIndent();
+                        try self.emit("_ = ");
+                        try self.genExpr(assign.value.*);
+                        try self.emit(";\n");
+                        return;
+                    },
+                    else => {},
                 }
-            }
 
-            // Track nested class instances: obj = Inner() -> obj is instance of Inner
-            // This is used to pass allocator to method calls on nested class instances
-            if (assign.value.* == .call) {
-                const call_value = assign.value.call;
-                if (call_value.func.* == .name) {
-                    const class_name = call_value.func.name.id;
-                    if (self.nested_class_captures.contains(class_name)) {
-                        // This is a nested class constructor call
-                        try self.nested_class_instances.put(var_name, class_name);
+                // Check collection types and allocation behavior
+                const is_constant_array = typeHandling.isConstantArray(self, assign, var_name);
+                const is_arraylist = typeHandling.isArrayList(self, assign, var_name, is_constant_array);
+                const is_listcomp = (assign.value.* == .listcomp);
+                const is_dict = (assign.value.* == .dict);
+                _ = assign.value.* == .dictcomp; // is_dictcomp - reserved for future use
+                const is_allocated_string = typeHandling.isAllocatedString(self, assign.value.*);
+                const is_mutable_class_instance = typeHandling.isMutableClassInstance(self, assign.value.*);
+                const is_array_slice = typeHandling.isArraySlice(self, assign.value.*);
+
+                // Check if this is first assignment or reassignment
+                // Hoisted variables should skip declaration (already declared before try block)
+                // Global variables should also skip declaration (they're declared in outer scope)
+                const is_hoisted = self.hoisted_vars.contains(var_name);
+                const is_global = self.isGlobalVar(var_name);
+                // isDeclared walks every scope, so test the single-map flags first
+                const is_first_assignment = !is_hoisted and !is_global and !self.isDeclared(var_name);
+
+                // Try compile-time evaluation FIRST
+                // Skip comptime eval for variables typed as bigint (need runtime BigInt.fromInt)
+                if (value_type != .bigint) {
+                    if (self.comptime_evaluator.tryEval(assign.value.*)) |comptime_val| {
+                        // Only apply for simple types (no strings/lists that allocate during evaluation)
+                        // TODO: Strings and lists need proper arena allocation to avoid memory leaks
+                        const is_simple_type = switch (comptime_val) {
+                            .int, .float, .bool => true,
+                            .string, .list => false,
+                        };
+
+                        if (is_simple_type) {
+                            // Check mutability BEFORE emitting
+                            // Use isVarMutated() to check both module-level AND function-local mutations
+                            const is_mutable = if (is_first_assignment)
+                                self.isVarMutated(var_name)
+                            else
+                                false; // Reassignments don't declare
+
+                            // Successfully evaluated at compile time!
+                            try comptimeHelpers.emitComptimeAssignment(self, var_name, comptime_val, is_first_assignment, is_mutable);
+                            if (is_first_assignment) {
+                                // Declare with proper type for scope-aware type lookup
+                                try self.declareVarWithType(var_name, value_type);
+                            }
+
+                            // If variable is used in eval string but nowhere else in actual code,
+                            // emit _ = varname; to suppress Zig "unused" warning
+                            // Use original_var_name for check, but emit renamed var_name
+                            if (self.isEvalStringVar(original_var_name)) {
+                                try self.emitIndent();
+                                try self.emit("_ = ");
+                                try self.emit(var_name);
+                                try self.emit(";\n");
+                            }
+
+                            return;
+                        }
+                        // Fall through to runtime codegen for strings/lists
+                        // Don't free - these are either AST-owned or will leak (TODO: arena)
                     }
                 }
-            }
 
-            // Special case: ellipsis assignment (x = ...)
-            // Emit as explicit discard to avoid "unused variable" error
-            if (assign.value.* == .ellipsis_literal) {
                 try self.emitIndent();
-                try self.emit("_ = ");
-                try self.genExpr(assign.value.*);
-                try self.emit(";\n");
-                return;
-            }
 
-            // Check collection types and allocation behavior
-            const is_constant_array = typeHandling.isConstantArray(self, assign, var_name);
-            const is_arraylist = typeHandling.isArrayList(self, assign, var_name);
-            const is_listcomp = (assign.value.* == .listcomp);
-            const is_dict = (assign.value.* == .dict);
-            _ = assign.value.* == .dictcomp; // is_dictcomp - reserved for future use
-            const is_allocated_string = typeHandling.isAllocatedString(self, assign.value.*);
-            const is_mutable_class_instance = typeHandling.isMutableClassInstance(self, assign.value.*);
-
-            // Check if this is first assignment or reassignment
-            // Hoisted variables should skip declaration (already declared before try block)
-            // Global variables should also skip declaration (they're declared in outer scope)
-            const is_hoisted = self.hoisted_vars.contains(var_name);
-            const is_global = self.isGlobalVar(var_name);
-            const is_first_assignment = !self.isDeclared(var_name) and !is_hoisted and !is_global;
-
-            // Try compile-time evaluation FIRST
-            // Skip comptime eval for variables typed as bigint (need runtime BigInt.fromInt)
-            if (value_type != .bigint) {
-                if (self.comptime_evaluator.tryEval(assign.value.*)) |comptime_val| {
-                    // Only apply for simple types (no strings/lists that allocate during evaluation)
-                    // TODO: Strings and lists need proper arena allocation to avoid memory leaks
-                    const is_simple_type = switch (comptime_val) {
-                        .int, .float, .bool => true,
-                        .string, .list => false,
-                    };
+                // For unused variables, discard with _ = expr; to avoid Zig errors
+                // But PyObjects still need decref to free memory (e.g., json.loads)
+                // Use original_var_name since usage analysis uses the original Python variable name
+                if (is_first_assignment and self.isVarUnused(original_var_name)) {
+                    if (value_type == .unknown) {
+                        // PyObject: capture in block and decref immediately
+                        // { const __unused = expr; runtime.decref(__unused, __global_allocator); }
+                        try self.emit("{ const __unused = ");
+                        try self.genExpr(assign.value.*);
+                        try self.emit("; runtime.decref(__unused, __global_allocator); }\n");
+                    } else {
+                        try self.emit("_ = ");
+                        try self.genExpr(assign.value.*);
+                        try self.emit(";\n");
+                    }
+                    // Don't declare - variable doesn't exist
+                    return;
+                }
 
-                    if (is_simple_type) {
-                        // Check mutability BEFORE emitting
-                        // Use isVarMutated() to check both module-level AND function-local mutations
-                        const is_mutable = if (is_first_assignment)
-                            self.isVarMutated(var_name)
-                        else
-                            false; // Reassignments don't declare
-
-                        // Successfully evaluated at compile time!
-                        try comptimeHelpers.emitComptimeAssignment(self, var_name, comptime_val, is_first_assignment, is_mutable);
-                        if (is_first_assignment) {
-                            // Declare with proper type for scope-aware type lookup
-                            try self.declareVarWithType(var_name, value_type);
-                        }
+                if (is_first_assignment) {
+                    // First assignment: emit var/const declaration with type annotation
+                    try valueGen.emitVarDeclaration(
+                        self,
+                        var_name,
+                        value_type,
+                        is_arraylist,
+                        is_dict,
+                        is_mutable_class_instance,
+                        is_listcomp,
+                    );
+
+                    // Mark as declared with proper type for scope-aware type lookup
+                    try self.declareVarWithType(var_name, value_type);
+
+                    // Track array slice vars
+                    if (is_array_slice) {
+                        const var_name_copy = try self.allocator.dupe(u8, var_name);
+                        try self.array_slice_vars.put(var_name_copy, {});
+                    }
+                } else {
+                    // Reassignment: x = value (no var/const keyword!)
+                    // Use renamed version if in var_renames map (for exception handling)
+                    const actual_name = self.var_renames.get(var_name) orelse var_name;
+                    // Use writeEscapedIdent to handle Zig keywords (e.g., "packed" -> @"packed")
+                    try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), actual_name);
+                    try self.emit(" = ");
+                    // No type annotation on reassignment
+                }
 
-                        // If variable is used in eval string but nowhere else in actual code,
-                        // emit _ = varname; to suppress Zig "unused" warning
-                        // Use original_var_name for check, but emit renamed var_name
-                        if (self.isEvalStringVar(original_var_name)) {
-                            try self.emitIndent();
-                            try self.emit("_ = ");
-                            try self.emit(var_name);
-                            try self.emit(";\n");
+                // Special handling for string concatenation with nested operations
+                // s1 + " " + s2 needs intermediate temps
+                if (assign.value.* == .binop and assign.value.binop.op == .Add) {
+                    // Right operand first: usually a leaf, so the deep left side
+                    // is only inferred when the right side is not a string
+                    const is_string_concat = (try self.inferExprScoped(assign.value.binop.right.*)) == .string or
+                        (try self.inferExprScoped(assign.value.binop.left.*)) == .string;
+                    if (is_string_concat) {
+                        try valueGen.genStringConcat(self, assign, var_name, is_first_assignment);
+                        return;
+                    }
+                }
+
+                // Special handling for list literals that will be mutated
+                // Generate ArrayList initialization directly instead of fixed array
+                if (is_arraylist and assign.value.* == .list) {
+                    const list = assign.value.list;
+                    try valueGen.genArrayListInit(self, var_name, list);
+
+                    // Add defer cleanup
+                    try deferCleanup.emitDeferCleanups(
+                        self,
+                        var_name,
+                        is_first_assignment,
+                        is_arraylist,
+                        is_listcomp,
+                        is_dict,
+                        is_allocated_string,
+                        assign.value.*,
+                    );
+                    return;
+                }
+
+                // Special handling for bigint variable assignments
+                // When variable is typed as bigint, we need to convert values to BigInt
+                if (value_type == .bigint) {
+                    // If current value is int-typed, convert to BigInt
+                    if (inferred_value_type == .int) {
+                        // Check if this is an int() call - use parseIntToBigInt directly
+                        // to avoid overflow when parsing very large strings like int('1' * 600)
+                        if (assign.value.* == .call and assign.value.call.func.* == .name and
+                            std.mem.eql(u8, assign.value.call.func.name.id, "int"))
+                        {
+                            const int_call = assign.value.call;
+                            if (int_call.args.len >= 1) {
+                                // int(string) or int(string, base) -> use parseIntToBigInt
+                                try self.emit("(try runtime.parseIntToBigInt(__global_allocator, ");
+                                try self.genExpr(int_call.args[0]);
+                                try self.emit(", ");
+                                if (int_call.args.len >= 2) {
+                                    try self.emit("@intCast(");
+                                    try self.genExpr(int_call.args[1]);
+                                    try self.emit(")");
+                                } else {
+                                    try self.emit("10");
+                                }
+                                try self.emit("));\n");
+
+                                // Track variable metadata
+                                try valueGen.trackVariableMetadata(
+                                    self,
+                                    var_name,
+                                    is_first_assignment,
+                                    is_constant_array,
+                                    is_array_slice,
+                                    assign,
+                                    inferred_value_type,
+                                );
+                                return;
+                            }
                         }
 
+                        // Small integer constants can use fromInt (i64)
+                        // Other int expressions (arithmetic, int(string), etc.) may produce i128
+                        if (assign.value.* == .constant) {
+                            try self.emit("(runtime.BigInt.fromInt(__global_allocator, ");
+                        } else {
+                            try self.emit("(runtime.BigInt.fromInt128(__global_allocator, ");
+                        }
+                        try self.genExpr(assign.value.*);
+                        try self.emit(") catch unreachable);\n");
+
+                        // Track variable metadata
+                        try valueGen.trackVariableMetadata(
+                            self,
+                            var_name,
+                            is_first_assignment,
+                            is_constant_array,
+                            is_array_slice,
+                            assign,
+                            inferred_value_type,
+                        );
                         return;
                     }
-                    // Fall through to runtime codegen for strings/lists
-                    // Don't free - these are either AST-owned or will leak (TODO: arena)
+                    // If current value is already bigint, emit normally
                 }
-            }
 
-            try self.emitIndent();
+                // Check if this is an async function call that needs auto-await
+                const is_async_call = isAsyncFunctionCall(self, assign.value.*);
 
-            // For unused variables, discard with _ = expr; to avoid Zig errors
-            // But PyObjects still need decref to free memory (e.g., json.loads)
-            // Use original_var_name since usage analysis uses the original Python variable name
-            if (is_first_assignment and self.isVarUnused(original_var_name)) {
-                if (value_type == .unknown) {
-                    // PyObject: capture in block and decref immediately
-                    // { const __unused = expr; runtime.decref(__unused, __global_allocator); }
-                    try self.emit("{ const __unused = ");
+                if (is_async_call) {
+                    // Auto-await: wrap async call with scheduler init + wait + result extraction
+                    try self.emit("(blk: {\n");
+                    try self.emitIndent();
+                    // Initialize scheduler if needed (first async call)
+                    try self.emit("    if (!runtime.scheduler_initialized) {\n");
+                    try self.emitIndent();
+                    try self.emit("        const __num_threads = std.Thread.getCpuCount() catch 8;\n");
+                    try self.emitIndent();
+                    try self.emit("        runtime.scheduler = runtime.Scheduler.init(__global_allocator, __num_threads) catch unreachable;\n");
+                    try self.emitIndent();
+                    try self.emit("        runtime.scheduler.start() catch unreachable;\n");
+                    try self.emitIndent();
+                    try self.emit("        runtime.scheduler_initialized = true;\n");
+                    try self.emitIndent();
+                    try self.emit("    }\n");
+                    try self.emitIndent();
+                    try self.emit("    const __thread = ");
                     try self.genExpr(assign.value.*);
-                    try self.emit("; runtime.decref(__unused, __global_allocator); }\n");
+                    try self.emit(";\n");
+                    try self.emitIndent();
+                    try self.emit("    runtime.scheduler.wait(__thread);\n");
+                    try self.emitIndent();
+                    try self.emit("    const __result = __thread.result orelse unreachable;\n");
+                    try self.emitIndent();
+                    try self.emit("    break :blk @as(*i64, @ptrCast(@alignCast(__result))).*;\n");
+                    try self.emitIndent();
+                    try self.emit("});\n");
                 } else {
-                    try self.emit("_ = ");
+                    // Emit value normally
                     try self.genExpr(assign.value.*);
                     try self.emit(";\n");
                 }
-                // Don't declare - variable doesn't exist
-                return;
-            }
 
-            if (is_first_assignment) {
-                // First assignment: emit var/const declaration with type annotation
-                try valueGen.emitVarDeclaration(
+                // Track variable metadata (ArrayList vars, closures, etc.)
+                try valueGen.trackVariableMetadata(
                     self,
                     var_name,
-                    value_type,
-                    is_arraylist,
-                    is_dict,
-                    is_mutable_class_instance,
-                    is_listcomp,
+                    is_first_assignment,
+                    is_constant_array,
+                    is_array_slice,
+                    assign,
+                    inferred_value_type,
                 );
 
-                // Mark as declared with proper type for scope-aware type lookup
-                try self.declareVarWithType(var_name, value_type);
-
-                // Track array slice vars
-                const is_array_slice = typeHandling.isArraySlice(self, assign.value.*);
-                if (is_array_slice) {
-                    const var_name_copy = try self.allocator.dupe(u8, var_name);
-                    try self.array_slice_vars.put(var_name_copy, {});
-                }
-            } else {
-                // Reassignment: x = value (no var/const keyword!)
-                // Use renamed version if in var_renames map (for exception handling)
-                const actual_name = self.var_renames.get(var_name) orelse var_name;
-                // Use writeEscapedIdent to handle Zig keywords (e.g., "packed" -> @"packed")
-                try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), actual_name);
-                try self.emit(" = ");
-                // No type annotation on reassignment
-            }
-
-            // Special handling for string concatenation with nested operations
-            // s1 + " " + s2 needs intermediate temps
-            if (assign.value.* == .binop and assign.value.binop.op == .Add) {
-                const left_type = try self.inferExprScoped(assign.value.binop.left.*);
-                const right_type = try self.inferExprScoped(assign.value.binop.right.*);
-                if (left_type == .string or right_type == .string) {
-                    try valueGen.genStringConcat(self, assign, var_name, is_first_assignment);
-                    return;
-                }
-            }
-
-            // Special handling for list literals that will be mutated
-            // Generate ArrayList initialization directly instead of fixed array
-            if (is_arraylist and assign.value.* == .list) {
-                const list = assign.value.list;
-                try valueGen.genArrayListInit(self, var_name, list);
-
-                // Add defer cleanup
+                // Add defer cleanup based on assignment type
                 try deferCleanup.emitDeferCleanups(
                     self,
                     var_name,
@@ -293,240 +448,115 @@ pub fn genAssign(self: *NativeCodegen, assign: ast.Node.Assign) CodegenError!voi
                     is_allocated_string,
                     assign.value.*,
                 );
-                return;
-            }
-
-            // Special handling for bigint variable assignments
-            // When variable is typed as bigint, we need to convert values to BigInt
-            if (value_type == .bigint) {
-                // Infer the type of the current value expression
-                const current_value_type = try self.inferExprScoped(assign.value.*);
-
-                // If current value is int-typed, convert to BigInt
-                if (current_value_type == .int) {
-                    // Check if this is an int() call - use parseIntToBigInt directly
-                    // to avoid overflow when parsing very large strings like int('1' * 600)
-                    if (assign.value.* == .call and assign.value.call.func.* == .name and
-                        std.mem.eql(u8, assign.value.call.func.name.id, "int"))
-                    {
-                        const int_call = assign.value.call;
-                        if (int_call.args.len >= 1) {
-                            // int(string) or int(string, base) -> use parseIntToBigInt
-                            try self.emit("(try runtime.parseIntToBigInt(__global_allocator, ");
-                            try self.genExpr(int_call.args[0]);
-                            try self.emit(", ");
-                            if (int_call.args.len >= 2) {
-                                try self.emit("@intCast(");
-                                try self.genExpr(int_call.args[1]);
-                                try self.emit(")");
-                            } else {
-                                try self.emit("10");
-                            }
-                            try self.emit("));\n");
-
-                            // Track variable metadata
-                            try valueGen.trackVariableMetadata(
-                                self,
-                                var_name,
-                                is_first_assignment,
-                                is_constant_array,
-                                typeHandling.isArraySlice(self, assign.value.*),
-                                assign,
-                            );
-                            return;
-                        }
-                    }
-
-                    // Small integer constants can use fromInt (i64)
-                    // Other int expressions (arithmetic, int(string), etc.) may produce i128
-                    if (assign.value.* == .constant) {
-                        try self.emit("(runtime.BigInt.fromInt(__global_allocator, ");
-                    } else {
-                        try self.emit("(runtime.BigInt.fromInt128(__global_allocator, ");
+            },
+            .attribute => |attr| {
+                // Handle attribute assignment (self.x = value or obj.y = value)
+
+                // Check for module class attribute assignment (e.g., array.array.foo = 1)
+                // This is not supported - in Python it would raise TypeError
+                if (attr.value.* == .attribute) {
+                    // Nested attribute like module.class.attr - check if it's a module type
+                    const inner_attr = attr.value.attribute;
+                    if (inner_attr.value.* == .name) {
+                        // Could be array.array.foo or similar - emit noop
+                        try self.emitIndent();
+                        try self.emit("// TypeError: cannot set attribute on immutable type\n");
+                        return;
                     }
-                    try self.genExpr(assign.value.*);
-                    try self.emit(") catch unreachable);\n");
-
-                    // Track variable metadata
-                    try valueGen.trackVariableMetadata(
-                        self,
-                        var_name,
-                        is_first_assignment,
-                        is_constant_array,
-                        typeHandling.isArraySlice(self, assign.value.*),
-                        assign,
-                    );
-                    return;
                 }
-                // If current value is already bigint, emit normally
-            }
-
-            // Check if this is an async function call that needs auto-await
-            const is_async_call = isAsyncFunctionCall(self, assign.value.*);
 
-            if (is_async_call) {
-                // Auto-await: wrap async call with scheduler init + wait + result extraction
-                try self.emit("(blk: {\n");
-                try self.emitIndent();
-                // Initialize scheduler if needed (first async call)
-                try self.emit("    if (!runtime.scheduler_initialized) {\n");
-                try self.emitIndent();
-                try self.emit("        const __num_threads = std.Thread.getCpuCount() catch 8;\n");
-                try self.emitIndent();
-                try self.emit("        runtime.scheduler = runtime.Scheduler.init(__global_allocator, __num_threads) catch unreachable;\n");
-                try self.emitIndent();
-                try self.emit("        runtime.scheduler.start() catch unreachable;\n");
-                try self.emitIndent();
-                try self.emit("        runtime.scheduler_initialized = true;\n");
-                try self.emitIndent();
-                try self.emit("    }\n");
-                try self.emitIndent();
-                try self.emit("    const __thread = ");
-                try self.genExpr(assign.value.*);
-                try self.emit(";\n");
-                try self.emitIndent();
-                try self.emit("    runtime.scheduler.wait(__thread);\n");
-                try self.emitIndent();
-                try self.emit("    const __result = __thread.result orelse unreachable;\n");
-                try self.emitIndent();
-                try self.emit("    break :blk @as(*i64, @ptrCast(@alignCast(__result))).*;\n");
-                try self.emitIndent();
-                try self.emit("});\n");
-            } else {
-                // Emit value normally
-                try self.genExpr(assign.value.*);
-                try self.emit(";\n");
-            }
-
-            // Track variable metadata (ArrayList vars, closures, etc.)
-            try valueGen.trackVariableMetadata(
-                self,
-                var_name,
-                is_first_assignment,
-                is_constant_array,
-                typeHandling.isArraySlice(self, assign.value.*),
-                assign,
-            );
-
-            // Add defer cleanup based on assignment type
-            try deferCleanup.emitDeferCleanups(
-                self,
-                var_name,
-                is_first_assignment,
-                is_arraylist,
-                is_listcomp,
-                is_dict,
-                is_allocated_string,
-                assign.value.*,
-            );
-        } else if (target == .attribute) {
-            // Handle attribute assignment (self.x = value or obj.y = value)
-            const attr = target.attribute;
-
-            // Check for module class attribute assignment (e.g., array.array.foo = 1)
-            // This is not supported - in Python it would raise TypeError
-            if (attr.value.* == .attribute) {
-                // Nested attribute like module.class.attr - check if it's a module type
-                const inner_attr = attr.value.attribute;
-                if (inner_attr.value.* == .name) {
-                    // Could be array.array.foo or similar - emit noop
+                // Check if the value being assigned to is a call expression (e.g., B().x = 0)
+                // In this case we need to create a temp variable since Zig doesn't allow
+                // assigning to fields of block expressions
+                if (attr.value.* == .call) {
+                    // Generate: { var __tmp_N = B.init(...); __tmp_N.x = value; }
+                    const tmp_id = self.unpack_counter;
+                    self.unpack_counter += 1;
+                    try self.emitIndent();
+                    try self.emit("{\n");
+                    self.indent_level += 1;
+                    try self.emitIndent();
+                    try self.emitFmt("var __attr_tmp_{d} = ", .{tmp_id});
+                    try self.genExpr(attr.value.*);
+                    try self.emit(";\n");
+                    try self.emitIndent();
+                    try self.emitFmt("__attr_tmp_{d}.", .{tmp_id});
+                    try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), attr.attr);
+                    try self.emit(" = ");
+                    try self.genExpr(assign.value.*);
+                    try self.emit(";\n");
+                    self.indent_level -= 1;
                     try self.emitIndent();
-                    try self.emit("// TypeError: cannot set attribute on immutable type\n");
+                    try self.emit("}\n");
                     return;
                 }
-            }
 
-            // Check if the value being assigned to is a call expression (e.g., B().x = 0)
-            // In this case we need to create a temp variable since Zig doesn't allow
-            // assigning to fields of block expressions
-            if (attr.value.* == .call) {
-                // Generate: { var __tmp_N = B.init(...); __tmp_N.x = value; }
-                const tmp_id = self.unpack_counter;
-                self.unpack_counter += 1;
-                try self.emitIndent();
-                try self.emit("{\n");
-                self.indent_level += 1;
-                try self.emitIndent();
-                try self.emitFmt("var __attr_tmp_{d} = ", .{tmp_id});
-                try self.genExpr(attr.value.*);
-                try self.emit(";\n");
-                try self.emitIndent();
-                try self.emitFmt("__attr_tmp_{d}.", .{tmp_id});
-                try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), attr.attr);
-                try self.emit(" = ");
-                try self.genExpr(assign.value.*);
-                try self.emit(";\n");
-                self.indent_level -= 1;
-                try self.emitIndent();
-                try self.emit("}\n");
-                return;
-            }
-
-            // Check if this is a dynamic attribute
-            const is_dynamic = try isDynamicAttrAssign(self, attr);
-
-            try self.emitIndent();
-            if (is_dynamic) {
-                // Dynamic attribute: use __dict__.put() with type wrapping
-                const dyn_value_type = try self.inferExprScoped(assign.value.*);
-                const py_value_tag = switch (dyn_value_type) {
-                    .int => "int",
-                    .float => "float",
-                    .bool => "bool",
-                    .string => "string",
-                    else => "int", // Default fallback
-                };
-
-                try self.emit("try ");
-                try self.genExpr(attr.value.*);
-                try self.emitFmt(".__dict__.put(\"{s}\", runtime.PyValue{{ .{s} = ", .{ attr.attr, py_value_tag });
-                try self.genExpr(assign.value.*);
-                try self.emit(" })");
-            } else {
-                // Known attribute: direct assignment
-                try self.genExpr(target);
-                try self.emit(" = ");
-                try self.genExpr(assign.value.*);
-            }
-            try self.emit(";\n");
-        } else if (target == .subscript) {
-            // Handle subscript assignment: self.routes[path] = handler, dict[key] = value
-            const subscript = target.subscript;
-
-            // Only handle index subscripts for now (not slices)
-            if (subscript.slice == .index) {
-                // Determine the container type to generate appropriate code
-                const container_type = try self.inferExprScoped(subscript.value.*);
+                // Check if this is a dynamic attribute
+                const is_dynamic = try isDynamicAttrAssign(self, attr);
 
                 try self.emitIndent();
+                if (is_dynamic) {
+                    // Dynamic attribute: use __dict__.put() with type wrapping
+                    const py_value_tag = switch (inferred_value_type) {
+                        .int => "int",
+                        .float => "float",
+                        .bool => "bool",
+                        .string => "string",
+                        else => "int", // Default fallback
+                    };
 
-                if (container_type == .dict) {
-                    // Dict assignment: dict.put(key, value)
                     try self.emit("try ");
-                    try self.genExpr(subscript.value.*);
-                    try self.emit(".put(");
-                    try self.genExpr(subscript.slice.index.*);
-                    try self.emit(", ");
+                    try self.genExpr(attr.value.*);
+                    try self.emitFmt(".__dict__.put(\"{s}\", runtime.PyValue{{ .{s} = ", .{ attr.attr, py_value_tag });
                     try self.genExpr(assign.value.*);
-                    try self.emit(");\n");
-                } else if (container_type == .list) {
-                    // List assignment: list.items[idx] = value
-                    try self.genExpr(subscript.value.*);
-                    try self.emit(".items[@as(usize, @intCast(");
-                    try self.genExpr(subscript.slice.index.*);
-                    try self.emit("))] = ");
-                    try self.genExpr(assign.value.*);
-                    try self.emit(";\n");
+                    try self.emit(" })");
                 } else {
-                    // Generic array/slice assignment: arr[idx] = value
-                    try self.genExpr(subscript.value.*);
-                    try self.emit("[@as(usize, @intCast(");
-                    try self.genExpr(subscript.slice.index.*);
-                    try self.emit("))] = ");
+                    // Known attribute: direct assignment
+                    try self.genExpr(target);
+                    try self.emit(" = ");
                     try self.genExpr(assign.value.*);
-                    try self.emit(";\n");
                 }
-            }
+                try self.emit(";\n");
+            },
+            .subscript => |subscript| {
+                // Handle subscript assignment: self.routes[path] = handler, dict[key] = value
+
+                // Only handle index subscripts for now (not slices)
+                if (subscript.slice == .index) {
+                    // Determine the container type to generate appropriate code
+                    const container_type = try self.inferExprScoped(subscript.value.*);
+
+                    try self.emitIndent();
+
+                    if (container_type == .dict) {
+                        // Dict assignment: dict.put(key, value)
+                        try self.emit("try ");
+                        try self.genExpr(subscript.value.*);
+                        try self.emit(".put(");
+                        try self.genExpr(subscript.slice.index.*);
+                        try self.emit(", ");
+                        try self.genExpr(assign.value.*);
+                        try self.emit(");\n");
+                    } else if (container_type == .list) {
+                        // List assignment: list.items[idx] = value
+                        try self.genExpr(subscript.value.*);
+                        try self.emit(".items[@as(usize, @intCast(");
+                        try self.genExpr(subscript.slice.index.*);
+                        try self.emit("))] = ");
+                        try self.genExpr(assign.value.*);
+                        try self.emit(";\n");
+                    } else {
+                        // Generic array/slice assignment: arr[idx] = value
+                        try self.genExpr(subscript.value.*);
+                        try self.emit("[@as(usize, @intCast(");
+                        try self.genExpr(subscript.slice.index.*);
+                        try self.emit("))] = ");
+                        try self.genExpr(assign.value.*);
+                        try self.emit(";\n");
+                    }
+                }
+            },
+            else => {},
         }
     }
 }
@@ -760,6 +790,10 @@ pub fn genAugAssign(self: *NativeCodegen, aug: ast.Node.AugAssign) CodegenError!
 
 /// Generate expression statement (expression with semicolon)
 pub fn genExprStmt(self: *NativeCodegen, expr: ast.Node) CodegenError!void {
+    // Bare string constants (docstrings) have no effect: strip them like `python -OO`
+    // instead of emitting `_ = "...";` for Zig to parse and discard
+    if (expr == .constant and expr.constant.value == .string) return;
+
     try self.emitIndent();
 
     // Special handling for print()
@@ -789,13 +823,6 @@ pub fn genExprStmt(self: *NativeCodegen, expr: ast.Node) CodegenError!void {
     // Track if we added "_ = " prefix - if so, we ALWAYS need a semicolon
     var added_discard_prefix = false;
 
-    // Discard string constants (docstrings) by assigning to _
-    // Zig requires all non-void values to be used
-    if (expr == .constant and expr.constant.value == .string) {
-        try self.emit("_ = ");
-        added_discard_prefix = true;
-    }
-
     // Discard return values from function calls (Zig requires all non-void values to be used)
     if (expr == .call and expr.call.func.* == .name) {
         const func_name = expr.call.func.name.id;
@@ -847,14 +874,10 @@ pub fn genExprStmt(self: *NativeCodegen, expr: ast.Node) CodegenError!void {
         const attr = expr.call.func.attribute;
         if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
             if (self.current_class_name) |class_name| {
-                var type_attr_key_buf: [512]u8 = undefined;
-                const type_attr_key = std.fmt.bufPrint(&type_attr_key_buf, "{s}.{s}", .{ class_name, attr.attr }) catch null;
-                if (type_attr_key) |key| {
-                    if (self.class_type_attrs.get(key)) |_| {
-                        // This is a type attribute call - it returns a value
-                        try self.emit("_ = ");
-                        added_discard_prefix = true;
-                    }
+                if (self.getClassTypeAttr(class_name, attr.attr)) |_| {
+                    // This is a type attribute call - it returns a value
+                    try self.emit("_ = ");
+                    added_discard_prefix = true;
                 }
             }
         }
@@ -940,16 +963,11 @@ pub fn genExprStmt(self: *NativeCodegen, expr: ast.Node) CodegenError!void {
         // Check for labeled blocks (e.g., "blk: {", "sub_0: {", "slice_1: {", "comp_2: {")
         // Pattern: identifier followed by colon and space then brace
         const is_labeled_block = blk: {
+            // Every label pattern below needs ": {" somewhere - scan for it once
+            if (std.mem.indexOf(u8, generated, ": {") == null) break :blk false;
             // Check for common label patterns
             if (std.mem.indexOf(u8, generated, "blk: {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "sub_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "slice_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "comp_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "dict_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "gen_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "idx_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "str_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
-            if (std.mem.indexOf(u8, generated, "arr_") != null and std.mem.indexOf(u8, generated, ": {") != null) break :blk true;
+            if (containsLabeledBlockPrefix(generated)) break :blk true;
             // Generic check: look for pattern like "word_N: {" at the start
             if (generated.len >= 6) {
                 // Check if starts with a label pattern (letters/underscore followed by digits, then ": {")
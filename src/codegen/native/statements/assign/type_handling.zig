@@ -2,6 +2,7 @@
 const std = @import("std");
 const ast = @import("ast");
 const NativeCodegen = @import("../../main.zig").NativeCodegen;
+const mutation_analyzer = @import("../../../../analysis/native_types/mutation_analyzer.zig");
 
 /// Check if a list contains only literal values
 pub fn isConstantList(list: ast.Node.List) bool {
@@ -52,7 +53,6 @@ pub fn isConstantArray(self: *NativeCodegen, assign: ast.Node.Assign, var_name:
 
     // Check mutation analysis - if variable will be mutated, use ArrayList not array
     if (self.mutation_info) |mutations| {
-        const mutation_analyzer = @import("../../../../analysis/native_types/mutation_analyzer.zig");
         if (mutation_analyzer.hasListMutation(mutations.*, var_name)) {
             return false; // Will be mutated -> ArrayList, not array
         }
@@ -62,9 +62,10 @@ pub fn isConstantArray(self: *NativeCodegen, assign: ast.Node.Assign, var_name:
 }
 
 /// Check if assignment value should be an ArrayList
-pub fn isArrayList(self: *NativeCodegen, assign: ast.Node.Assign, var_name: []const u8) bool {
+/// `is_constant_array` is the caller's isConstantArray result, so the list scan
+/// and mutation lookup are not repeated here
+pub fn isArrayList(self: *NativeCodegen, assign: ast.Node.Assign, var_name: []const u8, is_constant_array: bool) bool {
     if (assign.value.* != .list) return false;
-    const list = assign.value.list;
 
     // Check if variable has explicit list[T] type annotation
     // Type annotations take priority over value inference
@@ -75,55 +76,40 @@ pub fn isArrayList(self: *NativeCodegen, assign: ast.Node.Assign, var_name: []co
         }
     }
 
-    // Non-constant lists always become ArrayList
-    if (!isConstantList(list) or !allSameType(list.elts)) return true;
-
-    // Constant lists that will be mutated become ArrayList
-    if (self.mutation_info) |mutations| {
-        const mutation_analyzer = @import("../../../../analysis/native_types/mutation_analyzer.zig");
-        if (mutation_analyzer.hasListMutation(mutations.*, var_name)) {
-            return true; // Will be mutated -> ArrayList
-        }
-    }
-
-    return false; // Constant, homogeneous, not mutated -> fixed array
+    // Non-constant, heterogeneous or mutated lists become ArrayList
+    return !is_constant_array;
 }
 
+/// String methods that allocate and return new strings
+/// NOTE: strip/lstrip/rstrip use std.mem.trim - they DON'T allocate!
+const AllocatingStringMethods = std.StaticStringMap(void).initComptime(.{
+    .{ "upper", {} },   .{ "lower", {} },
+    .{ "replace", {} }, .{ "capitalize", {} },
+    .{ "title", {} },   .{ "swapcase", {} },
+    .{ "center", {} },  .{ "ljust", {} },
+    .{ "rjust", {} },   .{ "join", {} },
+});
+
+/// Built-in functions whose result is a freshly allocated buffer
+const AllocatingBuiltins = std.StaticStringMap(void).initComptime(.{
+    .{ "sorted", {} },
+    .{ "reversed", {} },
+});
+
 /// Check if value allocates memory (string operations, sorted, etc.)
 pub fn isAllocatedString(self: *NativeCodegen, value: ast.Node) bool {
     if (value == .call) {
-        // String method calls that allocate new strings
-        if (value.call.func.* == .attribute) {
-            const attr = value.call.func.attribute;
-            const obj_type = self.type_inferrer.inferExpr(attr.value.*) catch return false;
-
-            if (obj_type == .string) {
-                const method_name = attr.attr;
-                // All string methods that allocate and return new strings
-                // NOTE: strip/lstrip/rstrip use std.mem.trim - they DON'T allocate!
-                const allocating_methods = [_][]const u8{
-                    "upper",   "lower",
-                    "replace", "capitalize",
-                    "title",   "swapcase",
-                    "center",  "ljust",
-                    "rjust",   "join",
-                };
-
-                for (allocating_methods) |method| {
-                    if (std.mem.eql(u8, method_name, method)) {
-                        return true;
-                    }
-                }
-            }
-        }
-        // Built-in functions that allocate: sorted(), reversed()
-        if (value.call.func.* == .name) {
-            const func_name = value.call.func.name.id;
-            if (std.mem.eql(u8, func_name, "sorted") or
-                std.mem.eql(u8, func_name, "reversed"))
-            {
-                return true;
-            }
+        switch (value.call.func.*) {
+            // String method calls that allocate new strings
+            .attribute => |attr| {
+                // Check the method name first - it's a hash probe, inference is not
+                if (!AllocatingStringMethods.has(attr.attr)) return false;
+                const obj_type = self.type_inferrer.inferExpr(attr.value.*) catch return false;
+                return obj_type == .string;
+            },
+            // Built-in functions that allocate: sorted(), reversed()
+            .name => |func_name| return AllocatingBuiltins.has(func_name.id),
+            else => return false,
         }
     }
     // String concatenation allocates: s1 + s2
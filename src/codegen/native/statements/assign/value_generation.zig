@@ -6,6 +6,7 @@ const CodegenError = @import("../../main.zig").CodegenError;
 const helpers = @import("../assign_helpers.zig");
 const deferCleanup = @import("../assign_defer.zig");
 const zig_keywords = @import("zig_keywords");
+const NativeType = @import("../../../../analysis/native_types.zig").NativeType;
 
 /// Generate tuple unpacking assignment: a, b = (1, 2)
 pub fn genTupleUnpack(self: *NativeCodegen, assign: ast.Node.Assign, target_tuple: ast.Node.Tuple) CodegenError!void {
@@ -146,9 +147,6 @@ pub fn emitVarDeclaration(
 
 /// Generate ArrayList initialization from list literal
 pub fn genArrayListInit(self: *NativeCodegen, var_name: []const u8, list: ast.Node.List) CodegenError!void {
-    const native_types = @import("../../../../analysis/native_types.zig");
-    const NativeType = native_types.NativeType;
-
     // Check if variable was declared BEFORE this current assignment (e.g., global variable with type annotation)
     // Note: isDeclared returns true even if we just declared in the same statement, so we need
     // to check isGlobalVar which indicates pre-existing type annotation
@@ -177,14 +175,19 @@ pub fn genArrayListInit(self: *NativeCodegen, var_name: []const u8, list: ast.No
 
     // Check if this is a list of callables (needs wrapping)
     const is_callable_list = @as(std.meta.Tag(NativeType), elem_type) == .callable;
+    const actual_name = self.var_renames.get(var_name) orelse var_name;
+
+    // Element count is known statically - allocate once, then append without growth checks
+    if (list.elts.len > 0) {
+        try self.emitIndent();
+        try self.emitFmt("try {s}.ensureTotalCapacityPrecise(__global_allocator, {d});\n", .{ actual_name, list.elts.len });
+    }
 
     // Append elements
     for (list.elts) |elem| {
         try self.emitIndent();
-        try self.emit("try ");
-        const actual_name = self.var_renames.get(var_name) orelse var_name;
         try self.emit(actual_name);
-        try self.emit(".append(__global_allocator, ");
+        try self.emit(".appendAssumeCapacity(");
 
         // For tuples in pre-declared ArrayLists (with struct element type),
         // generate named field syntax: .{ .@"0" = val1, .@"1" = val2 }
@@ -214,9 +217,6 @@ pub fn genArrayListInit(self: *NativeCodegen, var_name: []const u8, list: ast.No
 /// Generate an element for a list of callables (PyCallable)
 /// Wraps lambdas, classes, and other callable elements in PyCallable.fromAny
 fn genCallableElement(self: *NativeCodegen, elem: ast.Node, elem_type: anytype) CodegenError!void {
-    const native_types = @import("../../../../analysis/native_types.zig");
-    const NativeType = native_types.NativeType;
-
     const elem_tag = @as(std.meta.Tag(NativeType), elem_type);
 
     switch (elem_tag) {
@@ -272,7 +272,7 @@ pub fn genStringConcat(self: *NativeCodegen, assign: ast.Node.Assign, var_name:
     var parts = std.ArrayList(ast.Node){};
     defer parts.deinit(self.allocator);
 
-    try helpers.flattenConcat(self, assign.value.*, &parts);
+    try helpers.flattenConcat(self, assign.value.binop, &parts);
 
     // Get allocator name based on scope
     const alloc_name = if (self.symbol_table.currentScopeLevel() > 0) "__global_allocator" else "allocator";
@@ -291,6 +291,13 @@ pub fn genStringConcat(self: *NativeCodegen, assign: ast.Node.Assign, var_name:
     try deferCleanup.emitStringConcatDefer(self, var_name, is_first_assignment);
 }
 
+/// Methods whose result is an ArrayList (dict.values(), dict.keys(), str.split())
+const ArrayListReturningMethods = std.StaticStringMap(void).initComptime(.{
+    .{ "values", {} },
+    .{ "keys", {} },
+    .{ "split", {} },
+});
+
 /// Track variable metadata after assignment
 pub fn trackVariableMetadata(
     self: *NativeCodegen,
@@ -299,10 +306,16 @@ pub fn trackVariableMetadata(
     is_constant_array: bool,
     is_array_slice: bool,
     assign: ast.Node.Assign,
+    inferred_value_type: NativeType,
 ) CodegenError!void {
     // Track local variable type for current function/method scope
     // This helps avoid type shadowing issues when the same variable name is used in different methods
-    const value_type = self.type_inferrer.inferExpr(assign.value.*) catch .unknown;
+    // genAssign's scoped inference only differs from the global inferrer for names and
+    // the operators it recurses through; for every other value kind reuse its result
+    const value_type = switch (assign.value.*) {
+        .name, .unaryop, .binop => self.type_inferrer.inferExpr(assign.value.*) catch .unknown,
+        else => inferred_value_type,
+    };
     try self.setLocalVarType(var_name, value_type);
 
     // Track if this variable holds a constant array
@@ -317,98 +330,82 @@ pub fn trackVariableMetadata(
         try self.array_slice_vars.put(var_name_copy, {});
     }
 
-    // Track ArrayList variables (dict.values(), dict.keys(), str.split() return ArrayList)
-    if (is_first_assignment and assign.value.* == .call) {
-        const call = assign.value.call;
-        if (call.func.* == .attribute) {
-            const attr = call.func.attribute;
-            if (std.mem.eql(u8, attr.attr, "values") or
-                std.mem.eql(u8, attr.attr, "keys") or
-                std.mem.eql(u8, attr.attr, "split"))
-            {
-                // dict.values(), dict.keys(), str.split() return ArrayList
-                const var_name_copy = try self.allocator.dupe(u8, var_name);
-                try self.arraylist_vars.put(var_name_copy, {});
-            }
-        }
-    }
-
-    // Track list comprehension variables (generates ArrayList)
-    if (is_first_assignment and assign.value.* == .listcomp) {
-        const var_name_copy = try self.allocator.dupe(u8, var_name);
-        try self.arraylist_vars.put(var_name_copy, {});
-    }
-
-    // Track dict comprehension variables (generates HashMap)
-    if (is_first_assignment and assign.value.* == .dictcomp) {
-        const var_name_copy = try self.allocator.dupe(u8, var_name);
-        try self.dict_vars.put(var_name_copy, {});
-    }
-
-    // Track dict literal variables (generates HashMap)
-    if (is_first_assignment and assign.value.* == .dict) {
-        const var_name_copy = try self.allocator.dupe(u8, var_name);
-        try self.dict_vars.put(var_name_copy, {});
-    }
-
     const lambda_closure = @import("../../expressions/lambda_closure.zig");
     const lambda_mod = @import("../../expressions/lambda.zig");
 
-    // Track closure factories: make_adder = lambda x: lambda y: x + y
-    if (assign.value.* == .lambda and assign.value.lambda.body.* == .lambda) {
-        try lambda_closure.markAsClosureFactory(self, var_name);
-    }
-
-    // Track simple closures: x = 10; f = lambda y: y + x (captures outer variable)
-    if (assign.value.* == .lambda) {
-        // Check if this lambda captures outer variables
-        if (lambda_mod.lambdaCapturesVars(self, assign.value.lambda)) {
-            // This lambda generated a closure struct, mark it
-            try lambda_closure.markAsClosure(self, var_name);
-        } else {
-            // Simple lambda (no captures) - track as function pointer
-            const key = try self.allocator.dupe(u8, var_name);
-            try self.lambda_vars.put(key, {});
-
-            // Register lambda return type for type inference
-            const return_type = try lambda_mod.getLambdaReturnType(self, assign.value.lambda);
-            try self.type_inferrer.func_return_types.put(var_name, return_type);
-        }
-    }
-
-    // Track closure instances: add_five = make_adder(5)
-    if (assign.value.* == .call and assign.value.call.func.* == .name) {
-        const called_func = assign.value.call.func.name.id;
-        if (self.closure_factories.contains(called_func)) {
-            // This is calling a closure factory, so the result is a closure
-            try lambda_closure.markAsClosure(self, var_name);
-        }
-    }
+    // Resolve the value's node kind (and a call's callee kind) once
+    switch (assign.value.*) {
+        .call => |call| switch (call.func.*) {
+            .attribute => |attr| {
+                // Track ArrayList variables (dict.values(), dict.keys(), str.split() return ArrayList)
+                if (is_first_assignment and ArrayListReturningMethods.has(attr.attr)) {
+                    const var_name_copy = try self.allocator.dupe(u8, var_name);
+                    try self.arraylist_vars.put(var_name_copy, {});
+                }
 
-    // Track closure instances from method calls: adder = obj.get_adder()
-    // where get_adder() returns a lambda that captures self
-    if (assign.value.* == .call and assign.value.call.func.* == .attribute) {
-        const attr = assign.value.call.func.attribute;
-        // Check if obj is a class instance and method is registered as closure-returning
-        // First, try to get the type of the object being called on
-        if (attr.value.* == .name) {
-            const obj_name = attr.value.name.id;
-            const method_name = attr.attr;
-
-            // Look up the object's type to find its class name
-            if (self.getVarType(obj_name)) |obj_type| {
-                if (obj_type == .class_instance) {
-                    const class_name = obj_type.class_instance;
-                    // Check if ClassName.method_name is registered as closure-returning
-                    const key = try std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class_name, method_name });
-                    defer self.allocator.free(key);
-
-                    if (self.closure_returning_methods.contains(key)) {
-                        // This method returns a closure, mark the variable
-                        try lambda_closure.markAsClosure(self, var_name);
+                // Track closure instances from method calls: adder = obj.get_adder()
+                // where get_adder() returns a lambda that captures self
+                // Check if obj is a class instance and method is registered as closure-returning
+                if (attr.value.* == .name) {
+                    const obj_name = attr.value.name.id;
+                    const method_name = attr.attr;
+
+                    // Look up the object's type to find its class name
+                    if (self.getVarType(obj_name)) |obj_type| {
+                        if (obj_type == .class_instance) {
+                            const class_name = obj_type.class_instance;
+                            // Check if ClassName.method_name is registered as closure-returning
+                            const key = try std.mem.concat(self.allocator, u8, &.{ class_name, ".", method_name });
+                            defer self.allocator.free(key);
+
+                            if (self.closure_returning_methods.contains(key)) {
+                                // This method returns a closure, mark the variable
+                                try lambda_closure.markAsClosure(self, var_name);
+                            }
+                        }
                     }
                 }
+            },
+            // Track closure instances: add_five = make_adder(5)
+            .name => |func_name| {
+                if (self.closure_factories.contains(func_name.id)) {
+                    // This is calling a closure factory, so the result is a closure
+                    try lambda_closure.markAsClosure(self, var_name);
+                }
+            },
+            else => {},
+        },
+        // Track list comprehension variables (generates ArrayList)
+        .listcomp => if (is_first_assignment) {
+            const var_name_copy = try self.allocator.dupe(u8, var_name);
+            try self.arraylist_vars.put(var_name_copy, {});
+        },
+        // Track dict comprehension and dict literal variables (generate HashMap)
+        .dictcomp, .dict => if (is_first_assignment) {
+            const var_name_copy = try self.allocator.dupe(u8, var_name);
+            try self.dict_vars.put(var_name_copy, {});
+        },
+        .lambda => |lambda| {
+            // Track closure factories: make_adder = lambda x: lambda y: x + y
+            if (lambda.body.* == .lambda) {
+                try lambda_closure.markAsClosureFactory(self, var_name);
             }
-        }
+
+            // Track simple closures: x = 10; f = lambda y: y + x (captures outer variable)
+            // Check if this lambda captures outer variables
+            if (lambda_mod.lambdaCapturesVars(self, lambda)) {
+                // This lambda generated a closure struct, mark it
+                try lambda_closure.markAsClosure(self, var_name);
+            } else {
+                // Simple lambda (no captures) - track as function pointer
+                const key = try self.allocator.dupe(u8, var_name);
+                try self.lambda_vars.put(key, {});
+
+                // Register lambda return type for type inference
+                const return_type = try lambda_mod.getLambdaReturnType(self, lambda);
+                try self.type_inferrer.func_return_types.put(var_name, return_type);
+            }
+        },
+        else => {},
     }
 }
@@ -77,16 +77,7 @@ pub fn emitComptimeAssignment(
         .string => |v| {
             // Escape the string properly
             try self.emit("\"");
-            for (v) |c| {
-                switch (c) {
-                    '\n' => try self.emit("\\n"),
-                    '\r' => try self.emit("\\r"),
-                    '\t' => try self.emit("\\t"),
-                    '\\' => try self.emit("\\\\"),
-                    '"' => try self.emit("\\\""),
-                    else => try self.output.append(self.allocator, c),
-                }
-            }
+            try self.emitEscapedString(v);
             try self.emit("\"");
         },
         .list => |items| {
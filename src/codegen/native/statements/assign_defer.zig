@@ -109,20 +109,20 @@ pub fn emitDictDefer(self: *NativeCodegen, var_name: []const u8, assign_value: a
     // If needs value cleanup, free all string values before deinit
     if (needs_cleanup) {
         try self.emitIndent();
-        try self.output.writer(self.allocator).print("defer {{\n", .{});
+        try self.emit("defer {\n");
         self.indent();
         try self.emitIndent();
-        try self.output.writer(self.allocator).print("var iter = {s}.valueIterator();\n", .{var_name});
+        try self.emitFmt("var iter = {s}.valueIterator();\n", .{var_name});
         try self.emitIndent();
         try self.emit("while (iter.next()) |value| {\n");
         self.indent();
         try self.emitIndent();
-        try self.output.writer(self.allocator).print("{s}.free(value.*);\n", .{alloc_name});
+        try self.emitFmt("{s}.free(value.*);\n", .{alloc_name});
         self.dedent();
         try self.emitIndent();
         try self.emit("}\n");
         try self.emitIndent();
-        try self.output.writer(self.allocator).print("{s}.deinit();\n", .{var_name});
+        try self.emitFmt("{s}.deinit();\n", .{var_name});
         self.dedent();
         try self.emitIndent();
         try self.emit("}\n");
@@ -150,23 +150,22 @@ pub fn emitDeferCleanups(
     is_allocated_string: bool,
     assign_value: ast.Node,
 ) CodegenError!void {
-    // Add defer cleanup for ArrayLists (only on first assignment)
-    if (is_first_assignment and is_arraylist) {
-        try emitArrayListDefer(self, var_name);
-    }
+    // Cleanups are only registered where the variable is declared
+    if (!is_first_assignment) return;
 
-    // Add defer cleanup for list comprehensions (return slices, not ArrayLists)
-    if (is_first_assignment and is_listcomp) {
+    // The flags come from the value's node kind (list literal, listcomp, dict literal,
+    // allocating call), so at most one applies - stop at the first match
+    if (is_arraylist) {
+        // Add defer cleanup for ArrayLists
+        try emitArrayListDefer(self, var_name);
+    } else if (is_listcomp) {
+        // Add defer cleanup for list comprehensions (return slices, not ArrayLists)
         try emitListCompDefer(self, var_name);
-    }
-
-    // Add defer cleanup for dicts (only on first assignment)
-    if (is_first_assignment and is_dict) {
+    } else if (is_dict) {
+        // Add defer cleanup for dicts
         try emitDictDefer(self, var_name, assign_value);
-    }
-
-    // Add defer cleanup for allocated strings (only on first assignment)
-    if (is_first_assignment and is_allocated_string) {
+    } else if (is_allocated_string) {
+        // Add defer cleanup for allocated strings
         try emitAllocatedStringDefer(self, var_name);
     }
 }
@@ -71,21 +71,31 @@ pub fn valueContainsName(node: ast.Node, name: []const u8) bool {
 
 /// Flatten nested string concatenation into a list of parts
 /// (s1 + " ") + s2 becomes [s1, " ", s2]
-pub fn flattenConcat(self: *NativeCodegen, node: ast.Node, parts: *std.ArrayList(ast.Node)) CodegenError!void {
-    if (node == .binop and node.binop.op == .Add) {
-        // Check if this is string concat
-        const left_type = try self.type_inferrer.inferExpr(node.binop.left.*);
-        const right_type = try self.type_inferrer.inferExpr(node.binop.right.*);
+/// `binop` must already be known to be a string concat (callers check it first).
+/// Iterative (explicit worklist) so long left-nested chains don't recurse per operand
+pub fn flattenConcat(self: *NativeCodegen, binop: ast.Node.BinOp, parts: *std.ArrayList(ast.Node)) CodegenError!void {
+    var stack = std.ArrayList(ast.Node){};
+    defer stack.deinit(self.allocator);
+    try stack.append(self.allocator, binop.right.*);
+    try stack.append(self.allocator, binop.left.*);
 
-        if (left_type == .string or right_type == .string) {
-            // Recursively flatten left side
-            try flattenConcat(self, node.binop.left.*, parts);
-            // Recursively flatten right side
-            try flattenConcat(self, node.binop.right.*, parts);
-            return;
+    while (stack.pop()) |cur| {
+        if (cur == .binop and cur.binop.op == .Add) {
+            // Check if this is string concat. The right operand of a left-nested
+            // chain is usually a leaf, so infer it first and only infer the
+            // (deep) left side when the right side is not a string.
+            const is_string_concat = (try self.type_inferrer.inferExpr(cur.binop.right.*)) == .string or
+                (try self.type_inferrer.inferExpr(cur.binop.left.*)) == .string;
+
+            if (is_string_concat) {
+                // Push right first so the left side is flattened first
+                try stack.append(self.allocator, cur.binop.right.*);
+                try stack.append(self.allocator, cur.binop.left.*);
+                continue;
+            }
         }
-    }
 
-    // Not a string concat, just add the node
-    try parts.append(self.allocator, node);
+        // Not a string concat, just add the node
+        try parts.append(self.allocator, cur);
+    }
 }
@@ -76,8 +76,9 @@ pub fn genEnumerateLoop(self: *NativeCodegen, target: ast.Node, args: []ast.Node
     self.indent();
 
     // Generate index counter: var __enum_idx_N: usize = start;
-    // Use output buffer length as unique ID to avoid shadowing in nested loops
-    const unique_id = self.output.items.len;
+    // Use the shared block counter as unique ID to avoid shadowing in nested loops
+    const unique_id = self.block_label_counter;
+    self.block_label_counter += 1;
     try self.emitIndent();
     try self.emitFmt("var __enum_idx_{d}: usize = ", .{unique_id});
     if (start_value != 0) {
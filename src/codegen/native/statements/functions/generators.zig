@@ -1,7 +1,6 @@
 /// Function and class definition code generation
 const std = @import("std");
 const ast = @import("ast");
-const hashmap_helper = @import("hashmap_helper");
 const NativeCodegen = @import("../../main.zig").NativeCodegen;
 const DecoratedFunction = @import("../../main.zig").DecoratedFunction;
 const CodegenError = @import("../../main.zig").CodegenError;
@@ -9,6 +8,16 @@ const allocator_analyzer = @import("allocator_analyzer.zig");
 const signature = @import("generators/signature.zig");
 const body = @import("generators/body.zig");
 
+/// Builtin type names recognized as class-level type attributes (e.g., int_class = int)
+const ClassTypeAttrNames = std.StaticStringMap(void).initComptime(.{
+    .{ "int", {} },
+    .{ "float", {} },
+    .{ "str", {} },
+    .{ "bool", {} },
+    .{ "list", {} },
+    .{ "dict", {} },
+});
+
 /// Builtin types that can be inherited from
 pub const BuiltinBaseInfo = struct {
     zig_type: []const u8,
@@ -276,7 +285,8 @@ pub fn genClassDef(self: *NativeCodegen, class: ast.Node.ClassDef) CodegenError!
             if (stmt == .function_def) {
                 const method = stmt.function_def;
                 const method_name = method.name;
-                if (std.mem.startsWith(u8, method_name, "test_") or std.mem.startsWith(u8, method_name, "test")) {
+                // "test" also covers the "test_" prefix
+                if (std.mem.startsWith(u8, method_name, "test")) {
                     // Check if method body has fallible operations (needs allocator param)
                     const method_needs_allocator = allocator_analyzer.functionNeedsAllocator(method);
 
@@ -330,50 +340,44 @@ pub fn genClassDef(self: *NativeCodegen, class: ast.Node.ClassDef) CodegenError!
     // Save func_local_uses before entering nested class methods
     // This is needed because nested class methods will call analyzeFunctionLocalUses
     // which clears the map - we need to restore it after generating the class
-    // to correctly determine if the class itself is used in the enclosing scope
-    var saved_func_local_uses = hashmap_helper.StringHashMap(void).init(self.allocator);
-    defer saved_func_local_uses.deinit();
-
-    // Also save func_local_mutations - nested class methods will clear it
-    // This prevents parent method's mutation info from being lost
-    var saved_func_local_mutations = hashmap_helper.StringHashMap(void).init(self.allocator);
-    defer saved_func_local_mutations.deinit();
-
-    // Also save nested_class_names - nested class methods will clear it
-    // This prevents parent method's nested class tracking from being lost
-    // (e.g., MyIndexable defined in outer scope, used later after nested class's methods are generated)
-    var saved_nested_class_names = hashmap_helper.StringHashMap(void).init(self.allocator);
-    defer saved_nested_class_names.deinit();
-
-    // Also save nested_class_bases - for base class default args
-    var saved_nested_class_bases = hashmap_helper.StringHashMap([]const u8).init(self.allocator);
-    defer saved_nested_class_bases.deinit();
-
-    if (self.class_nesting_depth > 1) {
-        // Copy current func_local_uses
-        var it = self.func_local_uses.iterator();
-        while (it.next()) |entry| {
-            try saved_func_local_uses.put(entry.key_ptr.*, {});
-        }
-
-        // Copy current func_local_mutations
-        var mut_it = self.func_local_mutations.iterator();
-        while (mut_it.next()) |entry| {
-            try saved_func_local_mutations.put(entry.key_ptr.*, {});
-        }
-
-        // Copy current nested_class_names
-        var ncn_it = self.nested_class_names.iterator();
-        while (ncn_it.next()) |entry| {
-            try saved_nested_class_names.put(entry.key_ptr.*, {});
-        }
-
-        // Copy current nested_class_bases
-        var ncb_it = self.nested_class_bases.iterator();
-        while (ncb_it.next()) |entry| {
-            try saved_nested_class_bases.put(entry.key_ptr.*, entry.value_ptr.*);
-        }
+    // to correctly determine if the class itself is used in the enclosing scope.
+    // Also save func_local_mutations (parent method's var/const decisions),
+    // nested_class_names (e.g., MyIndexable defined in outer scope, used later after
+    // nested class's methods are generated) and nested_class_bases (base class default args).
+    // The originals are moved aside untouched and the class works on clones, so
+    // restoring is a pointer swap instead of re-inserting every entry.
+    const saves_enclosing_scope = self.class_nesting_depth > 1;
+    const saved_func_local_uses = self.func_local_uses;
+    const saved_func_local_mutations = self.func_local_mutations;
+    const saved_nested_class_names = self.nested_class_names;
+    const saved_nested_class_bases = self.nested_class_bases;
+
+    if (saves_enclosing_scope) {
+        var uses = try saved_func_local_uses.clone();
+        errdefer uses.deinit();
+        var mutations = try saved_func_local_mutations.clone();
+        errdefer mutations.deinit();
+        var class_names = try saved_nested_class_names.clone();
+        errdefer class_names.deinit();
+        const class_bases = try saved_nested_class_bases.clone();
+        self.func_local_uses = uses;
+        self.func_local_mutations = mutations;
+        self.nested_class_names = class_names;
+        self.nested_class_bases = class_bases;
     }
+    // If codegen fails before the restore below, put the enclosing scope's maps
+    // back and free the clones so the caller's state stays consistent.
+    var enclosing_scope_restored = false;
+    errdefer if (saves_enclosing_scope and !enclosing_scope_restored) {
+        self.func_local_uses.deinit();
+        self.func_local_uses = saved_func_local_uses;
+        self.func_local_mutations.deinit();
+        self.func_local_mutations = saved_func_local_mutations;
+        self.nested_class_names.deinit();
+        self.nested_class_names = saved_nested_class_names;
+        self.nested_class_bases.deinit();
+        self.nested_class_bases = saved_nested_class_bases;
+    };
 
     // If we're entering a class while inside a method with 'self',
     // increment method_nesting_depth so nested class methods use __self
@@ -478,15 +482,8 @@ pub fn genClassDef(self: *NativeCodegen, class: ast.Node.ClassDef) CodegenError!
                 const attr_name = assign.targets[0].name.id;
                 if (assign.value.* == .name) {
                     const type_name = assign.value.name.id;
-                    if (std.mem.eql(u8, type_name, "int") or
-                        std.mem.eql(u8, type_name, "float") or
-                        std.mem.eql(u8, type_name, "str") or
-                        std.mem.eql(u8, type_name, "bool") or
-                        std.mem.eql(u8, type_name, "list") or
-                        std.mem.eql(u8, type_name, "dict"))
-                    {
-                        const key = try std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class.name, attr_name });
-                        try self.class_type_attrs.put(key, type_name);
+                    if (ClassTypeAttrNames.has(type_name)) {
+                        try self.putClassTypeAttr(class.name, attr_name, type_name);
                     }
                 }
             }
@@ -506,13 +503,7 @@ pub fn genClassDef(self: *NativeCodegen, class: ast.Node.ClassDef) CodegenError!
                 // Check if the value is a type reference (int, float, str, etc.)
                 if (assign.value.* == .name) {
                     const type_name = assign.value.name.id;
-                    if (std.mem.eql(u8, type_name, "int") or
-                        std.mem.eql(u8, type_name, "float") or
-                        std.mem.eql(u8, type_name, "str") or
-                        std.mem.eql(u8, type_name, "bool") or
-                        std.mem.eql(u8, type_name, "list") or
-                        std.mem.eql(u8, type_name, "dict"))
-                    {
+                    if (ClassTypeAttrNames.has(type_name)) {
                         try self.emit("\n");
                         try self.emitIndent();
                         try self.emit("// Class-level type attribute\n");
@@ -543,34 +534,17 @@ pub fn genClassDef(self: *NativeCodegen, class: ast.Node.ClassDef) CodegenError!
     // Restore func_local_uses from saved state (for nested classes)
     // This is critical: nested class methods call analyzeFunctionLocalUses which clears
     // the map. We need to restore the parent scope's uses so isVarUnused() works correctly.
-    if (self.class_nesting_depth > 1) {
-        self.func_local_uses.clearRetainingCapacity();
-        var restore_it = saved_func_local_uses.iterator();
-        while (restore_it.next()) |entry| {
-            try self.func_local_uses.put(entry.key_ptr.*, {});
-        }
-
-        // Also restore func_local_mutations so parent method's var/const decisions are correct
-        self.func_local_mutations.clearRetainingCapacity();
-        var restore_mut_it = saved_func_local_mutations.iterator();
-        while (restore_mut_it.next()) |entry| {
-            try self.func_local_mutations.put(entry.key_ptr.*, {});
-        }
-
-        // Also restore nested_class_names so parent method's class tracking works correctly
-        // (e.g., MyIndexable used after this nested class definition completes)
-        self.nested_class_names.clearRetainingCapacity();
-        var restore_ncn_it = saved_nested_class_names.iterator();
-        while (restore_ncn_it.next()) |entry| {
-            try self.nested_class_names.put(entry.key_ptr.*, {});
-        }
-
-        // Also restore nested_class_bases for base class default args
-        self.nested_class_bases.clearRetainingCapacity();
-        var restore_ncb_it = saved_nested_class_bases.iterator();
-        while (restore_ncb_it.next()) |entry| {
-            try self.nested_class_bases.put(entry.key_ptr.*, entry.value_ptr.*);
-        }
+    // func_local_mutations, nested_class_names and nested_class_bases are restored the same way.
+    if (saves_enclosing_scope) {
+        self.func_local_uses.deinit();
+        self.func_local_uses = saved_func_local_uses;
+        self.func_local_mutations.deinit();
+        self.func_local_mutations = saved_func_local_mutations;
+        self.nested_class_names.deinit();
+        self.nested_class_names = saved_nested_class_names;
+        self.nested_class_bases.deinit();
+        self.nested_class_bases = saved_nested_class_bases;
+        enclosing_scope_restored = true;
     }
 
     // Inherit parent methods that aren't overridden
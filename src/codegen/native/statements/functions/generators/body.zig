@@ -58,10 +58,8 @@ fn usesTypeAttribute(node: ast.Node, class_name: []const u8, class_type_attrs: a
         .attribute => |attr| {
             // Check for self.attr_name where attr_name is a type attribute
             if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                var key_buf: [512]u8 = undefined;
-                const key = std.fmt.bufPrint(&key_buf, "{s}.{s}", .{ class_name, attr.attr }) catch return false;
-                if (class_type_attrs.get(key)) |_| {
-                    return true;
+                if (class_type_attrs.get(class_name)) |attrs| {
+                    if (attrs.contains(attr.attr)) return true;
                 }
             }
             return usesTypeAttribute(attr.value.*, class_name, class_type_attrs);
@@ -130,11 +128,9 @@ fn usesRegularSelf(node: ast.Node, class_name: []const u8, class_type_attrs: any
         .attribute => |attr| {
             // Check for self.attr_name where attr_name is NOT a type attribute
             if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                var key_buf: [512]u8 = undefined;
-                const key = std.fmt.bufPrint(&key_buf, "{s}.{s}", .{ class_name, attr.attr }) catch return false;
                 // If it's a type attribute, this is NOT a regular self usage
-                if (class_type_attrs.get(key)) |_| {
-                    return false;
+                if (class_type_attrs.get(class_name)) |attrs| {
+                    if (attrs.contains(attr.attr)) return false;
                 }
                 // Skip unittest assertion methods that get transformed to runtime calls
                 // These methods don't actually use `self` in the generated Zig code
@@ -897,7 +893,7 @@ pub fn genFunctionBody(
             if (needs_rename) {
                 // Rename local variable to avoid shadowing module-level variable
                 // Use __local_X and add to var_renames so all references use the new name
-                const renamed = try std.fmt.allocPrint(self.allocator, "__local_{s}", .{arg.name});
+                const renamed = try std.mem.concat(self.allocator, u8, &.{ "__local_", arg.name });
                 try self.var_renames.put(arg.name, renamed);
 
                 try self.emitIndent();
@@ -1155,7 +1151,7 @@ pub fn genMethodBodyWithAllocatorInfo(
             // Check if this param would shadow a method name and needs renaming
             if (zig_keywords.wouldShadowMethod(arg.name)) {
                 // Add rename mapping: original -> renamed
-                const renamed = try std.fmt.allocPrint(self.allocator, "{s}_arg", .{arg.name});
+                const renamed = try std.mem.concat(self.allocator, u8, &.{ arg.name, "_arg" });
                 try self.var_renames.put(arg.name, renamed);
                 try renamed_params.append(self.allocator, arg.name);
             }
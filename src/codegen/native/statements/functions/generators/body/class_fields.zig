@@ -35,7 +35,8 @@ fn genClassFieldsImplWithDefaults(self: *NativeCodegen, class_name: []const u8,
 }
 
 /// Core implementation of field extraction
-fn genClassFieldsCore(self: *NativeCodegen, class_name: []const u8, init: ast.Node.FunctionDef, with_defaults: bool) CodegenError!void {
+/// with_defaults is comptime, so each wrapper above gets its own specialized copy
+fn genClassFieldsCore(self: *NativeCodegen, class_name: []const u8, init: ast.Node.FunctionDef, comptime with_defaults: bool) CodegenError!void {
     // Get constructor arg types from type inferrer (collected from call sites)
     const constructor_arg_types = self.type_inferrer.class_constructor_args.get(class_name);
 
@@ -96,18 +97,17 @@ fn genClassFieldsCore(self: *NativeCodegen, class_name: []const u8, init: ast.No
                         }
                     }
 
-                    // Use nativeTypeToZigType for proper type conversion (handles dict, list, etc.)
-                    // For unknown types, default to i64 (consistent with inferParamType fallback)
-                    const field_type_str = if (inferred == .unknown)
-                        try self.allocator.dupe(u8, "i64")
-                    else
-                        try self.nativeTypeToZigType(inferred);
-                    defer self.allocator.free(field_type_str);
-
                     try self.emitIndent();
                     // Escape field name if it's a Zig keyword (e.g., "test")
-                    const writer = self.output.writer(self.allocator);
-                    try zig_keywords.writeEscapedIdent(writer, field_name);
+                    try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), field_name);
+                    try self.emit(": ");
+                    // Write the type straight into the output (handles dict, list, etc.)
+                    // For unknown types, default to i64 (consistent with inferParamType fallback)
+                    if (inferred == .unknown) {
+                        try self.emit("i64");
+                    } else {
+                        try self.emitZigType(inferred);
+                    }
                     if (with_defaults) {
                         // Add default value for fields set at runtime (e.g., setUp)
                         const default_val = switch (inferred) {
@@ -118,10 +118,10 @@ fn genClassFieldsCore(self: *NativeCodegen, class_name: []const u8, init: ast.No
                             .dict, .list, .set => ".{}", // Empty struct init
                             else => "undefined",
                         };
-                        try writer.print(": {s} = {s},\n", .{ field_type_str, default_val });
-                    } else {
-                        try writer.print(": {s},\n", .{field_type_str});
+                        try self.emit(" = ");
+                        try self.emit(default_val);
                     }
+                    try self.emit(",\n");
                 }
             }
         }
@@ -16,6 +16,48 @@ const body = @import("../body.zig");
 // Type alias for builtin base info
 const BuiltinBaseInfo = generators.BuiltinBaseInfo;
 
+/// Field initializer from a `self.x = value` assignment in __init__
+const FieldInit = struct {
+    name: []const u8,
+    value: ast.Node,
+};
+
+/// Get the field name if stmt is a `self.x = value` assignment
+fn selfFieldTarget(stmt: ast.Node) ?[]const u8 {
+    if (stmt != .assign) return null;
+    const assign = stmt.assign;
+    if (assign.targets.len == 0 or assign.targets[0] != .attribute) return null;
+    const attr = assign.targets[0].attribute;
+    if (attr.value.* != .name or !std.mem.eql(u8, attr.value.name.id, "self")) return null;
+    return attr.attr;
+}
+
+/// Generate non-field statements of an __init__ body and collect its field assignments
+/// Single scan: field initializers are kept in source order for emitFieldInits
+fn collectFieldInits(self: *NativeCodegen, init_body: []ast.Node, field_inits: *std.ArrayList(FieldInit)) CodegenError!void {
+    for (init_body) |stmt| {
+        if (selfFieldTarget(stmt)) |field_name| {
+            try field_inits.append(self.allocator, .{ .name = field_name, .value = stmt.assign.value.* });
+        } else {
+            // Generate non-field statements (local var assignments, if statements, etc.)
+            try self.generateStmt(stmt);
+        }
+    }
+}
+
+/// Emit `.field = value,` struct literal initializers
+fn emitFieldInits(self: *NativeCodegen, field_inits: []const FieldInit) CodegenError!void {
+    for (field_inits) |field_init| {
+        try self.emitIndent();
+        // Escape field name if it's a Zig keyword (e.g., "test")
+        try self.emit(".");
+        try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), field_init.name);
+        try self.emit(" = ");
+        try self.genExpr(field_init.value);
+        try self.emit(",\n");
+    }
+}
+
 
 /// Generate default init() method for classes without __init__
 pub fn genDefaultInitMethod(self: *NativeCodegen, _: []const u8) CodegenError!void {
@@ -199,26 +241,11 @@ pub fn genInitMethod(
     // Note: allocator is always used for __dict__ initialization, so no discard needed
 
     // First pass: generate non-field assignments (local variables, control flow, etc.)
-    // These need to be executed BEFORE the struct is created
-    for (init.body) |stmt| {
-        const is_field_assign = blk: {
-            if (stmt == .assign) {
-                const assign = stmt.assign;
-                if (assign.targets.len > 0 and assign.targets[0] == .attribute) {
-                    const attr = assign.targets[0].attribute;
-                    if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                        break :blk true;
-                    }
-                }
-            }
-            break :blk false;
-        };
-
-        // Generate non-field statements (local var assignments, if statements, etc.)
-        if (!is_field_assign) {
-            try self.generateStmt(stmt);
-        }
-    }
+    // These need to be executed BEFORE the struct is created.
+    // Field assignments (self.x = ...) are collected in source order for the struct literal.
+    var field_inits = std.ArrayList(FieldInit){};
+    defer field_inits.deinit(self.allocator);
+    try collectFieldInits(self, init.body, &field_inits);
 
     // Generate return statement with field initializers
     try self.emitIndent();
@@ -226,26 +253,8 @@ pub fn genInitMethod(
     try self.emit("return @This(){\n");
     self.indent();
 
-    // Second pass: extract field assignments from __init__ body
-    for (init.body) |stmt| {
-        if (stmt == .assign) {
-            const assign = stmt.assign;
-            if (assign.targets.len > 0 and assign.targets[0] == .attribute) {
-                const attr = assign.targets[0].attribute;
-                if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                    const field_name = attr.attr;
-
-                    try self.emitIndent();
-                    // Escape field name if it's a Zig keyword (e.g., "test")
-                    try self.emit(".");
-                    try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), field_name);
-                    try self.emit(" = ");
-                    try self.genExpr(assign.value.*);
-                    try self.emit(",\n");
-                }
-            }
-        }
-    }
+    // Second pass: emit the collected field initializers
+    try emitFieldInits(self, field_inits.items);
 
     // Initialize __dict__ for dynamic attributes
     try self.emitIndent();
@@ -337,26 +346,11 @@ pub fn genInitMethodWithBuiltinBase(
     defer self.inside_init_method = false;
 
     // First pass: generate non-field assignments (local variables, control flow, etc.)
-    // These need to be executed BEFORE the struct is created
-    for (init.body) |stmt| {
-        const is_field_assign = blk: {
-            if (stmt == .assign) {
-                const assign = stmt.assign;
-                if (assign.targets.len > 0 and assign.targets[0] == .attribute) {
-                    const attr = assign.targets[0].attribute;
-                    if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                        break :blk true;
-                    }
-                }
-            }
-            break :blk false;
-        };
-
-        // Generate non-field statements (local var assignments, if statements, etc.)
-        if (!is_field_assign) {
-            try self.generateStmt(stmt);
-        }
-    }
+    // These need to be executed BEFORE the struct is created.
+    // Field assignments (self.x = ...) are collected in source order for the struct literal.
+    var field_inits = std.ArrayList(FieldInit){};
+    defer field_inits.deinit(self.allocator);
+    try collectFieldInits(self, init.body, &field_inits);
 
     // Generate return statement with field initializers
     try self.emitIndent();
@@ -382,18 +376,8 @@ pub fn genInitMethodWithBuiltinBase(
         for (parent_info.fields) |field| {
             // Check if this field is being initialized in __init__ body
             // If so, skip the default - user's init will handle it
-            const is_user_initialized = for (init.body) |stmt| {
-                if (stmt == .assign) {
-                    const assign = stmt.assign;
-                    if (assign.targets.len > 0 and assign.targets[0] == .attribute) {
-                        const attr = assign.targets[0].attribute;
-                        if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                            if (std.mem.eql(u8, attr.attr, field.name)) {
-                                break true;
-                            }
-                        }
-                    }
-                }
+            const is_user_initialized = for (field_inits.items) |field_init| {
+                if (std.mem.eql(u8, field_init.name, field.name)) break true;
             } else false;
 
             if (!is_user_initialized) {
@@ -403,25 +387,8 @@ pub fn genInitMethodWithBuiltinBase(
         }
     }
 
-    // Second pass: extract field assignments from __init__ body
-    for (init.body) |stmt| {
-        if (stmt == .assign) {
-            const assign = stmt.assign;
-            if (assign.targets.len > 0 and assign.targets[0] == .attribute) {
-                const attr = assign.targets[0].attribute;
-                if (attr.value.* == .name and std.mem.eql(u8, attr.value.name.id, "self")) {
-                    const field_name = attr.attr;
-
-                    try self.emitIndent();
-                    try self.emit(".");
-                    try zig_keywords.writeEscapedIdent(self.output.writer(self.allocator), field_name);
-                    try self.emit(" = ");
-                    try self.genExpr(assign.value.*);
-                    try self.emit(",\n");
-                }
-            }
-        }
-    }
+    // Second pass: emit the collected field initializers
+    try emitFieldInits(self, field_inits.items);
 
     // Initialize __dict__ for dynamic attributes
     try self.emitIndent();
@@ -481,10 +448,9 @@ pub fn genClassMethods(
                 total_count += 1;
                 if (arg.default == null) required_count += 1;
             }
-            // Store as "ClassName.method_name" for method call lookup
+            // Store under class -> method for method call lookup
             if (total_count > required_count) {
-                const method_key = try std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class.name, method.name });
-                try self.function_signatures.put(method_key, .{
+                try self.putMethodSignature(class.name, method.name, .{
                     .total_params = total_count,
                     .required_params = required_count,
                 });
@@ -495,7 +461,7 @@ pub fn genClassMethods(
             if (signature.getReturnedLambda(method.body)) |lambda| {
                 if (signature.lambdaCapturesSelf(lambda.body.*)) {
                     // Register as "ClassName.method_name"
-                    const key = try std.fmt.allocPrint(self.allocator, "{s}.{s}", .{ class.name, method.name });
+                    const key = try std.mem.concat(self.allocator, u8, &.{ class.name, ".", method.name });
                     try self.closure_returning_methods.put(key, {});
                 }
             }
@@ -143,13 +143,19 @@ fn checkExprForBigIntMethodCall(expr: ast.Node, method_name: []const u8, param_i
     return false;
 }
 
+/// Python type hint to NativeType mapping (comptime optimized)
+/// Shared with main/imports.zig for imported functions' return annotations
+pub const NativeTypeHints = std.StaticStringMap(NativeType).initComptime(.{
+    .{ "int", NativeType.int },
+    .{ "float", NativeType.float },
+    .{ "bool", NativeType.bool },
+    .{ "str", NativeType{ .string = .runtime } },
+});
+
 /// Convert Python type hint to NativeType (for type inference)
 pub fn pythonTypeToNativeType(type_hint: ?[]const u8) NativeType {
     if (type_hint) |hint| {
-        if (std.mem.eql(u8, hint, "int")) return .int;
-        if (std.mem.eql(u8, hint, "float")) return .float;
-        if (std.mem.eql(u8, hint, "bool")) return .bool;
-        if (std.mem.eql(u8, hint, "str")) return .{ .string = .runtime };
+        if (NativeTypeHints.get(hint)) |native_type| return native_type;
     }
     return .unknown;
 }
@@ -324,13 +330,11 @@ pub fn genFunctionSignature(
             // Only use inferred type if it's not .unknown
             const var_type_tag = @as(std.meta.Tag(@TypeOf(var_type)), var_type);
             if (var_type_tag != .unknown) {
-                const zig_type = try self.nativeTypeToZigType(var_type);
-                defer self.allocator.free(zig_type);
                 // Make optional if has default value
                 if (arg.default != null) {
                     try self.emit("?");
                 }
-                try self.emit(zig_type);
+                try self.emitZigType(var_type);
             } else {
                 // .unknown means we don't know - default to i64
                 if (arg.default != null) {
@@ -668,9 +672,7 @@ pub fn genMethodSignatureWithSkip(
                 if (arg.default != null) {
                     try self.emit("?");
                 }
-                const zig_type = try self.nativeTypeToZigType(var_type);
-                defer self.allocator.free(zig_type);
-                try self.emit(zig_type);
+                try self.emitZigType(var_type);
             } else {
                 // For anytype, we can't use ? prefix, so use anytype as-is
                 // The caller must handle the optionality
@@ -339,7 +339,7 @@ fn genRecursiveClosure(
     defer capture_renames.deinit(self.allocator);
 
     for (captured_vars) |var_name| {
-        const rename = try std.fmt.allocPrint(self.allocator, "__c_{s}", .{var_name});
+        const rename = try std.mem.concat(self.allocator, u8, &.{ "__c_", var_name });
         try capture_renames.append(self.allocator, rename);
         try self.var_renames.put(var_name, rename);
     }
@@ -246,6 +246,15 @@ fn isAssertRaisesContext(expr: ast.Node) bool {
     return false;
 }
 
+/// unittest.TestCase methods that are used as context managers
+const UnittestContextMethods = std.StaticStringMap(void).initComptime(.{
+    .{ "assertWarns", {} },
+    .{ "assertRaises", {} },
+    .{ "assertRaisesRegex", {} },
+    .{ "assertLogs", {} },
+    .{ "subTest", {} },
+});
+
 fn isUnittestContextManager(expr: ast.Node) bool {
     // Check for self.assertWarns(...), self.assertRaises(...), self.assertRaisesRegex(...), etc.
     if (expr == .call) {
@@ -258,12 +267,7 @@ fn isUnittestContextManager(expr: ast.Node) bool {
                 if (std.mem.eql(u8, obj_name, "self")) {
                     // Check for unittest context manager methods
                     const method_name = attr.attr;
-                    if (std.mem.eql(u8, method_name, "assertWarns") or
-                        std.mem.eql(u8, method_name, "assertRaises") or
-                        std.mem.eql(u8, method_name, "assertRaisesRegex") or
-                        std.mem.eql(u8, method_name, "assertLogs") or
-                        std.mem.eql(u8, method_name, "subTest"))
-                    {
+                    if (UnittestContextMethods.has(method_name)) {
                         return true;
                     }
                 }
@@ -344,7 +348,7 @@ fn hoistWithBodyVars(self: *NativeCodegen, body: []const ast.Node) CodegenError!
 /// Hoist a variable with @TypeOf(expr) for comptime type inference
 fn hoistVarWithExpr(self: *NativeCodegen, var_name: []const u8, init_expr: *const ast.Node) CodegenError!void {
     // Only hoist if not already declared in scope or previously hoisted
-    if (!self.isDeclared(var_name) and !self.hoisted_vars.contains(var_name)) {
+    if (!self.hoisted_vars.contains(var_name) and !self.isDeclared(var_name)) {
         try self.emitIndent();
         try self.emit("var ");
         try self.emit(var_name);
@@ -360,7 +364,7 @@ fn hoistVarWithExpr(self: *NativeCodegen, var_name: []const u8, init_expr: *cons
 /// Hoist a variable with an explicit type (for special cases like ContextManager)
 fn hoistVarWithType(self: *NativeCodegen, var_name: []const u8, type_name: []const u8) CodegenError!void {
     // Only hoist if not already declared in scope or previously hoisted
-    if (!self.isDeclared(var_name) and !self.hoisted_vars.contains(var_name)) {
+    if (!self.hoisted_vars.contains(var_name) and !self.isDeclared(var_name)) {
         try self.emitIndent();
         try self.emit("var ");
         try self.emit(var_name);
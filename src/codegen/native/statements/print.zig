@@ -6,18 +6,7 @@ const NativeCodegen = main.NativeCodegen;
 const CodegenError = main.CodegenError;
 
 /// Flatten nested string concat: (s1 + " ") + s2 => [s1, " ", s2]
-fn flattenConcat(self: *NativeCodegen, node: ast.Node, parts: *std.ArrayList(ast.Node)) CodegenError!void {
-    if (node == .binop and node.binop.op == .Add) {
-        const left_type = try self.type_inferrer.inferExpr(node.binop.left.*);
-        const right_type = try self.type_inferrer.inferExpr(node.binop.right.*);
-        if (left_type == .string or right_type == .string) {
-            try flattenConcat(self, node.binop.left.*, parts);
-            try flattenConcat(self, node.binop.right.*, parts);
-            return;
-        }
-    }
-    try parts.append(self.allocator, node);
-}
+const flattenConcat = @import("assign_helpers.zig").flattenConcat;
 
 /// Check if expression is an array slice (subscript slice of constant array var)
 fn isArraySlice(self: *NativeCodegen, node: ast.Node) bool {
@@ -83,10 +72,10 @@ pub fn genPrint(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
                 } else {
                     try self.emit("    for (__starred) |__elem| {\n");
                 }
-                try self.emit("        if (!__print_first) std.debug.print(\" \", .{});\n");
-                try self.emit("        __print_first = false;\n");
-                try self.emit("        std.debug.print(\"{d}\", .{__elem});\n");
-                try self.emit("    }\n");
+                try self.emit("        if (!__print_first) std.debug.print(\" \", .{});\n" ++
+                    "        __print_first = false;\n" ++
+                    "        std.debug.print(\"{d}\", .{__elem});\n" ++
+                    "    }\n");
             } else {
                 // Regular argument
                 try self.emit("    if (!__print_first) std.debug.print(\" \", .{});\n");
@@ -115,68 +104,37 @@ pub fn genPrint(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
         return;
     }
 
-    // Check if any arg is string concatenation, allocating method call, list, array, tuple, dict, bool, float, none, or unknown (PyObject)
+    // Classify args with one switch per arg: lists, arrays, tuples, dicts, bools, none,
+    // unknowns (PyObject) and sqlite types all need the complex printer, so stop at the first
     var has_string_concat = false;
     var has_allocating_call = false;
-    var has_list = false;
-    var has_array = false;
-    var has_tuple = false;
-    var has_dict = false;
-    var has_bool = false;
-    var has_float = false;
-    var has_none = false;
-    var has_unknown = false;
-    for (args) |arg| {
-        if (arg == .binop and arg.binop.op == .Add) {
-            const left_type = try self.type_inferrer.inferExpr(arg.binop.left.*);
-            const right_type = try self.type_inferrer.inferExpr(arg.binop.right.*);
-            if (left_type == .string or right_type == .string) {
-                has_string_concat = true;
-                break;
+    var needs_complex = false;
+    for (args, 0..) |arg, i| {
+        if (try isStringConcatArg(self, arg)) {
+            has_string_concat = true;
+            // Past a concatenation only sqlite values still force the complex printer
+            for (args[i + 1 ..]) |rest| {
+                const rest_type = try self.type_inferrer.inferExpr(rest);
+                if (rest_type == .sqlite_row or rest_type == .sqlite_rows) {
+                    needs_complex = true;
+                    break;
+                }
             }
+            break;
         }
         if (isAllocatingMethodCall(self, arg)) {
             has_allocating_call = true;
         }
-        const arg_type = try self.type_inferrer.inferExpr(arg);
-        if (arg_type == .list) {
-            has_list = true;
-        }
-        if (arg_type == .array) {
-            has_array = true;
-        }
-        if (arg_type == .tuple) {
-            has_tuple = true;
-        }
-        if (arg_type == .dict) {
-            has_dict = true;
-        }
-        if (arg_type == .bool) {
-            has_bool = true;
-        }
-        if (arg_type == .float) {
-            has_float = true;
-        }
-        if (arg_type == .none) {
-            has_none = true;
-        }
-        if (arg_type == .unknown) {
-            has_unknown = true;
-        }
-    }
-
-    // Check for sqlite types that need special handling
-    var has_sqlite = false;
-    for (args) |arg| {
-        const arg_type = try self.type_inferrer.inferExpr(arg);
-        if (arg_type == .sqlite_row or arg_type == .sqlite_rows) {
-            has_sqlite = true;
-            break;
+        switch (try self.type_inferrer.inferExpr(arg)) {
+            .list, .array, .tuple, .dict, .bool, .none, .unknown, .sqlite_row, .sqlite_rows => {
+                needs_complex = true;
+                break;
+            },
+            else => {},
         }
     }
 
-    // If we have lists, arrays, tuples, dicts, bools, none, unknowns (PyObject), or sqlite types, handle specially
-    if (has_list or has_array or has_tuple or has_dict or has_bool or has_none or has_unknown or has_sqlite) {
+    if (needs_complex) {
         try genPrintComplex(self, args);
         return;
     }
@@ -196,45 +154,45 @@ fn genPrintComplex(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
     // For lists and arrays, we need to print in Python format: [elem1, elem2, ...]
     for (args, 0..) |arg, i| {
         const arg_type = try self.type_inferrer.inferExpr(arg);
-        if (arg_type == .list or arg_type == .array) {
-            try genPrintList(self, arg, arg_type);
-        } else if (arg_type == .tuple) {
-            try genPrintTuple(self, arg, arg_type);
-        } else if (arg_type == .dict) {
-            try genPrintDict(self, arg);
-        } else if (arg_type == .unknown) {
-            // Unknown types (PyObject) - use runtime printer
-            // This handles both PyObject pointers and other dynamic types
-            try self.emit("runtime.printPyObject(");
-            try self.genExpr(arg);
-            try self.emit(");\n");
-        } else if (arg_type == .sqlite_row) {
-            // SQLite Row - use its print method
-            try self.genExpr(arg);
-            try self.emit(".print();\n");
-        } else if (arg_type == .sqlite_rows) {
-            // SQLite Rows slice - print each row on its own line (handled in for loop)
-            // This case shouldn't normally be hit directly, but handle it anyway
-            try self.emit("for (");
-            try self.genExpr(arg);
-            try self.emit(") |__row| { __row.print(); std.debug.print(\"\\n\", .{}); }\n");
-        } else if (arg_type == .bool) {
-            // Print booleans as Python-style True/False
-            try self.emit("std.debug.print(\"{s}\", .{if (");
-            try self.genExpr(arg);
-            try self.emit(") \"True\" else \"False\"});\n");
-        } else if (arg_type == .none) {
+        switch (arg_type) {
+            .list, .array => try genPrintList(self, arg, arg_type),
+            .tuple => try genPrintTuple(self, arg, arg_type),
+            .dict => try genPrintDict(self, arg),
+            .unknown => {
+                // Unknown types (PyObject) - use runtime printer
+                // This handles both PyObject pointers and other dynamic types
+                try self.emit("runtime.printPyObject(");
+                try self.genExpr(arg);
+                try self.emit(");\n");
+            },
+            .sqlite_row => {
+                // SQLite Row - use its print method
+                try self.genExpr(arg);
+                try self.emit(".print();\n");
+            },
+            .sqlite_rows => {
+                // SQLite Rows slice - print each row on its own line (handled in for loop)
+                // This case shouldn't normally be hit directly, but handle it anyway
+                try self.emit("for (");
+                try self.genExpr(arg);
+                try self.emit(") |__row| { __row.print(); std.debug.print(\"\\n\", .{}); }\n");
+            },
+            .bool => {
+                // Print booleans as Python-style True/False
+                try self.emit("std.debug.print(\"{s}\", .{if (");
+                try self.genExpr(arg);
+                try self.emit(") \"True\" else \"False\"});\n");
+            },
             // Print None
-            try self.emit("std.debug.print(\"None\", .{});\n");
-        } else {
-            // For non-list/tuple/bool args in mixed print, use std.debug.print
-            // Note: unknown types try {s} (works for string constants)
-            const fmt = if (arg_type == .unknown) "{s}" else arg_type.getPrintFormat();
-            try self.emit("std.debug.print(\"");
-            try self.emit(fmt);
-            try self.emit("\", .{");
-            try self.genExpr(arg);
-            try self.emit("});\n");
+            .none => try self.emit("std.debug.print(\"None\", .{});\n"),
+            else => {
+                // For non-list/tuple/bool args in mixed print, use std.debug.print
+                try self.emit("std.debug.print(\"");
+                try self.emit(arg_type.getPrintFormat());
+                try self.emit("\", .{");
+                try self.genExpr(arg);
+                try self.emit("});\n");
+            },
         }
         // Print space between args (except last)
         if (i < args.len - 1) {
@@ -285,10 +243,10 @@ fn genPrintList(self: *NativeCodegen, arg: ast.Node, arg_type: anytype) CodegenE
 
     try self.emit("        std.debug.print(\"");
     try self.emit(elem_fmt);
-    try self.emit("\", .{__elem});\n");
-    try self.emit("    }\n");
-    try self.emit("    std.debug.print(\"]\", .{});\n");
-    try self.emit("}\n");
+    try self.emit("\", .{__elem});\n" ++
+        "    }\n" ++
+        "    std.debug.print(\"]\", .{});\n" ++
+        "}\n");
 }
 
 /// Generate print for tuple types
@@ -328,66 +286,65 @@ fn genPrintDict(self: *NativeCodegen, arg: ast.Node) CodegenError!void {
     try self.emit("{\n");
     try self.emit("    const __dict = ");
     try self.genExpr(arg);
-    try self.emit(";\n");
-    try self.emit("    var __dict_iter = __dict.iterator();\n");
-    try self.emit("    var __dict_idx: usize = 0;\n");
-    try self.emit("    std.debug.print(\"{{\", .{});\n");
-    try self.emit("    while (__dict_iter.next()) |__entry| {\n");
-    try self.emit("        if (__dict_idx > 0) std.debug.print(\", \", .{});\n");
+    try self.emit(";\n" ++
+        "    var __dict_iter = __dict.iterator();\n" ++
+        "    var __dict_idx: usize = 0;\n" ++
+        "    std.debug.print(\"{{\", .{});\n" ++
+        "    while (__dict_iter.next()) |__entry| {\n" ++
+        "        if (__dict_idx > 0) std.debug.print(\", \", .{});\n");
     // Use comptime to detect key type: string keys get 'quotes', int keys don't
-    try self.emit("        const __key = __entry.key_ptr.*;\n");
-    try self.emit("        if (comptime @typeInfo(@TypeOf(__key)) == .pointer) {\n");
-    try self.emit("            std.debug.print(\"'{s}': \", .{__key});\n");
-    try self.emit("        } else {\n");
-    try self.emit("            std.debug.print(\"{d}: \", .{__key});\n");
-    try self.emit("        }\n");
-    try self.emit("        runtime.printValue(__entry.value_ptr.*);\n");
-    try self.emit("        __dict_idx += 1;\n");
-    try self.emit("    }\n");
-    try self.emit("    std.debug.print(\"}}\", .{});\n");
-    try self.emit("}\n");
+    try self.emit("        const __key = __entry.key_ptr.*;\n" ++
+        "        if (comptime @typeInfo(@TypeOf(__key)) == .pointer) {\n" ++
+        "            std.debug.print(\"'{s}': \", .{__key});\n" ++
+        "        } else {\n" ++
+        "            std.debug.print(\"{d}: \", .{__key});\n" ++
+        "        }\n" ++
+        "        runtime.printValue(__entry.value_ptr.*);\n" ++
+        "        __dict_idx += 1;\n" ++
+        "    }\n" ++
+        "    std.debug.print(\"}}\", .{});\n" ++
+        "}\n");
 }
 
-/// Generate print with temp vars for string concatenation or allocating calls
+/// Check if a print argument is a string concatenation (`a + b` with a string side)
+/// The right operand is inferred first: in left-nested chains it is usually a
+/// leaf, so the deep left side is only inferred when the right is not a string.
+fn isStringConcatArg(self: *NativeCodegen, arg: ast.Node) CodegenError!bool {
+    if (arg != .binop or arg.binop.op != .Add) return false;
+    return (try self.type_inferrer.inferExpr(arg.binop.right.*)) == .string or
+        (try self.type_inferrer.inferExpr(arg.binop.left.*)) == .string;
+}
+
+/// Generate print with temp vars for allocating calls
+/// String concatenations are not materialized: their flattened parts are
+/// printed back to back with one "{s}" each, so no temporary buffer is allocated
 fn genPrintWithTempVars(self: *NativeCodegen, args: []ast.Node) CodegenError!void {
     try self.emit("{\n");
     self.indent();
 
-    // Create temp vars for each concatenation or allocating method call
-    var temp_counter: usize = 0;
-    for (args) |arg| {
-        // Handle string concatenation
-        if (arg == .binop and arg.binop.op == .Add) {
-            const left_type = try self.type_inferrer.inferExpr(arg.binop.left.*);
-            const right_type = try self.type_inferrer.inferExpr(arg.binop.right.*);
-            if (left_type == .string or right_type == .string) {
-                try self.emitIndent();
-                try self.emitFmt("const _temp{d} = ", .{temp_counter});
-
-                // Flatten nested concatenations
-                var parts = std.ArrayList(ast.Node){};
-                defer parts.deinit(self.allocator);
-                try flattenConcat(self, arg, &parts);
-
-                // Get allocator name based on scope
-                const alloc_name = if (self.symbol_table.currentScopeLevel() > 0) "__global_allocator" else "allocator";
-
-                try self.emit("try std.mem.concat(");
-                try self.emit(alloc_name);
-                try self.emit(", u8, &[_][]const u8{ ");
-                for (parts.items, 0..) |part, j| {
-                    if (j > 0) try self.emit(", ");
-                    try self.genExpr(part);
-                }
-                try self.emit(" });\n");
-
-                try self.emitIndent();
-                try self.emitFmt("defer {s}.free(_temp{d});\n", .{ alloc_name, temp_counter });
-                temp_counter += 1;
-            }
+    // Flatten each concat arg once - both the format and the argument loops need it
+    const concat_parts = try self.allocator.alloc(?[]ast.Node, args.len);
+    @memset(concat_parts, null);
+    defer {
+        for (concat_parts) |maybe_parts| {
+            if (maybe_parts) |parts| self.allocator.free(parts);
         }
-        // Handle allocating method calls
-        else if (isAllocatingMethodCall(self, arg)) {
+        self.allocator.free(concat_parts);
+    }
+    for (args, concat_parts) |arg, *parts_out| {
+        if (try isStringConcatArg(self, arg)) {
+            var parts = std.ArrayList(ast.Node){};
+            errdefer parts.deinit(self.allocator);
+            try flattenConcat(self, arg.binop, &parts);
+            parts_out.* = try parts.toOwnedSlice(self.allocator);
+        }
+    }
+
+    // Create temp vars for each allocating method call
+    var temp_counter: usize = 0;
+    for (args, concat_parts) |arg, maybe_parts| {
+        if (maybe_parts != null) continue;
+        if (isAllocatingMethodCall(self, arg)) {
             try self.emitIndent();
             try self.emitFmt("const _temp{d}: []const u8 = ", .{temp_counter});
             try self.genExpr(arg);
@@ -403,9 +360,14 @@ fn genPrintWithTempVars(self: *NativeCodegen, args: []ast.Node) CodegenError!voi
     try self.emit("std.debug.print(\"");
 
     // Generate format string
-    for (args, 0..) |arg, i| {
-        const arg_type = try self.type_inferrer.inferExpr(arg);
-        try self.emit(arg_type.getPrintFormat());
+    for (args, concat_parts, 0..) |arg, maybe_parts, i| {
+        if (maybe_parts) |parts| {
+            // One "{s}" per concatenated part
+            for (parts) |_| try self.emit("{s}");
+        } else {
+            const arg_type = try self.type_inferrer.inferExpr(arg);
+            try self.emit(arg_type.getPrintFormat());
+        }
 
         if (i < args.len - 1) {
             try self.emit(" ");
@@ -414,18 +376,13 @@ fn genPrintWithTempVars(self: *NativeCodegen, args: []ast.Node) CodegenError!voi
 
     try self.emit("\\n\", .{");
 
-    // Generate arguments (use temp vars for concat and allocating calls)
+    // Generate arguments (concat parts inline, temp vars for allocating calls)
     temp_counter = 0;
-    for (args, 0..) |arg, i| {
-        // Use temp var for string concatenation
-        if (arg == .binop and arg.binop.op == .Add) {
-            const left_type = try self.type_inferrer.inferExpr(arg.binop.left.*);
-            const right_type = try self.type_inferrer.inferExpr(arg.binop.right.*);
-            if (left_type == .string or right_type == .string) {
-                try self.emitFmt("_temp{d}", .{temp_counter});
-                temp_counter += 1;
-            } else {
-                try self.genExpr(arg);
+    for (args, concat_parts, 0..) |arg, maybe_parts, i| {
+        if (maybe_parts) |parts| {
+            for (parts, 0..) |part, j| {
+                if (j > 0) try self.emit(", ");
+                try self.genExpr(part);
             }
         }
         // Use temp var for allocating method calls
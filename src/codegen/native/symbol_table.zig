@@ -4,10 +4,15 @@ const std = @import("std");
 const ast = @import("ast");
 const NativeType = @import("../../analysis/native_types.zig").NativeType;
 const hashmap_helper = @import("hashmap_helper");
+const allocator_analyzer = @import("statements/functions/allocator_analyzer.zig");
 
 const FnvSymbolMap = hashmap_helper.StringHashMap(SymbolInfo);
 const FnvClassDefMap = hashmap_helper.StringHashMap(ast.Node.ClassDef);
 const FnvStringMap = hashmap_helper.StringHashMap([]const u8);
+const FnvFunctionDefMap = hashmap_helper.StringHashMap(ast.Node.FunctionDef);
+const FnvMethodIndexMap = hashmap_helper.StringHashMap(FnvFunctionDefMap);
+const FnvResolvedMethodMap = hashmap_helper.StringHashMap(ResolvedMethod);
+const FnvResolvedClassMap = hashmap_helper.StringHashMap(FnvResolvedMethodMap);
 
 /// Symbol information
 pub const SymbolInfo = struct {
@@ -131,6 +136,22 @@ pub const MethodInfo = struct {
     is_static: bool,
 };
 
+/// Where a method lookup landed: the definition (borrowed from method_index)
+/// and the class along the inheritance chain that defines it
+const ResolvedMethod = struct {
+    func: *const ast.Node.FunctionDef,
+    class_name: []const u8,
+    // functionNeedsAllocator(func), filled in by the first resolveMethodCall
+    needs_allocator: ?bool = null,
+};
+
+/// Method call target as seen from a call site
+pub const MethodCall = struct {
+    /// Class along the inheritance chain that defines the method
+    class_name: []const u8,
+    needs_allocator: bool,
+};
+
 /// Class registry with method lookup
 pub const ClassRegistry = struct {
     allocator: std.mem.Allocator,
@@ -141,17 +162,43 @@ pub const ClassRegistry = struct {
     // Maps class name → parent class name (for inheritance)
     inheritance: FnvStringMap,
 
+    // Maps class name → (method name → FunctionDef), built once at registration
+    // so findMethod is a hash lookup per inheritance level instead of a body scan
+    method_index: FnvMethodIndexMap,
+
+    // Maps class name → (method name → ResolvedMethod) with inherited methods
+    // flattened in, filled lazily by findMethod so repeated lookups (hits and
+    // misses) skip the inheritance walk. Dropped on every registerClass, since
+    // a new class can change any existing chain (and method_index entries, which
+    // the resolved entries point into).
+    resolved_methods: FnvResolvedClassMap,
+
     pub fn init(allocator: std.mem.Allocator) ClassRegistry {
         return ClassRegistry{
             .allocator = allocator,
             .classes = FnvClassDefMap.init(allocator),
             .inheritance = FnvStringMap.init(allocator),
+            .method_index = FnvMethodIndexMap.init(allocator),
+            .resolved_methods = FnvResolvedClassMap.init(allocator),
         };
     }
 
     pub fn deinit(self: *ClassRegistry) void {
         self.classes.deinit();
         self.inheritance.deinit();
+        for (self.method_index.values()) |*methods| {
+            methods.deinit();
+        }
+        self.method_index.deinit();
+        self.clearResolvedMethods();
+        self.resolved_methods.deinit();
+    }
+
+    fn clearResolvedMethods(self: *ClassRegistry) void {
+        for (self.resolved_methods.values()) |*methods| {
+            methods.deinit();
+        }
+        self.resolved_methods.clearRetainingCapacity();
     }
 
     /// Register a class
@@ -160,6 +207,7 @@ pub const ClassRegistry = struct {
         class_name: []const u8,
         class_def: ast.Node.ClassDef,
     ) !void {
+        self.clearResolvedMethods();
         try self.classes.put(class_name, class_def);
 
         // Register inheritance if base classes exist
@@ -167,6 +215,19 @@ pub const ClassRegistry = struct {
             const parent = class_def.bases[0];
             try self.inheritance.put(class_name, parent);
         }
+
+        // Index methods by name (first definition wins, matching a body scan)
+        var methods = FnvFunctionDefMap.init(self.allocator);
+        errdefer methods.deinit();
+        for (class_def.body) |stmt| {
+            if (stmt == .function_def) {
+                const entry = try methods.getOrPut(stmt.function_def.name);
+                if (!entry.found_existing) entry.value_ptr.* = stmt.function_def;
+            }
+        }
+        const index_entry = try self.method_index.getOrPut(class_name);
+        if (index_entry.found_existing) index_entry.value_ptr.deinit();
+        index_entry.value_ptr.* = methods;
     }
 
     /// Find method in class (searches inheritance chain)
@@ -175,37 +236,83 @@ pub const ClassRegistry = struct {
         class_name: []const u8,
         method_name: []const u8,
     ) ?MethodInfo {
-        var current_class = class_name;
+        const found = if (self.resolveMethods(class_name)) |methods|
+            methods.get(method_name)
+        else |_|
+            self.walkMethod(class_name, method_name);
+        const resolved = found orelse return null;
+        return methodInfo(resolved.func.*, resolved.class_name);
+    }
+
+    /// Find the class defining a method and whether the method needs an allocator
+    /// The allocator analysis walks the method body, so its result is cached on the
+    /// resolved entry: once per method instead of once per call site
+    pub fn resolveMethodCall(
+        self: *ClassRegistry,
+        class_name: []const u8,
+        method_name: []const u8,
+    ) ?MethodCall {
+        const methods = self.resolveMethods(class_name) catch {
+            const resolved = self.walkMethod(class_name, method_name) orelse return null;
+            return .{
+                .class_name = resolved.class_name,
+                .needs_allocator = allocator_analyzer.functionNeedsAllocator(resolved.func.*),
+            };
+        };
+        const resolved = methods.getPtr(method_name) orelse return null;
+        if (resolved.needs_allocator == null) {
+            resolved.needs_allocator = allocator_analyzer.functionNeedsAllocator(resolved.func.*);
+        }
+        return .{ .class_name = resolved.class_name, .needs_allocator = resolved.needs_allocator.? };
+    }
 
-        // Search up inheritance chain
+    /// Walk the inheritance chain directly (when a resolved table can't be allocated)
+    fn walkMethod(
+        self: *ClassRegistry,
+        class_name: []const u8,
+        method_name: []const u8,
+    ) ?ResolvedMethod {
+        var current_class = class_name;
         while (true) {
-            // Look in current class
-            if (self.classes.get(current_class)) |class_def| {
-                for (class_def.body) |stmt| {
-                    if (stmt == .function_def) {
-                        const func = stmt.function_def;
-                        if (std.mem.eql(u8, func.name, method_name)) {
-                            return MethodInfo{
-                                .name = func.name,
-                                .class_name = current_class,
-                                .params = func.args,
-                                .return_type = null, // TODO: infer from body
-                                .is_static = false,
-                            };
-                        }
-                    }
+            if (self.method_index.getPtr(current_class)) |methods| {
+                if (methods.getPtr(method_name)) |func| {
+                    return .{ .func = func, .class_name = current_class };
                 }
             }
+            current_class = self.inheritance.get(current_class) orelse return null;
+        }
+    }
 
-            // Move to parent class
-            if (self.inheritance.get(current_class)) |parent| {
-                current_class = parent;
-            } else {
-                break; // No parent, method not found
+    /// Flatten a class's methods, nearest definition first, into resolved_methods
+    fn resolveMethods(self: *ClassRegistry, class_name: []const u8) !*FnvResolvedMethodMap {
+        if (self.resolved_methods.getPtr(class_name)) |methods| return methods;
+
+        var resolved = FnvResolvedMethodMap.init(self.allocator);
+        errdefer resolved.deinit();
+
+        var current_class = class_name;
+        while (true) {
+            if (self.method_index.getPtr(current_class)) |methods| {
+                for (methods.keys(), methods.values()) |name, *func| {
+                    const entry = try resolved.getOrPut(name);
+                    if (!entry.found_existing) entry.value_ptr.* = .{ .func = func, .class_name = current_class };
+                }
             }
+            current_class = self.inheritance.get(current_class) orelse break;
         }
 
-        return null;
+        try self.resolved_methods.put(class_name, resolved);
+        return self.resolved_methods.getPtr(class_name).?;
+    }
+
+    fn methodInfo(func: ast.Node.FunctionDef, class_name: []const u8) MethodInfo {
+        return MethodInfo{
+            .name = func.name,
+            .class_name = class_name,
+            .params = func.args,
+            .return_type = null, // TODO: infer from body
+            .is_static = false,
+        };
     }
 
     /// Check if class has method
@@ -1,12 +1,136 @@
 const std = @import("std");
 const compiler_utils = @import("compiler_utils.zig");
 
+/// Import rewrites for top-level runtime files copied into the build dir
+const runtime_import_patches = [_]compiler_utils.ImportPatch{
+    // Module imports become file imports for standalone compilation
+    .{ .from = "green_thread\")", .to = "green_thread.zig\")" },
+    .{ .from = "work_queue\")", .to = "work_queue.zig\")" },
+    .{ .from = "scheduler\")", .to = "scheduler.zig\")" },
+    .{ .from = "hashmap_helper\")", .to = "utils/hashmap_helper.zig\")" },
+    .{ .from = "allocator_helper\")", .to = "utils/allocator_helper.zig\")" },
+    .{ .from = "regex\")", .to = "regex/src/pyregex/regex.zig\")" },
+    .{ .from = "bigint\")", .to = "bigint.zig\")" },
+    // Relative utils imports use the local utils/ directory
+    .{ .from = "../../src/utils/", .to = "utils/" },
+};
+
+/// Top-level runtime files copied from packages/runtime/src into the build dir
+const runtime_src_dir = "packages/runtime/src";
+const runtime_files = [_][]const u8{ "runtime.zig", "runtime_format.zig", "pystring.zig", "pylist.zig", "dict.zig", "pyint.zig", "pyfloat.zig", "pybool.zig", "pytuple.zig", "async.zig", "asyncio.zig", "http.zig", "json.zig", "re.zig", "numpy_array.zig", "eval.zig", "exec.zig", "ast_executor.zig", "bytecode.zig", "eval_cache.zig", "compile.zig", "dynamic_import.zig", "dynamic_attrs.zig", "flask.zig", "requests.zig", "string_utils.zig", "comptime_helpers.zig", "math.zig", "closure_impl.zig", "sys.zig", "time.zig", "py_value.zig", "green_thread.zig", "scheduler.zig", "work_queue.zig", "unittest.zig", "datetime.zig", "pathlib.zig", "os.zig", "pyfile.zig", "io.zig", "hashlib.zig", "pickle.zig", "test_support.zig", "expr_parser.zig", "zlib.zig", "base64.zig", "pylong.zig" };
+
+/// Opt-in fast debug binaries (metal0_FAST_DEBUG=1): Zig's self-hosted x86_64 backend
+/// and linker skip LLVM entirely, trading runtime speed for much shorter edit-run cycles
+pub fn fastDebugRequested() bool {
+    if (@import("builtin").cpu.arch != .x86_64) return false;
+    const value = std.posix.getenv("metal0_FAST_DEBUG") orelse return false;
+    return std.mem.eql(u8, value, "1");
+}
+
 /// Get build directory (reuse .build for all processes)
 fn getBuildDir(allocator: std.mem.Allocator) ![]const u8 {
     _ = allocator;
     return ".build";
 }
 
+/// How top-level runtime files are written into the build dir
+const RuntimeStaging = enum {
+    /// Module imports rewritten to file imports (standalone exe/wasm builds)
+    patched,
+    /// Copied as-is (shared libs resolve imports via -I packages/runtime/src)
+    verbatim,
+};
+
+/// Runtime subdirectories copied recursively into the build dir
+const runtime_subdirs = [_][]const u8{ "http", "async", "json", "runtime", "pystring", "unittest", "gzip" };
+
+/// Copy top-level runtime files and runtime subdirectories into build_dir
+fn stageRuntime(allocator: std.mem.Allocator, build_dir: []const u8, comptime staging: RuntimeStaging) !void {
+    var arena = std.heap.ArenaAllocator.init(allocator);
+    defer arena.deinit();
+    const aa = arena.allocator();
+
+    // Skipped when the stamp shows the same sources were already staged this way
+    const runtime_key = compiler_utils.runtimeSourcesKey(@tagName(staging), runtime_src_dir, &runtime_files);
+    if (!compiler_utils.isRuntimeStaged(build_dir, runtime_key)) {
+        for (runtime_files) |file| {
+            const src_path = try std.fmt.allocPrint(aa, runtime_src_dir ++ "/{s}", .{file});
+            const dst_path = try std.fmt.allocPrint(aa, "{s}/{s}", .{ build_dir, file });
+
+            if (staging == .verbatim) {
+                // Verbatim copies go file-to-file without buffering contents in memory
+                std.fs.cwd().copyFile(src_path, std.fs.cwd(), dst_path, .{}) catch |err| {
+                    if (err == error.FileNotFound) continue;
+                    return err;
+                };
+                continue;
+            }
+
+            // Patch module imports to file imports for standalone compilation (single pass)
+            compiler_utils.copyPatchedFile(aa, src_path, dst_path, &runtime_import_patches) catch |err| {
+                if (err == error.FileNotFound) continue;
+                return err;
+            };
+        }
+        try compiler_utils.markRuntimeStaged(build_dir, runtime_key);
+    }
+
+    for (runtime_subdirs) |dir_name| {
+        try compiler_utils.copyRuntimeDir(aa, dir_name, build_dir);
+    }
+}
+
+/// Copy bigint package to the build dir
+fn stageBigint(allocator: std.mem.Allocator, build_dir: []const u8) !void {
+    const dst_path = try std.fmt.allocPrint(allocator, "{s}/bigint.zig", .{build_dir});
+    defer allocator.free(dst_path);
+    std.fs.cwd().copyFile("packages/bigint/src/bigint.zig", std.fs.cwd(), dst_path, .{}) catch |e| {
+        std.debug.print("Failed to copy bigint.zig: {any}\n", .{e});
+        return e;
+    };
+}
+
+/// Copy any compiled modules from .build/ to a per-process build dir
+/// (No-op when build_dir is .build itself, which would copy files onto themselves)
+fn stageCompiledModules(allocator: std.mem.Allocator, build_dir: []const u8) !void {
+    if (std.mem.eql(u8, build_dir, ".build")) return;
+
+    var build_iter_dir = std.fs.cwd().openDir(".build", .{ .iterate = true }) catch |err| {
+        // If .build doesn't exist, that's fine - no modules to copy
+        if (err == error.FileNotFound) return;
+        return err;
+    };
+    defer build_iter_dir.close();
+    var walker = build_iter_dir.iterate();
+    while (try walker.next()) |entry| {
+        if (entry.kind == .file and std.mem.endsWith(u8, entry.name, ".zig")) {
+            const src_path = try std.fmt.allocPrint(allocator, ".build/{s}", .{entry.name});
+            defer allocator.free(src_path);
+            const dst_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ build_dir, entry.name });
+            defer allocator.free(dst_path);
+
+            std.fs.cwd().copyFile(src_path, std.fs.cwd(), dst_path, .{}) catch |err| {
+                if (err == error.FileNotFound) continue;
+                return err;
+            };
+        }
+    }
+}
+
+/// Write generated code to build_dir/metal0_main_<hash>.zig and return the path (caller frees)
+/// The name depends only on the code, so rebuilding identical code presents Zig with the
+/// same root file and hits its compilation cache; a timestamped name missed every time.
+fn writeMainSource(allocator: std.mem.Allocator, build_dir: []const u8, zig_code: []const u8) ![]const u8 {
+    const main_path = try std.fmt.allocPrint(allocator, "{s}/metal0_main_{x:0>16}.zig", .{ build_dir, std.hash.Wyhash.hash(0, zig_code) });
+    errdefer allocator.free(main_path);
+
+    const main_file = try std.fs.cwd().createFile(main_path, .{});
+    defer main_file.close();
+    try main_file.writeAll(zig_code);
+
+    return main_path;
+}
+
 /// Compile Zig source code to native binary
 pub fn compileZig(allocator: std.mem.Allocator, zig_code: []const u8, output_path: []const u8, c_libraries: []const []const u8) !void {
     // Use arena for all intermediate allocations
@@ -21,55 +145,11 @@ pub fn compileZig(allocator: std.mem.Allocator, zig_code: []const u8, output_pat
         if (err != error.PathAlreadyExists) return err;
     };
 
-    // Copy runtime files to .build for import
-    const runtime_files = [_][]const u8{ "runtime.zig", "runtime_format.zig", "pystring.zig", "pylist.zig", "dict.zig", "pyint.zig", "pyfloat.zig", "pybool.zig", "pytuple.zig", "async.zig", "asyncio.zig", "http.zig", "json.zig", "re.zig", "numpy_array.zig", "eval.zig", "exec.zig", "ast_executor.zig", "bytecode.zig", "eval_cache.zig", "compile.zig", "dynamic_import.zig", "dynamic_attrs.zig", "flask.zig", "requests.zig", "string_utils.zig", "comptime_helpers.zig", "math.zig", "closure_impl.zig", "sys.zig", "time.zig", "py_value.zig", "green_thread.zig", "scheduler.zig", "work_queue.zig", "unittest.zig", "datetime.zig", "pathlib.zig", "os.zig", "pyfile.zig", "io.zig", "hashlib.zig", "pickle.zig", "test_support.zig", "expr_parser.zig", "zlib.zig", "base64.zig", "pylong.zig" };
-    for (runtime_files) |file| {
-        const src_path = try std.fmt.allocPrint(aa, "packages/runtime/src/{s}", .{file});
-        const dst_path = try std.fmt.allocPrint(aa, "{s}/{s}", .{ build_dir, file });
-
-        const src = std.fs.cwd().openFile(src_path, .{}) catch continue;
-        defer src.close();
-        var content = try src.readToEndAlloc(aa, 1024 * 1024);
-
-        // Patch module imports to file imports for standalone compilation
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"green_thread\")", "@import(\"green_thread.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"work_queue\")", "@import(\"work_queue.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"scheduler\")", "@import(\"scheduler.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"hashmap_helper\")", "@import(\"utils/hashmap_helper.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"allocator_helper\")", "@import(\"utils/allocator_helper.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"regex\")", "@import(\"regex/src/pyregex/regex.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"bigint\")", "@import(\"bigint.zig\")");
-
-        // Patch relative utils imports to use local utils/ directory
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"../../src/utils/", "@import(\"utils/");
-
-        const dst = try std.fs.cwd().createFile(dst_path, .{});
-        defer dst.close();
-        try dst.writeAll(content);
-    }
+    // Copy runtime files and subdirectories to .build for import
+    try stageRuntime(aa, build_dir, .patched);
 
     // Copy bigint package to .build
-    {
-        const src = std.fs.cwd().openFile("packages/bigint/src/bigint.zig", .{}) catch |e| {
-            std.debug.print("Failed to open bigint.zig: {any}\n", .{e});
-            return e;
-        };
-        defer src.close();
-        const bigint_content = try src.readToEndAlloc(aa, 1024 * 1024);
-        const dst_path = try std.fmt.allocPrint(aa, "{s}/bigint.zig", .{build_dir});
-        const dst = try std.fs.cwd().createFile(dst_path, .{});
-        defer dst.close();
-        try dst.writeAll(bigint_content);
-    }
-
-    // Copy runtime subdirectories to .build
-    try compiler_utils.copyRuntimeDir(aa, "http", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "async", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "json", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "runtime", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "pystring", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "unittest", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "gzip", build_dir);
+    try stageBigint(aa, build_dir);
 
     // Copy JSON SIMD files from shared/json/simd
     try compiler_utils.copyJsonSimd(aa, build_dir);
@@ -84,42 +164,10 @@ pub fn compileZig(allocator: std.mem.Allocator, zig_code: []const u8, output_pat
     try compiler_utils.copySrcUtilsDir(aa, build_dir);
 
     // Copy any compiled modules from .build/ to per-process build dir
-    // (Skip this if build_dir is .build itself to avoid copying files to themselves)
-    if (!std.mem.eql(u8, build_dir, ".build")) {
-        if (std.fs.cwd().openDir(".build", .{ .iterate = true })) |build_iter_dir| {
-            var mut_dir = build_iter_dir;
-            defer mut_dir.close();
-            var walker = mut_dir.iterate();
-            while (try walker.next()) |entry| {
-                if (entry.kind == .file and std.mem.endsWith(u8, entry.name, ".zig")) {
-                    const src_path = try std.fmt.allocPrint(aa, ".build/{s}", .{entry.name});
-                    const dst_path = try std.fmt.allocPrint(aa, "{s}/{s}", .{ build_dir, entry.name });
-
-                    const src = std.fs.cwd().openFile(src_path, .{}) catch continue;
-                    defer src.close();
-                    const dst = try std.fs.cwd().createFile(dst_path, .{});
-                    defer dst.close();
-
-                    const mod_content = try src.readToEndAlloc(aa, 1024 * 1024);
-                    try dst.writeAll(mod_content);
-                }
-            }
-        } else |err| {
-            // If .build doesn't exist, that's fine - no modules to copy
-            if (err != error.FileNotFound) return err;
-        }
-    }
-
-    // Write Zig code to temporary file
-    const tmp_path = try std.fmt.allocPrint(aa, "{s}/metal0_main_{d}.zig", .{ build_dir, std.time.milliTimestamp() });
+    try stageCompiledModules(aa, build_dir);
 
-    // Write temp file
-    const tmp_file = try std.fs.cwd().createFile(tmp_path, .{});
-    defer tmp_file.close();
-    // Keep for debugging - don't delete
-    // defer std.fs.deleteFileAbsolute(tmp_path) catch {};
-
-    try tmp_file.writeAll(zig_code);
+    // Write Zig code to its content-addressed main file (kept for debugging)
+    const tmp_path = try writeMainSource(aa, build_dir, zig_code);
 
     // DEBUG: Verify runtime files before zig compilation
     {
@@ -147,7 +195,14 @@ pub fn compileZig(allocator: std.mem.Allocator, zig_code: []const u8, output_pat
     // Add main source file
     try args.append(aa, tmp_path);
 
-    try args.append(aa, "-OReleaseFast");
+    if (fastDebugRequested()) {
+        // Self-hosted backend and linker: much faster compiles, unoptimized binary
+        try args.append(aa, "-ODebug");
+        try args.append(aa, "-fno-llvm");
+        try args.append(aa, "-fno-lld");
+    } else {
+        try args.append(aa, "-OReleaseFast");
+    }
     try args.append(aa, "-fno-stack-check"); // ~1.08x speedup
     // LTO disabled: requires LLD linker which isn't always available
     // try args.append(aa, "-flto"); // Link-time optimization ~1.05x speedup
@@ -187,13 +242,8 @@ pub fn compileZig(allocator: std.mem.Allocator, zig_code: []const u8, output_pat
 
     const argv = try args.toOwnedSlice(aa);
 
-    const result = try std.process.Child.run(.{
-        .allocator = aa,
-        .argv = argv,
-    });
-
-    if (result.term.Exited != 0) {
-        std.debug.print("Zig compilation failed:\n{s}\n", .{result.stderr});
+    if (try runZig(aa, argv)) |stderr| {
+        std.debug.print("Zig compilation failed:\n{s}\n", .{stderr});
         return error.ZigCompilationFailed;
     }
 }
@@ -207,32 +257,8 @@ pub fn compileZigSharedLib(allocator: std.mem.Allocator, zig_code: []const u8, o
         if (err != error.PathAlreadyExists) return err;
     };
 
-    // Copy runtime files to .build for import
-    const runtime_files = [_][]const u8{ "runtime.zig", "runtime_format.zig", "pystring.zig", "pylist.zig", "dict.zig", "pyint.zig", "pyfloat.zig", "pybool.zig", "pytuple.zig", "async.zig", "asyncio.zig", "http.zig", "json.zig", "re.zig", "numpy_array.zig", "eval.zig", "exec.zig", "ast_executor.zig", "bytecode.zig", "eval_cache.zig", "compile.zig", "dynamic_import.zig", "dynamic_attrs.zig", "flask.zig", "requests.zig", "string_utils.zig", "comptime_helpers.zig", "math.zig", "closure_impl.zig", "sys.zig", "time.zig", "py_value.zig", "green_thread.zig", "scheduler.zig", "work_queue.zig", "unittest.zig", "datetime.zig", "pathlib.zig", "os.zig", "pyfile.zig", "io.zig", "hashlib.zig", "pickle.zig", "test_support.zig", "expr_parser.zig", "zlib.zig", "base64.zig", "pylong.zig" };
-    for (runtime_files) |file| {
-        const src_path = try std.fmt.allocPrint(allocator, "packages/runtime/src/{s}", .{file});
-        defer allocator.free(src_path);
-        const dst_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ build_dir, file });
-        defer allocator.free(dst_path);
-
-        const src = std.fs.cwd().openFile(src_path, .{}) catch continue;
-        const content = try src.readToEndAlloc(allocator, 1024 * 1024);
-        defer allocator.free(content);
-        src.close();
-
-        const dst = try std.fs.cwd().createFile(dst_path, .{});
-        try dst.writeAll(content);
-        dst.close();
-    }
-
-    // Copy runtime subdirectories to .build
-    try compiler_utils.copyRuntimeDir(allocator, "http", build_dir);
-    try compiler_utils.copyRuntimeDir(allocator, "async", build_dir);
-    try compiler_utils.copyRuntimeDir(allocator, "json", build_dir);
-    try compiler_utils.copyRuntimeDir(allocator, "runtime", build_dir);
-    try compiler_utils.copyRuntimeDir(allocator, "pystring", build_dir);
-    try compiler_utils.copyRuntimeDir(allocator, "unittest", build_dir);
-    try compiler_utils.copyRuntimeDir(allocator, "gzip", build_dir);
+    // Copy runtime files and subdirectories to .build for import
+    try stageRuntime(allocator, build_dir, .verbatim);
 
     // Copy JSON SIMD files from shared/json/simd
     try compiler_utils.copyJsonSimd(allocator, build_dir);
@@ -244,42 +270,12 @@ pub fn compileZigSharedLib(allocator: std.mem.Allocator, zig_code: []const u8, o
     try compiler_utils.copySrcUtilsDir(allocator, build_dir);
 
     // Copy any compiled modules from .build/ to per-process build dir
-    if (std.fs.cwd().openDir(".build", .{ .iterate = true })) |build_iter_dir| {
-        var mut_dir = build_iter_dir;
-        defer mut_dir.close();
-        var walker = mut_dir.iterate();
-        while (try walker.next()) |entry| {
-            if (entry.kind == .file and std.mem.endsWith(u8, entry.name, ".zig")) {
-                const src_path = try std.fmt.allocPrint(allocator, ".build/{s}", .{entry.name});
-                defer allocator.free(src_path);
-                const dst_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ build_dir, entry.name });
-                defer allocator.free(dst_path);
-
-                const src = std.fs.cwd().openFile(src_path, .{}) catch continue;
-                defer src.close();
-                const dst = try std.fs.cwd().createFile(dst_path, .{});
-                defer dst.close();
-
-                const mod_content = try src.readToEndAlloc(allocator, 1024 * 1024);
-                defer allocator.free(mod_content);
-                try dst.writeAll(mod_content);
-            }
-        }
-    } else |err| {
-        // If .build doesn't exist, that's fine - no modules to copy
-        if (err != error.FileNotFound) return err;
-    }
+    try stageCompiledModules(allocator, build_dir);
 
-    // Write Zig code to temporary file
-    const tmp_path = try std.fmt.allocPrint(allocator, "{s}/metal0_main_{d}.zig", .{ build_dir, std.time.milliTimestamp() });
+    // Write Zig code to its content-addressed main file
+    const tmp_path = try writeMainSource(allocator, build_dir, zig_code);
     defer allocator.free(tmp_path);
 
-    // Write temp file
-    const tmp_file = try std.fs.cwd().createFile(tmp_path, .{});
-    defer tmp_file.close();
-
-    try tmp_file.writeAll(zig_code);
-
     // Shell out to zig build-lib (shared library)
     const zig_path = try findZigBinary(allocator);
     defer allocator.free(zig_path);
@@ -354,16 +350,9 @@ pub fn compileZigSharedLib(allocator: std.mem.Allocator, zig_code: []const u8, o
     const argv = try args.toOwnedSlice(allocator);
     defer allocator.free(argv);
 
-    const result = try std.process.Child.run(.{
-        .allocator = allocator,
-        .argv = argv,
-    });
-    // Child.run always allocates stdout/stderr, must free them
-    defer allocator.free(result.stdout);
-    defer allocator.free(result.stderr);
-
-    if (result.term.Exited != 0) {
-        std.debug.print("Zig compilation failed:\n{s}\n", .{result.stderr});
+    if (try runZig(allocator, argv)) |stderr| {
+        defer allocator.free(stderr);
+        std.debug.print("Zig compilation failed:\n{s}\n", .{stderr});
         return error.ZigCompilationFailed;
     }
 }
@@ -382,55 +371,11 @@ pub fn compileWasm(allocator: std.mem.Allocator, zig_code: []const u8, output_pa
         if (err != error.PathAlreadyExists) return err;
     };
 
-    // Copy runtime files to .build for import (same as compileZig)
-    const runtime_files = [_][]const u8{ "runtime.zig", "runtime_format.zig", "pystring.zig", "pylist.zig", "dict.zig", "pyint.zig", "pyfloat.zig", "pybool.zig", "pytuple.zig", "async.zig", "asyncio.zig", "http.zig", "json.zig", "re.zig", "numpy_array.zig", "eval.zig", "exec.zig", "ast_executor.zig", "bytecode.zig", "eval_cache.zig", "compile.zig", "dynamic_import.zig", "dynamic_attrs.zig", "flask.zig", "requests.zig", "string_utils.zig", "comptime_helpers.zig", "math.zig", "closure_impl.zig", "sys.zig", "time.zig", "py_value.zig", "green_thread.zig", "scheduler.zig", "work_queue.zig", "unittest.zig", "datetime.zig", "pathlib.zig", "os.zig", "pyfile.zig", "io.zig", "hashlib.zig", "pickle.zig", "test_support.zig", "expr_parser.zig", "zlib.zig", "base64.zig", "pylong.zig" };
-    for (runtime_files) |file| {
-        const src_path = try std.fmt.allocPrint(aa, "packages/runtime/src/{s}", .{file});
-        const dst_path = try std.fmt.allocPrint(aa, "{s}/{s}", .{ build_dir, file });
-
-        const src = std.fs.cwd().openFile(src_path, .{}) catch continue;
-        defer src.close();
-        var content = try src.readToEndAlloc(aa, 1024 * 1024);
-
-        // Patch module imports to file imports for standalone compilation
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"green_thread\")", "@import(\"green_thread.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"work_queue\")", "@import(\"work_queue.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"scheduler\")", "@import(\"scheduler.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"hashmap_helper\")", "@import(\"utils/hashmap_helper.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"allocator_helper\")", "@import(\"utils/allocator_helper.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"regex\")", "@import(\"regex/src/pyregex/regex.zig\")");
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"bigint\")", "@import(\"bigint.zig\")");
-
-        // Patch relative utils imports to use local utils/ directory
-        content = try std.mem.replaceOwned(u8, aa, content, "@import(\"../../src/utils/", "@import(\"utils/");
-
-        const dst = try std.fs.cwd().createFile(dst_path, .{});
-        defer dst.close();
-        try dst.writeAll(content);
-    }
+    // Copy runtime files and subdirectories to .build for import
+    try stageRuntime(aa, build_dir, .patched);
 
     // Copy bigint package to .build
-    {
-        const src = std.fs.cwd().openFile("packages/bigint/src/bigint.zig", .{}) catch |e| {
-            std.debug.print("Failed to open bigint.zig: {any}\n", .{e});
-            return e;
-        };
-        defer src.close();
-        const bigint_content = try src.readToEndAlloc(aa, 1024 * 1024);
-        const dst_path = try std.fmt.allocPrint(aa, "{s}/bigint.zig", .{build_dir});
-        const dst = try std.fs.cwd().createFile(dst_path, .{});
-        defer dst.close();
-        try dst.writeAll(bigint_content);
-    }
-
-    // Copy runtime subdirectories to .build
-    try compiler_utils.copyRuntimeDir(aa, "http", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "async", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "json", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "runtime", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "pystring", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "unittest", build_dir);
-    try compiler_utils.copyRuntimeDir(aa, "gzip", build_dir);
+    try stageBigint(aa, build_dir);
 
     // Copy JSON SIMD files from shared/json/simd
     try compiler_utils.copyJsonSimd(aa, build_dir);
@@ -444,14 +389,8 @@ pub fn compileWasm(allocator: std.mem.Allocator, zig_code: []const u8, output_pa
     // Copy utils directory to build dir (for hashmap_helper, wyhash)
     try compiler_utils.copySrcUtilsDir(aa, build_dir);
 
-    // Write Zig code to temporary file
-    const tmp_path = try std.fmt.allocPrint(aa, "{s}/metal0_main_{d}.zig", .{ build_dir, std.time.milliTimestamp() });
-
-    // Write temp file
-    const tmp_file = try std.fs.cwd().createFile(tmp_path, .{});
-    defer tmp_file.close();
-
-    try tmp_file.writeAll(zig_code);
+    // Write Zig code to its content-addressed main file
+    const tmp_path = try writeMainSource(aa, build_dir, zig_code);
 
     // Shell out to zig build-exe with WASM target
     const zig_path = try findZigBinary(aa);
@@ -483,17 +422,35 @@ pub fn compileWasm(allocator: std.mem.Allocator, zig_code: []const u8, output_pa
 
     const argv = try args.toOwnedSlice(aa);
 
-    const result = try std.process.Child.run(.{
-        .allocator = aa,
-        .argv = argv,
-    });
-
-    if (result.term.Exited != 0) {
-        std.debug.print("WASM compilation failed:\n{s}\n", .{result.stderr});
+    if (try runZig(aa, argv)) |stderr| {
+        std.debug.print("WASM compilation failed:\n{s}\n", .{stderr});
         return error.WasmCompilationFailed;
     }
 }
 
+/// Run a zig command with stdin and stdout discarded
+/// Only stderr is piped, and it is kept only on failure: returns null on success,
+/// otherwise the captured stderr (caller frees). Child.run would collect and
+/// allocate both streams on every build, including successful ones.
+fn runZig(allocator: std.mem.Allocator, argv: []const []const u8) !?[]u8 {
+    var child = std.process.Child.init(argv, allocator);
+    child.stdin_behavior = .Ignore;
+    child.stdout_behavior = .Ignore;
+    child.stderr_behavior = .Pipe;
+    try child.spawn();
+    errdefer _ = child.kill() catch {};
+
+    const stderr = try child.stderr.?.readToEndAlloc(allocator, 50 * 1024 * 1024);
+    errdefer allocator.free(stderr);
+
+    const term = try child.wait();
+    if (term == .Exited and term.Exited == 0) {
+        allocator.free(stderr);
+        return null;
+    }
+    return stderr;
+}
+
 fn findZigBinary(allocator: std.mem.Allocator) ![]const u8 {
     // Try to find zig in PATH
     const result = std.process.Child.run(.{
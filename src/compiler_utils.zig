@@ -1,5 +1,159 @@
 const std = @import("std");
 
+/// An @import path rewrite used when copying runtime sources for standalone compilation
+pub const ImportPatch = struct {
+    from: []const u8, // Text right after `@import("`, matched as a prefix
+    to: []const u8,
+};
+
+/// Rewrite @import paths in a single pass over content
+/// Each `@import("` site is checked against every patch, instead of rescanning the
+/// whole file once per pattern with std.mem.replaceOwned. Returns null when no
+/// site matches any patch, so callers can use content as-is without a copy.
+/// Otherwise the caller owns the result.
+pub fn patchImports(allocator: std.mem.Allocator, content: []const u8, patches: []const ImportPatch) !?[]u8 {
+    const marker = "@import(\"";
+    var out = std.ArrayList(u8){};
+    errdefer out.deinit(allocator);
+    var patched = false;
+
+    // First bytes of all patch prefixes: sites that can't match any patch are
+    // rejected with one bit test instead of a startsWith per patch
+    var first_bytes = std.StaticBitSet(256).initEmpty();
+    for (patches) |patch| {
+        if (patch.from.len > 0) first_bytes.set(patch.from[0]);
+    }
+
+    var pos: usize = 0;
+    var search: usize = 0;
+    while (std.mem.indexOfPos(u8, content, search, marker)) |idx| {
+        const path_start = idx + marker.len;
+        search = path_start;
+        if (path_start >= content.len or !first_bytes.isSet(content[path_start])) continue;
+        for (patches) |patch| {
+            if (std.mem.startsWith(u8, content[path_start..], patch.from)) {
+                // Output buffer is only created once the first patch applies
+                if (!patched) {
+                    try out.ensureTotalCapacity(allocator, content.len);
+                    patched = true;
+                }
+                try out.appendSlice(allocator, content[pos..path_start]);
+                try out.appendSlice(allocator, patch.to);
+                pos = path_start + patch.from.len;
+                break;
+            }
+        }
+    }
+    if (!patched) return null;
+    try out.appendSlice(allocator, content[pos..]);
+    return try out.toOwnedSlice(allocator);
+}
+
+/// Sources above this size are memory-mapped rather than read into a heap buffer
+const mmap_threshold = 64 * 1024;
+
+/// Copy src_path to dst_path, applying import patches on the way
+/// Large sources are memory-mapped so they are served straight from the page cache
+/// without a heap copy; smaller ones (or failed maps) are read normally.
+pub fn copyPatchedFile(allocator: std.mem.Allocator, src_path: []const u8, dst_path: []const u8, patches: []const ImportPatch) !void {
+    const src_file = try std.fs.cwd().openFile(src_path, .{});
+    defer src_file.close();
+    const stat = try src_file.stat();
+
+    var mapped: ?[]align(std.heap.page_size_min) u8 = null;
+    defer if (mapped) |data| std.posix.munmap(data);
+    var read_data: ?[]u8 = null;
+    defer if (read_data) |data| allocator.free(data);
+
+    const content: []const u8 = blk: {
+        if (stat.size > mmap_threshold) {
+            if (std.posix.mmap(null, stat.size, std.posix.PROT.READ, .{ .TYPE = .PRIVATE }, src_file.handle, 0)) |data| {
+                mapped = data;
+                break :blk data;
+            } else |_| {
+                // mmap failed, fall through to regular read
+            }
+        }
+        read_data = try src_file.readToEndAlloc(allocator, 10 * 1024 * 1024);
+        break :blk read_data.?;
+    };
+
+    const dst_file = try std.fs.cwd().createFile(dst_path, .{});
+    defer dst_file.close();
+
+    if (try patchImports(allocator, content, patches)) |patched| {
+        defer allocator.free(patched);
+        try dst_file.writeAll(patched);
+    } else {
+        try dst_file.writeAll(content);
+    }
+}
+
+/// Stamp file in the build dir recording which runtime sources were last staged there
+const runtime_stamp_file = ".runtime.stamp";
+
+/// Key the staged runtime files by each source's size and mtime, without reading contents
+/// `variant` separates stagings of the same sources (import-patched vs. verbatim copies)
+/// src_dir is opened once and each file stat'ed relative to it (fstatat), so the
+/// directory path is resolved once rather than per file.
+pub fn runtimeSourcesKey(variant: []const u8, src_dir: []const u8, names: []const []const u8) [32]u8 {
+    var hasher = std.crypto.hash.Blake3.init(.{});
+    hasher.update(variant);
+    var key: [32]u8 = undefined;
+
+    var dir = std.fs.cwd().openDir(src_dir, .{}) catch {
+        hasher.final(&key);
+        return key;
+    };
+    defer dir.close();
+
+    for (names) |name| {
+        hasher.update(name);
+        const stat = dir.statFile(name) catch continue;
+        hasher.update(std.mem.asBytes(&stat.size));
+        hasher.update(std.mem.asBytes(&stat.mtime));
+    }
+    hasher.final(&key);
+    return key;
+}
+
+/// Check whether build_dir already holds the runtime files staged under `key`
+pub fn isRuntimeStaged(build_dir: []const u8, key: [32]u8) bool {
+    var path_buf: [std.fs.max_path_bytes]u8 = undefined;
+    const stamp_path = std.fmt.bufPrint(&path_buf, "{s}/" ++ runtime_stamp_file, .{build_dir}) catch return false;
+    var stamp_buf: [32]u8 = undefined;
+    const stamp = std.fs.cwd().readFile(stamp_path, &stamp_buf) catch return false;
+    return std.mem.eql(u8, stamp, &key);
+}
+
+/// Record that the runtime files staged in build_dir correspond to `key`
+pub fn markRuntimeStaged(build_dir: []const u8, key: [32]u8) !void {
+    var path_buf: [std.fs.max_path_bytes]u8 = undefined;
+    const stamp_path = try std.fmt.bufPrint(&path_buf, "{s}/" ++ runtime_stamp_file, .{build_dir});
+    try std.fs.cwd().writeFile(.{ .sub_path = stamp_path, .data = &key });
+}
+
+/// Import patches for files in runtime subdirectories (json_simd resolved from json/)
+const runtime_dir_patches = runtimeDirPatches("simd/dispatch.zig\")");
+
+/// Import patches for files in json/parse/ and json/parse_direct/ (one level deeper)
+const runtime_nested_dir_patches = runtimeDirPatches("../simd/dispatch.zig\")");
+
+fn runtimeDirPatches(comptime json_simd_path: []const u8) [7]ImportPatch {
+    return .{
+        // Relative utils imports use the local utils/ directory
+        .{ .from = "../../../../src/utils/", .to = "../utils/" },
+        .{ .from = "../../../src/utils/", .to = "utils/" },
+        .{ .from = "../../src/utils/", .to = "utils/" },
+        // Module imports (defined in build.zig) become file imports
+        .{ .from = "hashmap_helper\")", .to = "utils/hashmap_helper.zig\")" },
+        .{ .from = "allocator_helper\")", .to = "utils/allocator_helper.zig\")" },
+        .{ .from = "runtime.zig\")", .to = "../runtime.zig\")" },
+        // json_simd module - different depths need different paths
+        .{ .from = "json_simd\")", .to = json_simd_path },
+    };
+}
+
 /// Copy a runtime subdirectory recursively to .build
 pub fn copyRuntimeDir(allocator: std.mem.Allocator, dir_name: []const u8, build_dir: []const u8) !void {
     const src_dir_path = try std.fmt.allocPrint(allocator, "packages/runtime/src/{s}", .{dir_name});
@@ -30,39 +184,21 @@ pub fn copyRuntimeDir(allocator: std.mem.Allocator, dir_name: []const u8, build_
             const dst_file_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ dst_dir_path, entry.name });
             defer allocator.free(dst_file_path);
 
-            const src_file = try std.fs.cwd().openFile(src_file_path, .{});
-            defer src_file.close();
-            const dst_file = try std.fs.cwd().createFile(dst_file_path, .{});
-            defer dst_file.close();
-
-            var content = try src_file.readToEndAlloc(allocator, 10 * 1024 * 1024);
-
-            // Patch imports for standalone compilation
-            // Files at different depths need different patterns patched
-            if (std.mem.endsWith(u8, entry.name, ".zig")) {
-                // Patch relative utils imports to use local utils/ directory
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"../../../../src/utils/", "@import(\"../utils/");
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"../../../src/utils/", "@import(\"utils/");
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"../../src/utils/", "@import(\"utils/");
-                // Patch module imports to file imports (for modules defined in build.zig)
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"hashmap_helper\")", "@import(\"utils/hashmap_helper.zig\")");
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"allocator_helper\")", "@import(\"utils/allocator_helper.zig\")");
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"runtime.zig\")", "@import(\"../runtime.zig\")");
-                // Patch json_simd module - different depths need different paths
-                // Files in json/ need simd/dispatch.zig
-                // Files in json/parse/ or json/parse_direct/ need ../simd/dispatch.zig
-                if (std.mem.indexOf(u8, dst_dir_path, "/parse") != null or
-                    std.mem.indexOf(u8, dst_dir_path, "/parse_direct") != null)
-                {
-                    content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"json_simd\")", "@import(\"../simd/dispatch.zig\")");
-                } else {
-                    content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"json_simd\")", "@import(\"simd/dispatch.zig\")");
-                }
-                // Fix parse_direct import in subdirectories
-                content = try std.mem.replaceOwned(u8, allocator, content, "@import(\"../parse_direct.zig\")", "@import(\"../parse_direct.zig\")");
+            // Non-Zig files need no patching: copy without buffering them in memory
+            if (!std.mem.endsWith(u8, entry.name, ".zig")) {
+                try std.fs.cwd().copyFile(src_file_path, std.fs.cwd(), dst_file_path, .{});
+                continue;
             }
 
-            try dst_file.writeAll(content);
+            // Patch imports for standalone compilation
+            // Files at different depths need different patterns patched:
+            // files in json/ need simd/dispatch.zig,
+            // files in json/parse/ or json/parse_direct/ need ../simd/dispatch.zig
+            const patches: []const ImportPatch = if (std.mem.indexOf(u8, dst_dir_path, "/parse") != null)
+                &runtime_nested_dir_patches
+            else
+                &runtime_dir_patches;
+            try copyPatchedFile(allocator, src_file_path, dst_file_path, patches);
         } else if (entry.kind == .directory) {
             // Recursively copy subdirectory
             const subdir_name = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ dir_name, entry.name });
@@ -79,17 +215,10 @@ pub fn copyRuntimeFile(allocator: std.mem.Allocator, filename: []const u8, build
     const dst_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ build_dir, filename });
     defer allocator.free(dst_path);
 
-    const src_file = std.fs.cwd().openFile(src_path, .{}) catch |err| {
+    std.fs.cwd().copyFile(src_path, std.fs.cwd(), dst_path, .{}) catch |err| {
         if (err == error.FileNotFound) return;
         return err;
     };
-    defer src_file.close();
-    const dst_file = try std.fs.cwd().createFile(dst_path, .{});
-    defer dst_file.close();
-
-    const content = try src_file.readToEndAlloc(allocator, 10 * 1024 * 1024);
-    defer allocator.free(content);
-    try dst_file.writeAll(content);
 }
 
 /// Copy JSON SIMD files from shared/json/simd to .build/json/simd
@@ -117,14 +246,7 @@ pub fn copyJsonSimd(allocator: std.mem.Allocator, build_dir: []const u8) !void {
             const dst_file_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ dst_dir_path, entry.name });
             defer allocator.free(dst_file_path);
 
-            const src_file = try std.fs.cwd().openFile(src_file_path, .{});
-            defer src_file.close();
-            const dst_file = try std.fs.cwd().createFile(dst_file_path, .{});
-            defer dst_file.close();
-
-            const content = try src_file.readToEndAlloc(allocator, 1024 * 1024);
-            defer allocator.free(content);
-            try dst_file.writeAll(content);
+            try std.fs.cwd().copyFile(src_file_path, std.fs.cwd(), dst_file_path, .{});
         }
     }
 }
@@ -158,14 +280,7 @@ pub fn copyCInteropDir(allocator: std.mem.Allocator, build_dir: []const u8) !voi
             const dst_file_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ dst_dir_path, entry.name });
             defer allocator.free(dst_file_path);
 
-            const src_file = try std.fs.cwd().openFile(src_file_path, .{});
-            defer src_file.close();
-            const dst_file = try std.fs.cwd().createFile(dst_file_path, .{});
-            defer dst_file.close();
-
-            const content = try src_file.readToEndAlloc(allocator, 10 * 1024 * 1024);
-            defer allocator.free(content);
-            try dst_file.writeAll(content);
+            try std.fs.cwd().copyFile(src_file_path, std.fs.cwd(), dst_file_path, .{});
         } else if (entry.kind == .directory) {
             // Recursively copy subdirectory
             const new_src = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ src_dir_path, entry.name });
@@ -210,14 +325,7 @@ pub fn copySrcUtilsDir(allocator: std.mem.Allocator, build_dir: []const u8) !voi
                     const dst_file_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ dst_dir_path, entry.name });
                     defer allocator.free(dst_file_path);
 
-                    const src_file = try std.fs.cwd().openFile(src_file_path, .{});
-                    defer src_file.close();
-                    const dst_file = try std.fs.cwd().createFile(dst_file_path, .{});
-                    defer dst_file.close();
-
-                    const content = try src_file.readToEndAlloc(allocator, 1024 * 1024);
-                    defer allocator.free(content);
-                    try dst_file.writeAll(content);
+                    try std.fs.cwd().copyFile(src_file_path, std.fs.cwd(), dst_file_path, .{});
                 }
             }
         }
@@ -255,14 +363,7 @@ pub fn copyDirRecursive(allocator: std.mem.Allocator, src_path: []const u8, dst_
             const dst_file_path = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ dst_path, entry.name });
             defer allocator.free(dst_file_path);
 
-            const src_file = try std.fs.cwd().openFile(src_file_path, .{});
-            defer src_file.close();
-            const dst_file = try std.fs.cwd().createFile(dst_file_path, .{});
-            defer dst_file.close();
-
-            const content = try src_file.readToEndAlloc(allocator, 10 * 1024 * 1024);
-            defer allocator.free(content);
-            try dst_file.writeAll(content);
+            try std.fs.cwd().copyFile(src_file_path, std.fs.cwd(), dst_file_path, .{});
         } else if (entry.kind == .directory) {
             const new_src = try std.fmt.allocPrint(allocator, "{s}/{s}", .{ src_path, entry.name });
             defer allocator.free(new_src);
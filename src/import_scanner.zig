@@ -1,16 +1,17 @@
 /// Scan Python file for all imports and recursively collect dependencies
 const std = @import("std");
 const ast = @import("ast");
-const parser = @import("parser.zig");
 const lexer = @import("lexer.zig");
 const import_resolver = @import("import_resolver.zig");
 const import_registry = @import("codegen/native/import_registry.zig");
 const hashmap_helper = @import("hashmap_helper");
+const cache = @import("main/compile/cache.zig");
 
 pub const ModuleInfo = struct {
     path: []const u8, // Full path to .py file
     module_name: []const u8, // Logical module name (e.g., "flask" for flask/__init__.py)
     imports: [][]const u8, // List of imported modules
+    deps: [][]const u8 = &.{}, // Resolved paths of imported source files (graph edges)
     compiled_path: ?[]const u8, // Path to compiled .so
 
     pub fn deinit(self: *ModuleInfo, allocator: std.mem.Allocator) void {
@@ -20,6 +21,10 @@ pub const ModuleInfo = struct {
             allocator.free(imp);
         }
         allocator.free(self.imports);
+        for (self.deps) |dep| {
+            allocator.free(dep);
+        }
+        allocator.free(self.deps);
         if (self.compiled_path) |cp| {
             allocator.free(cp);
         }
@@ -102,42 +107,114 @@ pub const ImportGraph = struct {
     }
 
     /// Recursively scan file with an explicit module name
+    /// Breadth-first over a FIFO worklist (a list plus a head index, so popping
+    /// is O(1)) rather than recursing once per import. A file is marked visited
+    /// when it is queued, so each file is queued once. Each BFS level's files are
+    /// read and import-scanned in parallel when the level is wide enough.
     pub fn scanRecursiveWithName(
         self: *ImportGraph,
         file_path: []const u8,
         explicit_module_name: ?[]const u8,
         visited: *hashmap_helper.StringHashMap(void),
     ) !void {
-        // Skip non-.py files - optimized with comptime length check
-        if (!isPythonFileRuntime(file_path)) return;
+        // Every queued path is owned by the queue
+        var queue = std.ArrayList(ScanJob){};
+        defer {
+            for (queue.items) |job| self.allocator.free(job.path);
+            queue.deinit(self.allocator);
+        }
+        try self.enqueue(try self.allocator.dupe(u8, file_path), explicit_module_name, visited, &queue);
+
+        var head: usize = 0;
+        while (head < queue.items.len) {
+            // Everything queued so far is one level; recording appends the next
+            const level_start = head;
+            const level_len = queue.items.len - head;
+            head = queue.items.len;
+
+            const results = try self.allocator.alloc(LoadResult, level_len);
+            defer self.allocator.free(results);
+
+            const num_threads = if (level_len < parallel_scan_threshold)
+                1
+            else
+                @min(level_len, std.Thread.getCpuCount() catch 1);
+            var next_job = std.atomic.Value(usize).init(0);
+            const loaders = try self.allocator.alloc(ImportLoader, num_threads);
+            defer self.allocator.free(loaders);
+            for (loaders) |*loader| {
+                loader.* = .{
+                    .jobs = queue.items[level_start..][0..level_len],
+                    .results = results,
+                    .next_job = &next_job,
+                    .arena = std.heap.ArenaAllocator.init(std.heap.page_allocator),
+                };
+            }
+            defer for (loaders) |*loader| loader.arena.deinit();
+            runLoaders(self.allocator, loaders);
+
+            for (results, level_start..) |result, i| {
+                // Unreadable files are skipped, as before
+                const imports = (try result) orelse continue;
+                // By index: recording grows (and may move) the queue
+                const job = queue.items[i];
+                try self.recordFile(job.path, job.module_name, imports, visited, &queue);
+            }
+        }
+    }
 
-        // Skip __pycache__ directories (compiled bytecode)
-        if (isPycacheDir(file_path)) return;
+    const ScanJob = struct {
+        path: []const u8,
+        module_name: ?[]const u8,
+    };
 
-        // Check if already scanned
-        if (visited.contains(file_path)) return;
+    /// Queue file_path (owned, freed if not queued) unless it isn't a source
+    /// file or was already queued, marking it visited
+    fn enqueue(
+        self: *ImportGraph,
+        file_path: []const u8,
+        module_name: ?[]const u8,
+        visited: *hashmap_helper.StringHashMap(void),
+        queue: *std.ArrayList(ScanJob),
+    ) !void {
+        errdefer self.allocator.free(file_path);
+
+        // Skip non-.py files - optimized with comptime length check
+        // Skip __pycache__ directories (compiled bytecode)
+        // Skip files already queued (or scanned)
+        if (!isPythonFileRuntime(file_path) or isPycacheDir(file_path) or visited.contains(file_path)) {
+            self.allocator.free(file_path);
+            return;
+        }
         // Always dupe the key so we can safely free all keys later
         const key = try self.allocator.dupe(u8, file_path);
-        try visited.put(key, {});
-
-        // Read file (handle absolute paths)
-        const source = blk: {
-            if (std.fs.path.isAbsolute(file_path)) {
-                const file = std.fs.openFileAbsolute(file_path, .{}) catch return;
-                defer file.close();
-                break :blk file.readToEndAlloc(self.allocator, 100_000_000) catch return;
-            } else {
-                break :blk std.fs.cwd().readFileAlloc(self.allocator, file_path, 100_000_000) catch return;
-            }
+        visited.put(key, {}) catch |err| {
+            self.allocator.free(key);
+            return err;
         };
-        defer self.allocator.free(source);
+        try queue.append(self.allocator, .{ .path = file_path, .module_name = module_name });
+    }
 
-        // Parse to find imports
-        const imports = try extractImports(self.allocator, source);
+    /// Record a scanned file and queue the files it imports
+    /// loaded_imports belongs to a loader arena; the graph keeps its own copies
+    fn recordFile(
+        self: *ImportGraph,
+        file_path: []const u8,
+        explicit_module_name: ?[]const u8,
+        loaded_imports: []const []const u8,
+        visited: *hashmap_helper.StringHashMap(void),
+        queue: *std.ArrayList(ScanJob),
+    ) !void {
+        const imports = try self.allocator.alloc([]const u8, loaded_imports.len);
+        var copied: usize = 0;
         errdefer {
-            for (imports) |imp| self.allocator.free(imp);
+            for (imports[0..copied]) |imp| self.allocator.free(imp);
             self.allocator.free(imports);
         }
+        for (loaded_imports) |import_name| {
+            imports[copied] = try self.allocator.dupe(u8, import_name);
+            copied += 1;
+        }
 
         // Store module info
         const path_copy = try self.allocator.dupe(u8, file_path);
@@ -170,7 +247,14 @@ pub const ImportGraph = struct {
             .compiled_path = null,
         });
 
-        // Recursively scan imports
+        // Resolved import paths, kept as this module's dependency edges
+        var deps = std.ArrayList([]const u8){};
+        defer {
+            for (deps.items) |dep| self.allocator.free(dep);
+            deps.deinit(self.allocator);
+        }
+
+        // Queue imports for scanning
         const dir = std.fs.path.dirname(file_path);
         for (imports) |import_name| {
             // Handle relative imports (starting with .)
@@ -179,6 +263,7 @@ pub const ImportGraph = struct {
                     // Resolve relative import
                     const resolved = try resolveRelativeImport(import_name, source_dir, self.allocator);
                     if (resolved) |path| {
+                        try appendDep(self.allocator, &deps, path);
                         // Check if already visited (using resolved path)
                         if (visited.contains(path)) {
                             self.allocator.free(path);
@@ -195,13 +280,11 @@ pub const ImportGraph = struct {
                             continue;
                         };
                         std.debug.print("  Found import: {s} -> {s}\n", .{ import_name, path });
-                        defer self.allocator.free(path);
                         // Extract module name from relative import (strip leading dots)
                         var dots: usize = 0;
                         while (dots < import_name.len and import_name[dots] == '.') : (dots += 1) {}
                         const rel_mod_name = import_name[dots..];
-                        // scanRecursiveWithName will add to visited with a dupe'd key
-                        try self.scanRecursiveWithName(path, if (rel_mod_name.len > 0) rel_mod_name else null, visited);
+                        try self.enqueue(path, if (rel_mod_name.len > 0) rel_mod_name else null, visited, queue);
                     } else {
                         std.debug.print("  Skipped import (relative, no dir): {s}\n", .{import_name});
                     }
@@ -222,15 +305,81 @@ pub const ImportGraph = struct {
             }
             if (try import_resolver.resolveImportSource(import_name, dir, self.allocator)) |resolved| {
                 std.debug.print("  Found import: {s} -> {s}\n", .{ import_name, resolved });
-                defer self.allocator.free(resolved);
-                try self.scanRecursiveWithName(resolved, import_name, visited);
+                try appendDep(self.allocator, &deps, resolved);
+                try self.enqueue(resolved, import_name, visited, queue);
             } else {
                 std.debug.print("  Skipped import (external): {s}\n", .{import_name});
             }
         }
+
+        self.modules.getPtr(path_copy).?.deps = try deps.toOwnedSlice(self.allocator);
+    }
+
+    fn appendDep(allocator: std.mem.Allocator, deps: *std.ArrayList([]const u8), path: []const u8) !void {
+        const dep = try allocator.dupe(u8, path);
+        deps.append(allocator, dep) catch |err| {
+            allocator.free(dep);
+            return err;
+        };
     }
 };
 
+/// Below this many files in a scan level, thread startup costs more than it saves
+const parallel_scan_threshold = 4;
+
+/// A file's imports, or null if it couldn't be read
+const LoadResult = anyerror!?[][]const u8;
+
+/// Reads files and extracts their imports, claiming jobs off a shared index
+const ImportLoader = struct {
+    jobs: []const ImportGraph.ScanJob,
+    results: []LoadResult,
+    next_job: *std.atomic.Value(usize),
+    // Holds the import lists until recordFile copies them into the graph
+    arena: std.heap.ArenaAllocator,
+
+    fn run(self: *ImportLoader) void {
+        while (true) {
+            const idx = self.next_job.fetchAdd(1, .monotonic);
+            if (idx >= self.jobs.len) return;
+            self.results[idx] = loadImports(self.arena.allocator(), self.jobs[idx].path);
+        }
+    }
+};
+
+/// Run loaders[0] on the calling thread and the rest on their own threads
+/// The calling thread works too, so every job finishes even if no thread could be spawned
+fn runLoaders(allocator: std.mem.Allocator, loaders: []ImportLoader) void {
+    const threads = allocator.alloc(std.Thread, loaders.len - 1) catch return loaders[0].run();
+    defer allocator.free(threads);
+
+    var spawned: usize = 0;
+    while (spawned < threads.len) : (spawned += 1) {
+        threads[spawned] = std.Thread.spawn(.{}, ImportLoader.run, .{&loaders[spawned + 1]}) catch break;
+    }
+
+    loaders[0].run();
+    for (threads[0..spawned]) |thread| thread.join();
+}
+
+/// Read a file and list its imports (null if the file can't be read)
+fn loadImports(allocator: std.mem.Allocator, file_path: []const u8) LoadResult {
+    // Read file (handle absolute paths)
+    const source = blk: {
+        if (std.fs.path.isAbsolute(file_path)) {
+            const file = std.fs.openFileAbsolute(file_path, .{}) catch return null;
+            defer file.close();
+            break :blk file.readToEndAlloc(allocator, 100_000_000) catch return null;
+        } else {
+            break :blk std.fs.cwd().readFileAlloc(allocator, file_path, 100_000_000) catch return null;
+        }
+    };
+    defer allocator.free(source);
+
+    // Parse to find imports (cached by source content)
+    return try cachedImports(allocator, source);
+}
+
 /// Resolve relative import to file path
 /// .app -> dir/app.py or dir/app/__init__.py
 /// ..utils -> parent_dir/utils.py or parent_dir/utils/__init__.py
@@ -275,7 +424,64 @@ fn resolveRelativeImport(import_name: []const u8, source_dir: []const u8, alloca
     return module_path;
 }
 
-/// Extract import statements from Python source
+/// Per-file import lists cached by source content: `.build/imports/<blake3 hex>` holds
+/// one imported module name per line, so unchanged files skip the lex + parse.
+/// The key also covers the compiler fingerprint: listings written by an older
+/// extractor (which may have listed imports differently) are never trusted.
+const import_cache_dir = ".build/imports";
+
+/// Imports of source, from the content-keyed cache or by parsing (and caching the result)
+fn cachedImports(allocator: std.mem.Allocator, source: []const u8) ![][]const u8 {
+    const fingerprint = cache.compilerFingerprint();
+    var hasher = std.crypto.hash.Blake3.init(.{});
+    hasher.update(&fingerprint);
+    hasher.update(source);
+    var digest: [32]u8 = undefined;
+    hasher.final(&digest);
+    var path_buf: [import_cache_dir.len + 1 + 64]u8 = undefined;
+    const cache_path = std.fmt.bufPrint(&path_buf, import_cache_dir ++ "/{s}", .{&std.fmt.bytesToHex(digest, .lower)}) catch unreachable;
+
+    if (std.fs.cwd().readFileAlloc(allocator, cache_path, 1024 * 1024)) |listing| {
+        defer allocator.free(listing);
+
+        var imports = std.ArrayList([]const u8){};
+        errdefer {
+            for (imports.items) |imp| allocator.free(imp);
+            imports.deinit(allocator);
+        }
+        var lines = std.mem.tokenizeScalar(u8, listing, '\n');
+        while (lines.next()) |module_name| {
+            try imports.append(allocator, try allocator.dupe(u8, module_name));
+        }
+        return imports.toOwnedSlice(allocator);
+    } else |_| {}
+
+    const imports = try extractImports(allocator, source);
+    // Best effort: a failed write only means the next build parses again
+    writeImportListing(cache_path, imports) catch {};
+    return imports;
+}
+
+/// Written to a per-thread temp file and renamed into place, so a reader (another
+/// loader thread or build) never sees a half-written or interrupted listing
+fn writeImportListing(cache_path: []const u8, imports: []const []const u8) !void {
+    try std.fs.cwd().makePath(import_cache_dir);
+    var tmp_buf: [std.fs.max_path_bytes]u8 = undefined;
+    const tmp_path = try std.fmt.bufPrint(&tmp_buf, "{s}.{d}.tmp", .{ cache_path, std.Thread.getCurrentId() });
+    {
+        const file = try std.fs.cwd().createFile(tmp_path, .{});
+        defer file.close();
+        for (imports) |module_name| {
+            try file.writeAll(module_name);
+            try file.writeAll("\n");
+        }
+    }
+    try std.fs.cwd().rename(tmp_path, cache_path);
+}
+
+/// Extract top-level import statements from Python source
+/// Only imports at module level are collected, so a token scan is enough:
+/// no AST is built for the (possibly large) rest of the file
 fn extractImports(allocator: std.mem.Allocator, source: []const u8) ![][]const u8 {
     var imports = std.ArrayList([]const u8){};
     errdefer {
@@ -283,7 +489,7 @@ fn extractImports(allocator: std.mem.Allocator, source: []const u8) ![][]const u
         imports.deinit(allocator);
     }
 
-    // Use arena for parsing to avoid leaks on parse errors
+    // Use arena for tokens to avoid leaks on lexer errors
     var arena = std.heap.ArenaAllocator.init(allocator);
     defer arena.deinit();
     const aa = arena.allocator();
@@ -301,36 +507,67 @@ fn extractImports(allocator: std.mem.Allocator, source: []const u8) ![][]const u
     };
     // tokens freed by arena
 
-    // Parse to AST
-    var p = parser.Parser.init(aa, tokens);
-    defer p.deinit();
-    const tree = p.parse() catch {
-        // If parsing fails, arena cleanup handles partial AST
-        return imports.toOwnedSlice(allocator);
-    };
-    // tree freed by arena
-
-    // Find all import nodes
-    switch (tree) {
-        .module => |mod| {
-            for (mod.body) |stmt| {
-                switch (stmt) {
-                    .import_stmt => |imp| {
-                        const module_copy = try allocator.dupe(u8, imp.module);
-                        try imports.append(allocator, module_copy);
-                    },
-                    .import_from => |imp| {
-                        // For relative imports, we'll resolve them later with source_dir context
-                        // For now, store them as-is - the scanner will resolve them
-                        const module_copy = try allocator.dupe(u8, imp.module);
-                        try imports.append(allocator, module_copy);
-                    },
-                    else => {},
+    // Find import/from keywords that start a statement at indentation depth 0
+    var depth: usize = 0;
+    var at_stmt_start = true;
+    for (tokens, 0..) |tok, i| {
+        switch (tok.type) {
+            .Newline, .Semicolon => {
+                at_stmt_start = true;
+                continue;
+            },
+            // Indent/Dedent sit between a Newline and the next statement
+            .Indent => {
+                depth += 1;
+                continue;
+            },
+            .Dedent => {
+                depth -|= 1;
+                continue;
+            },
+            .Import, .From => if (at_stmt_start and depth == 0) {
+                if (try importedModule(aa, tokens[i..])) |module_name| {
+                    try imports.append(allocator, try allocator.dupe(u8, module_name));
                 }
-            }
-        },
-        else => {},
+            },
+            else => {},
+        }
+        at_stmt_start = false;
     }
 
     return imports.toOwnedSlice(allocator);
 }
+
+/// Module named by the import statement starting at tokens[0], matching what the
+/// parser records: the first module of `import a.b, c`, and the (possibly
+/// relative) module of `from ..a.b import x`. Null if the statement is malformed.
+fn importedModule(allocator: std.mem.Allocator, tokens: []const lexer.Token) !?[]const u8 {
+    var module_name = std.ArrayList(u8){};
+    var i: usize = 1;
+
+    // Relative imports (from . / from .. / from ...)
+    if (tokens[0].type == .From) {
+        while (i < tokens.len) : (i += 1) {
+            switch (tokens[i].type) {
+                .Dot => try module_name.append(allocator, '.'),
+                .Ellipsis => try module_name.appendSlice(allocator, "..."),
+                else => break,
+            }
+        }
+    }
+
+    // Dotted name (required for `import`, optional after dots for `from`)
+    if (i < tokens.len and tokens[i].type == .Ident) {
+        try module_name.appendSlice(allocator, tokens[i].lexeme);
+        i += 1;
+        while (i + 1 < tokens.len and tokens[i].type == .Dot and tokens[i + 1].type == .Ident) : (i += 2) {
+            try module_name.append(allocator, '.');
+            try module_name.appendSlice(allocator, tokens[i + 1].lexeme);
+        }
+    } else if (tokens[0].type == .Import or module_name.items.len == 0) {
+        return null;
+    }
+
+    if (tokens[0].type == .From and (i >= tokens.len or tokens[i].type != .Import)) return null;
+    return module_name.items;
+}
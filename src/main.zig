@@ -16,6 +16,7 @@ pub const CompileOptions = struct {
     force: bool = false, // --force/-f flag
     emit_bytecode: bool = false, // --emit-bytecode flag (for runtime eval subprocess)
     wasm: bool = false, // --wasm/-w flag for WebAssembly output
+    watch: bool = false, // --watch flag: stay alive and recompile when the input changes
 };
 
 // Re-export commonly used functions
@@ -23,6 +24,7 @@ pub const compileFile = compile.compileFile;
 pub const compilePythonSource = compile.compilePythonSource;
 pub const compileNotebook = compile.compileNotebook;
 pub const compileModule = compile.compileModule;
+pub const watchFile = compile.watchFile;
 
 pub const buildDirectory = utils.buildDirectory;
 pub const getArch = utils.getArch;
@@ -31,6 +33,8 @@ pub const runSharedLib = utils.runSharedLib;
 pub const printUsage = utils.printUsage;
 
 pub const computeHash = cache.computeHash;
+pub const computeCacheKey = cache.computeCacheKey;
 pub const getCachePath = cache.getCachePath;
 pub const shouldRecompile = cache.shouldRecompile;
 pub const updateCache = cache.updateCache;
+pub const computeCodeKey = cache.computeCodeKey;
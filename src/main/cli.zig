@@ -59,6 +59,8 @@ pub fn main() !void {
             opts.force = true;
         } else if (std.mem.eql(u8, arg, "--wasm") or std.mem.eql(u8, arg, "-w")) {
             opts.wasm = true;
+        } else if (std.mem.eql(u8, arg, "--watch")) {
+            opts.watch = true;
         } else if (std.mem.eql(u8, arg, "--emit-bytecode")) {
             opts.emit_bytecode = true;
         } else if (std.mem.startsWith(u8, arg, "--")) {
@@ -108,5 +110,10 @@ pub fn main() !void {
     opts.input_file = input_file.?;
     opts.output_file = output_file;
 
+    if (opts.watch) {
+        try compile.watchFile(allocator, opts);
+        return;
+    }
+
     try compile.compileFile(allocator, opts);
 }
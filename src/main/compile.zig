@@ -17,6 +17,7 @@ const utils = @import("utils.zig");
 const import_resolver = @import("../import_resolver.zig");
 const import_scanner = @import("../import_scanner.zig");
 const import_registry = @import("../codegen/native/import_registry.zig");
+const parse_cache = @import("../parse_cache.zig");
 
 // Submodules
 const cache = @import("compile/cache.zig");
@@ -27,22 +28,21 @@ fn getModuleOutputPath(allocator: std.mem.Allocator, module_path: []const u8) ![
     return output.getModuleOutputPath(allocator, module_path);
 }
 
-pub fn compileModule(allocator: std.mem.Allocator, module_path: []const u8, module_name: []const u8) !void {
+/// deps_key covers the sources of every module this one (transitively) imports
+pub fn compileModule(allocator: std.mem.Allocator, module_path: []const u8, module_name: []const u8, deps_key: [32]u8) !void {
     // Use arena allocator for all intermediate allocations to avoid leaks on parse errors
     var arena = std.heap.ArenaAllocator.init(allocator);
     defer arena.deinit();
     const aa = arena.allocator();
 
-    // Read module source (handle absolute paths)
-    const source = blk: {
-        if (std.fs.path.isAbsolute(module_path)) {
-            const file = try std.fs.openFileAbsolute(module_path, .{});
-            defer file.close();
-            break :blk try file.readToEndAlloc(aa, 10 * 1024 * 1024);
-        } else {
-            break :blk try std.fs.cwd().readFileAlloc(aa, module_path, 10 * 1024 * 1024);
-        }
-    };
+    // Read module source (handle absolute paths); the stat keys parse_cache
+    const module_file = if (std.fs.path.isAbsolute(module_path))
+        try std.fs.openFileAbsolute(module_path, .{})
+    else
+        try std.fs.cwd().openFile(module_path, .{});
+    defer module_file.close();
+    const module_stat = try module_file.stat();
+    const source = try module_file.readToEndAlloc(aa, 10 * 1024 * 1024);
     // No defer needed - arena handles cleanup
 
     // Use provided module_name if not empty, otherwise derive from path
@@ -61,22 +61,22 @@ pub fn compileModule(allocator: std.mem.Allocator, module_path: []const u8, modu
             break :blk basename;
     };
 
-    // Generate Zig code for this module
-    std.debug.print("  Generating Zig for module: {s}\n", .{module_path});
+    // Save to .build/module_name.zig (use arena)
+    const output_path = try std.fmt.allocPrint(aa, ".build/{s}.zig", .{mod_name});
+    // output_path allocated by arena - no defer needed
 
-    // Use existing compilation pipeline
-    const lexer_mod = @import("../lexer.zig");
-    const parser_mod = @import("../parser.zig");
+    // Reuse generated Zig if the module source, its imports' sources and the compiler are unchanged
+    const module_key = cache.computeModuleKey(source, deps_key);
+    if (!try cache.shouldRecompileKey(aa, module_key, output_path)) {
+        std.debug.print("  ✓ Module Zig up-to-date: {s}\n", .{output_path});
+        return;
+    }
 
-    var lex = try lexer_mod.Lexer.init(aa, source);
-    defer lex.deinit();
-    const tokens = try lex.tokenize();
-    // No defer needed for tokens - arena handles cleanup
+    // Generate Zig code for this module
+    std.debug.print("  Generating Zig for module: {s}\n", .{module_path});
 
-    var p = parser_mod.Parser.init(aa, tokens);
-    defer p.deinit();
-    const tree = try p.parse();
-    // No defer needed for tree - arena handles cleanup
+    // Shared with compileModuleAsStruct (and later --watch rebuilds)
+    const tree = try parse_cache.parseSource(module_path, module_stat, source);
 
     // Perform semantic analysis
     const semantic_types_mod = @import("../analysis/types.zig");
@@ -106,17 +106,188 @@ pub fn compileModule(allocator: std.mem.Allocator, module_path: []const u8, modu
         return error.InvalidAST;
     // zig_code allocated by arena - no defer needed
 
-    // Save to .build/module_name.zig (use arena)
-    const output_path = try std.fmt.allocPrint(aa, ".build/{s}.zig", .{mod_name});
-    // output_path allocated by arena - no defer needed
-
     const file = try std.fs.cwd().createFile(output_path, .{});
     defer file.close();
     try file.writeAll(zig_code);
+    try cache.updateCacheKey(aa, module_key, output_path);
 
     std.debug.print("  ✓ Module Zig generated: {s}\n", .{output_path});
 }
 
+/// Imported module queued for Zig generation
+const ModuleJob = struct {
+    path: []const u8,
+    name: []const u8,
+    deps_key: [32]u8,
+};
+
+/// Generate Zig for one module, reporting (not propagating) failures
+fn compileModuleJob(allocator: std.mem.Allocator, job: ModuleJob) void {
+    std.debug.print("  Compiling module: {s} (as {s})\n", .{ job.path, job.name });
+    compileModule(allocator, job.path, job.name, job.deps_key) catch |err| {
+        std.debug.print("  Warning: Failed to compile module {s}: {}\n", .{ job.path, err });
+    };
+}
+
+/// Claims module jobs off a shared index until none remain
+const ModuleWorker = struct {
+    jobs: []const ModuleJob,
+    next_job: *std.atomic.Value(usize),
+
+    fn run(self: *ModuleWorker) void {
+        while (true) {
+            const idx = self.next_job.fetchAdd(1, .monotonic);
+            if (idx >= self.jobs.len) return;
+            // Each module gets its own arena; page_allocator is safe to share across threads
+            compileModuleJob(std.heap.page_allocator, self.jobs[idx]);
+        }
+    }
+};
+
+/// Below this many modules, thread startup costs more than it saves
+const parallel_module_threshold = 4;
+
+/// Generate Zig for imported modules, spread across CPUs when there are enough of them
+/// Modules are independent here (each gets its own lexer, parser, inferrer and codegen)
+fn compileModules(allocator: std.mem.Allocator, jobs: []const ModuleJob) void {
+    const num_threads = @min(jobs.len, std.Thread.getCpuCount() catch 1);
+    if (jobs.len < parallel_module_threshold or num_threads <= 1) {
+        for (jobs) |job| compileModuleJob(allocator, job);
+        return;
+    }
+
+    // Memoized on first use: fill it before workers race on it
+    _ = cache.compilerFingerprint();
+
+    var next_job = std.atomic.Value(usize).init(0);
+    var main_worker = ModuleWorker{ .jobs = jobs, .next_job = &next_job };
+
+    // The calling thread works too, so jobs finish even if no thread could be spawned
+    const workers = allocator.alloc(ModuleWorker, num_threads - 1) catch return main_worker.run();
+    defer allocator.free(workers);
+    const threads = allocator.alloc(std.Thread, num_threads - 1) catch return main_worker.run();
+    defer allocator.free(threads);
+
+    var spawned: usize = 0;
+    while (spawned < workers.len) : (spawned += 1) {
+        workers[spawned] = .{ .jobs = jobs, .next_job = &next_job };
+        threads[spawned] = std.Thread.spawn(.{}, ModuleWorker.run, .{&workers[spawned]}) catch break;
+    }
+
+    main_worker.run();
+    for (threads[0..spawned]) |thread| thread.join();
+}
+
+/// Generate Zig for every module in the import graph except the main file, dependencies
+/// before their importers: generate() only emits @import for deps whose .build/<dep>.zig
+/// already exists. Each wave is every module whose deps are all generated (run in parallel).
+fn compileImportedModules(allocator: std.mem.Allocator, graph: *import_scanner.ImportGraph, main_path: []const u8) !void {
+    const paths = graph.modules.keys();
+    const infos = graph.modules.values();
+
+    const done = try allocator.alloc(bool, paths.len);
+    defer allocator.free(done);
+    @memset(done, false);
+    var remaining = paths.len;
+    if (graph.modules.getIndex(main_path)) |main_idx| {
+        done[main_idx] = true;
+        remaining -= 1;
+    }
+
+    var source_keys = hashmap_helper.StringHashMap([32]u8).init(allocator);
+    defer source_keys.deinit();
+    var wave = std.ArrayList(ModuleJob){};
+    defer wave.deinit(allocator);
+    var wave_indices = std.ArrayList(usize){};
+    defer wave_indices.deinit(allocator);
+
+    while (remaining > 0) {
+        wave.clearRetainingCapacity();
+        wave_indices.clearRetainingCapacity();
+        for (infos, 0..) |info, i| {
+            if (done[i] or !depsGenerated(graph, i, done)) continue;
+            try wave_indices.append(allocator, i);
+        }
+        // Import cycle: no module left has all its deps generated, so take them all
+        if (wave_indices.items.len == 0) {
+            for (done, 0..) |is_done, i| {
+                if (!is_done) try wave_indices.append(allocator, i);
+            }
+        }
+
+        for (wave_indices.items) |i| {
+            try wave.append(allocator, .{
+                .path = paths[i],
+                .name = infos[i].module_name,
+                .deps_key = try dependencyKey(allocator, graph, i, &source_keys),
+            });
+            done[i] = true;
+        }
+        remaining -= wave.items.len;
+        compileModules(allocator, wave.items);
+    }
+}
+
+/// Whether every in-graph import of module idx has been generated (self-imports aside)
+fn depsGenerated(graph: *import_scanner.ImportGraph, idx: usize, done: []const bool) bool {
+    for (graph.modules.values()[idx].deps) |dep| {
+        const dep_idx = graph.modules.getIndex(dep) orelse continue;
+        if (dep_idx != idx and !done[dep_idx]) return false;
+    }
+    return true;
+}
+
+/// Key over the sources of every module idx transitively imports, in path order
+fn dependencyKey(
+    allocator: std.mem.Allocator,
+    graph: *import_scanner.ImportGraph,
+    idx: usize,
+    source_keys: *hashmap_helper.StringHashMap([32]u8),
+) ![32]u8 {
+    const paths = graph.modules.keys();
+    const infos = graph.modules.values();
+
+    // Collect the import closure (depth-first over resolved dependency edges)
+    var closure = hashmap_helper.StringHashMap(void).init(allocator);
+    defer closure.deinit();
+    var stack = std.ArrayList(usize){};
+    defer stack.deinit(allocator);
+    try stack.append(allocator, idx);
+    while (stack.pop()) |current| {
+        for (infos[current].deps) |dep| {
+            const dep_idx = graph.modules.getIndex(dep) orelse continue;
+            if (dep_idx == idx) continue;
+            const entry = try closure.getOrPut(paths[dep_idx]);
+            if (!entry.found_existing) try stack.append(allocator, dep_idx);
+        }
+    }
+
+    // Sorted copy: reordering the map's own keys would break its index
+    const closure_paths = try allocator.dupe([]const u8, closure.keys());
+    defer allocator.free(closure_paths);
+    std.mem.sort([]const u8, closure_paths, {}, pathLessThan);
+
+    var hasher = std.crypto.hash.Blake3.init(.{});
+    for (closure_paths) |path| {
+        const entry = try source_keys.getOrPut(path);
+        if (!entry.found_existing) {
+            // Unreadable sources hash as empty; compileModule reports the read error
+            const source = std.fs.cwd().readFileAlloc(allocator, path, 10 * 1024 * 1024) catch "";
+            defer if (source.len > 0) allocator.free(source);
+            entry.value_ptr.* = cache.computeHash(source);
+        }
+        hasher.update(path);
+        hasher.update(entry.value_ptr);
+    }
+    var key: [32]u8 = undefined;
+    hasher.final(&key);
+    return key;
+}
+
+fn pathLessThan(_: void, a: []const u8, b: []const u8) bool {
+    return std.mem.lessThan(u8, a, b);
+}
+
 /// Compile a Jupyter notebook (.ipynb file)
 pub fn compileNotebook(allocator: std.mem.Allocator, opts: CompileOptions) !void {
     std.debug.print("Parsing notebook: {s}\n", .{opts.input_file});
@@ -270,7 +441,74 @@ fn emitBytecode(allocator: std.mem.Allocator, source: []const u8) !void {
     _ = try std.posix.write(std.posix.STDOUT_FILENO, bytes);
 }
 
+/// How often --watch checks the watched files for changes
+const watch_poll_ns = 250 * std.time.ns_per_ms;
+
+/// Watched path -> last seen mtime (null until first seen)
+const WatchSet = hashmap_helper.StringHashMap(?i128);
+
+/// Recompile whenever the input file or any module it imports changes (--watch)
+/// Every path in the last build's import graph is polled, so editing an imported module
+/// rebuilds too. One long-lived process keeps the memoized compiler fingerprint and reuses
+/// every cache layer (generated module Zig, output store, content-named main file for
+/// Zig's cache), so an edit only pays for what actually changed.
+pub fn watchFile(allocator: std.mem.Allocator, opts: CompileOptions) !void {
+    std.debug.print("Watching {s} for changes (Ctrl+C to stop)...\n", .{opts.input_file});
+
+    var watched = WatchSet.init(allocator);
+    defer {
+        for (watched.keys()) |path| allocator.free(path);
+        watched.deinit();
+    }
+    try watched.put(try allocator.dupe(u8, opts.input_file), null);
+
+    var build_paths = std.ArrayList([]const u8){};
+    defer build_paths.deinit(allocator);
+
+    while (true) : (std.Thread.sleep(watch_poll_ns)) {
+        if (!pollWatchSet(&watched)) continue;
+
+        build_paths.clearRetainingCapacity();
+        compileFileTracked(allocator, opts, &build_paths) catch |err| {
+            std.debug.print("Error: Compilation failed: {}\n", .{err});
+        };
+        for (build_paths.items) |path| {
+            const entry = try watched.getOrPut(path);
+            if (entry.found_existing) {
+                allocator.free(path);
+                continue;
+            }
+            entry.key_ptr.* = path;
+            // Read by the build that just ran, so only later edits count as changes
+            entry.value_ptr.* = if (std.fs.cwd().statFile(path)) |stat| stat.mtime else |_| null;
+        }
+    }
+}
+
+/// Refresh every watched path's mtime; true if any changed since the last poll
+fn pollWatchSet(watched: *WatchSet) bool {
+    var changed = false;
+    for (watched.keys(), watched.values()) |path, *last_mtime| {
+        // Editors may briefly remove a file while saving
+        const stat = std.fs.cwd().statFile(path) catch continue;
+        if (last_mtime.* != null and last_mtime.*.? == stat.mtime) continue;
+        last_mtime.* = stat.mtime;
+        changed = true;
+    }
+    return changed;
+}
+
 pub fn compileFile(allocator: std.mem.Allocator, opts: CompileOptions) !void {
+    return compileFileTracked(allocator, opts, null);
+}
+
+/// compileFile that also reports the build's import graph paths (owned by the caller,
+/// allocated with `allocator`) to --watch
+fn compileFileTracked(
+    allocator: std.mem.Allocator,
+    opts: CompileOptions,
+    graph_paths: ?*std.ArrayList([]const u8),
+) !void {
     // Check if input is a Jupyter notebook
     if (std.mem.endsWith(u8, opts.input_file, ".ipynb")) {
         return try compileNotebook(allocator, opts);
@@ -292,8 +530,38 @@ pub fn compileFile(allocator: std.mem.Allocator, opts: CompileOptions) !void {
     // Determine output path
     const bin_path = try output.getFileOutputPath(aa, opts.input_file, opts.output_file, opts.binary);
 
+    // PHASE 0: Import Dependency Scanning
+    // Done before the up-to-date check: the output depends on every imported module
+    std.debug.print("Scanning imports recursively...\n", .{});
+
+    // Create registry to skip zig_runtime/c_library modules during scanning
+    var scan_registry = try import_registry.createDefaultRegistry(aa);
+
+    var import_graph = import_scanner.ImportGraph.initWithRegistry(aa, &scan_registry);
+
+    var visited = hashmap_helper.StringHashMap(void).init(aa);
+
+    // Scan all imports recursively
+    try import_graph.scanRecursive(opts.input_file, &visited);
+
+    if (graph_paths) |paths| {
+        for (import_graph.modules.keys()) |path| {
+            const path_copy = try allocator.dupe(u8, path);
+            errdefer allocator.free(path_copy);
+            try paths.append(allocator, path_copy);
+        }
+    }
+
+    // Key the output on the main source and everything it transitively imports
+    var source_keys = hashmap_helper.StringHashMap([32]u8).init(aa);
+    const deps_key = if (import_graph.modules.getIndex(opts.input_file)) |main_idx|
+        try dependencyKey(aa, &import_graph, main_idx, &source_keys)
+    else
+        cache.computeHash("");
+    const build_key = cache.computeModuleKey(source, deps_key);
+
     // Check if binary is up-to-date using content hash (unless --force)
-    const should_compile = opts.force or try cache.shouldRecompile(aa, source, bin_path);
+    const should_compile = opts.force or try cache.shouldRecompileKey(aa, build_key, bin_path);
 
     if (!should_compile) {
         // Output is up-to-date, skip compilation
@@ -332,40 +600,13 @@ pub fn compileFile(allocator: std.mem.Allocator, opts: CompileOptions) !void {
         return error.InvalidAST;
     }
 
-    // PHASE 2.3: Import Dependency Scanning
-    std.debug.print("Scanning imports recursively...\n", .{});
-
-    // Create registry to skip zig_runtime/c_library modules during scanning
-    var scan_registry = try import_registry.createDefaultRegistry(aa);
-
-    var import_graph = import_scanner.ImportGraph.initWithRegistry(aa, &scan_registry);
-
-    var visited = hashmap_helper.StringHashMap(void).init(aa);
-
-    // Scan all imports recursively
-    try import_graph.scanRecursive(opts.input_file, &visited);
-
-    // Compile each imported module in dependency order
+    // PHASE 2.3: Compile each imported module in dependency order (graph from PHASE 0)
     // Ensure .build directory exists for module Zig output
     std.fs.cwd().makeDir(".build") catch |err| {
         if (err != error.PathAlreadyExists) return err;
     };
     std.debug.print("Compiling {d} imported modules...\n", .{import_graph.modules.count()});
-    var iter = import_graph.modules.iterator();
-    while (iter.next()) |entry| {
-        const module_path = entry.key_ptr.*;
-        const module_info = entry.value_ptr.*;
-
-        // Skip the main file itself
-        if (std.mem.eql(u8, module_path, opts.input_file)) continue;
-
-        // Compile module using the proper module name
-        std.debug.print("  Compiling module: {s} (as {s})\n", .{ module_path, module_info.module_name });
-        compileModule(aa, module_path, module_info.module_name) catch |err| {
-            std.debug.print("  Warning: Failed to compile module {s}: {}\n", .{ module_path, err });
-            continue;
-        };
-    }
+    try compileImportedModules(aa, &import_graph, opts.input_file);
 
     // PHASE 2.5: C Library Import Detection
     var import_ctx = c_interop.ImportContext.init(aa);
@@ -457,18 +698,39 @@ pub fn compileFile(allocator: std.mem.Allocator, opts: CompileOptions) !void {
         std.debug.print("✓ Compiled successfully to: {s}\n", .{wasm_path});
         // WASM cannot be run directly, skip cache and run
         return;
-    } else if (!opts.binary and std.mem.eql(u8, opts.mode, "build")) {
-        std.debug.print("Compiling to shared library...\n", .{});
-        try compiler.compileZigSharedLib(aa, zig_code, bin_path, c_libs);
-    } else {
-        std.debug.print("Compiling to native binary...\n", .{});
-        try compiler.compileZig(aa, zig_code, bin_path, c_libs);
     }
 
-    std.debug.print("✓ Compiled successfully to: {s}\n", .{bin_path});
+    // Reuse an output built from identical generated code (any source path or workspace)
+    // -f bypasses the output store entirely: nothing is restored from it or added to it
+    const build_shared_lib = !opts.binary and std.mem.eql(u8, opts.mode, "build");
+    const code_key: ?[32]u8 = if (opts.force)
+        null
+    else
+        try cache.computeCodeKey(aa, zig_code, import_graph.modules.keys(), c_libs, if (build_shared_lib) "shared-lib" else "exe");
+    const restored = if (code_key) |key| try cache.restoreOutput(aa, key, bin_path) else false;
+
+    if (restored) {
+        std.debug.print("✓ Reused cached build for identical code: {s}\n", .{bin_path});
+    } else {
+        // bin_path may be a hardlink into the output store: unlink it so Zig writes a
+        // fresh file instead of overwriting the stored entry in place
+        std.fs.cwd().deleteFile(bin_path) catch |err| {
+            if (err != error.FileNotFound) return err;
+        };
+        if (build_shared_lib) {
+            std.debug.print("Compiling to shared library...\n", .{});
+            try compiler.compileZigSharedLib(aa, zig_code, bin_path, c_libs);
+        } else {
+            std.debug.print("Compiling to native binary...\n", .{});
+            try compiler.compileZig(aa, zig_code, bin_path, c_libs);
+        }
+        if (code_key) |key| try cache.storeOutput(aa, key, bin_path);
+
+        std.debug.print("✓ Compiled successfully to: {s}\n", .{bin_path});
+    }
 
     // Update cache with new hash
-    try cache.updateCache(aa, source, bin_path);
+    try cache.updateCacheKey(aa, build_key, bin_path);
 
     // Run if mode is "run"
     if (std.mem.eql(u8, opts.mode, "run")) {
@@ -1,39 +1,102 @@
 /// Compilation cache management (content-hash based)
 const std = @import("std");
+const builtin = @import("builtin");
+const compiler = @import("../../compiler.zig");
 
-/// Compute SHA256 hash of source content
+/// Cache-key hash: BLAKE3 (SIMD) is several times faster than SHA-256 in software
+/// and keeps the 32-byte digest, so .hash files stay 64 hex chars
+const Blake3 = std.crypto.hash.Blake3;
+
+/// Compute BLAKE3 hash of source content
 pub fn computeHash(source: []const u8) [32]u8 {
     var hash: [32]u8 = undefined;
-    std.crypto.hash.sha2.Sha256.hash(source, &hash, .{});
+    Blake3.hash(source, &hash, .{});
     return hash;
 }
 
+/// Fingerprint of the compiler doing the build: Zig version, optimize mode, and the
+/// identity (size, mtime, inode) of the running metal0 executable. A rebuilt compiler
+/// changes the fingerprint, so binaries produced by an older codegen are not reused.
+/// Computed once per process: the compiler cannot change under a running build.
+pub fn compilerFingerprint() [32]u8 {
+    if (cached_fingerprint) |fingerprint| return fingerprint;
+
+    var hasher = Blake3.init(.{});
+    hasher.update(builtin.zig_version_string);
+    hasher.update(@tagName(builtin.mode));
+    // Fast debug binaries must not satisfy a release build (or vice versa)
+    if (compiler.fastDebugRequested()) hasher.update("fast-debug");
+
+    var exe_buf: [std.fs.max_path_bytes]u8 = undefined;
+    if (std.fs.selfExePath(&exe_buf)) |exe_path| {
+        if (std.fs.cwd().statFile(exe_path)) |stat| {
+            hasher.update(std.mem.asBytes(&stat.size));
+            hasher.update(std.mem.asBytes(&stat.mtime));
+            hasher.update(std.mem.asBytes(&stat.inode));
+        } else |_| {}
+    } else |_| {}
+
+    var fingerprint: [32]u8 = undefined;
+    hasher.final(&fingerprint);
+    cached_fingerprint = fingerprint;
+    return fingerprint;
+}
+
+var cached_fingerprint: ?[32]u8 = null;
+
+/// Compute the cache key for a build: BLAKE3 over source content and compiler fingerprint
+pub fn computeCacheKey(source: []const u8) [32]u8 {
+    const fingerprint = compilerFingerprint();
+    var hasher = Blake3.init(.{});
+    hasher.update(source);
+    hasher.update(&fingerprint);
+    var key: [32]u8 = undefined;
+    hasher.final(&key);
+    return key;
+}
+
+/// Cache key for an imported module's generated Zig: the module's own source, a key
+/// over the sources it (transitively) imports, and the compiler fingerprint.
+/// Generated code depends on its imports (which @imports get emitted, their types),
+/// so a change anywhere in the closure must regenerate it.
+pub fn computeModuleKey(source: []const u8, deps_key: [32]u8) [32]u8 {
+    const source_key = computeCacheKey(source);
+    var hasher = Blake3.init(.{});
+    hasher.update(&source_key);
+    hasher.update(&deps_key);
+    var key: [32]u8 = undefined;
+    hasher.final(&key);
+    return key;
+}
+
 /// Get cache file path for a binary
 pub fn getCachePath(allocator: std.mem.Allocator, bin_path: []const u8) ![]const u8 {
     // Cache file next to binary: .metal0/fibonacci.hash
     return try std.fmt.allocPrint(allocator, "{s}.hash", .{bin_path});
 }
 
-/// Check if recompilation is needed (compare source hash with cached hash)
+/// Check if recompilation is needed (compare cache key with cached key)
 pub fn shouldRecompile(allocator: std.mem.Allocator, source: []const u8, bin_path: []const u8) !bool {
-    // Check if binary exists
-    std.fs.cwd().access(bin_path, .{}) catch return true; // Binary missing, must compile
-
-    // Compute current source hash
-    const current_hash = computeHash(source);
+    return shouldRecompileKey(allocator, computeCacheKey(source), bin_path);
+}
 
-    // Read cached hash
+/// shouldRecompile for a caller-computed cache key
+pub fn shouldRecompileKey(allocator: std.mem.Allocator, current_hash: [32]u8, bin_path: []const u8) !bool {
+    // Read cached hash first: a missing cache decides without touching the binary
     const cache_path = try getCachePath(allocator, bin_path);
     defer allocator.free(cache_path);
 
-    const cached_hash_hex = std.fs.cwd().readFileAlloc(allocator, cache_path, 1024) catch {
+    var hex_buf: [64]u8 = undefined;
+    const cached_hash_hex = std.fs.cwd().readFile(cache_path, &hex_buf) catch {
         return true; // Cache missing, must compile
     };
-    defer allocator.free(cached_hash_hex);
 
     // Convert hex string back to bytes
     if (cached_hash_hex.len != 64) return true; // Invalid cache
 
+    // Check if binary exists
+    std.fs.cwd().access(bin_path, .{}) catch return true; // Binary missing, must compile
+
     var cached_hash: [32]u8 = undefined;
     for (0..32) |i| {
         cached_hash[i] = std.fmt.parseInt(u8, cached_hash_hex[i * 2 .. i * 2 + 2], 16) catch return true;
@@ -43,17 +106,14 @@ pub fn shouldRecompile(allocator: std.mem.Allocator, source: []const u8, bin_pat
     return !std.mem.eql(u8, &current_hash, &cached_hash);
 }
 
-/// Update cache with new source hash
+/// Update cache with new cache key
 pub fn updateCache(allocator: std.mem.Allocator, source: []const u8, bin_path: []const u8) !void {
-    const hash = computeHash(source);
+    try updateCacheKey(allocator, computeCacheKey(source), bin_path);
+}
 
-    // Convert hash to hex string (manually)
-    var hex_buf: [64]u8 = undefined;
-    const hex_chars = "0123456789abcdef";
-    for (hash, 0..) |byte, i| {
-        hex_buf[i * 2] = hex_chars[byte >> 4];
-        hex_buf[i * 2 + 1] = hex_chars[byte & 0x0F];
-    }
+/// updateCache for a caller-computed cache key
+pub fn updateCacheKey(allocator: std.mem.Allocator, hash: [32]u8, bin_path: []const u8) !void {
+    const hex_buf = toHex(hash);
 
     // Write to cache file
     const cache_path = try getCachePath(allocator, bin_path);
@@ -64,3 +124,192 @@ pub fn updateCache(allocator: std.mem.Allocator, source: []const u8, bin_path: [
 
     try file.writeAll(&hex_buf);
 }
+
+/// Convert a hash to its lowercase hex string
+fn toHex(hash: [32]u8) [64]u8 {
+    var hex_buf: [64]u8 = undefined;
+    const hex_chars = "0123456789abcdef";
+    for (hash, 0..) |byte, i| {
+        hex_buf[i * 2] = hex_chars[byte >> 4];
+        hex_buf[i * 2 + 1] = hex_chars[byte & 0x0F];
+    }
+    return hex_buf;
+}
+
+/// Shared store of compiled outputs, addressed by computeCodeKey
+const output_store_dir = ".build/cache";
+
+/// Source trees staged into the build dir next to the generated code (see compiler.zig)
+const staged_source_dirs = [_][]const u8{
+    "packages/runtime/src",
+    "packages/bigint/src",
+    "packages/regex/src/pyregex",
+    "packages/shared/json/simd",
+    "packages/c_interop",
+    "src/utils",
+};
+
+/// BLAKE3 over every staged source file's relative path and contents, visited in
+/// sorted path order so directory iteration order doesn't change it.
+/// Not memoized: a --watch session must see runtime edits, so each build rehashes.
+pub fn stagedSourcesHash(allocator: std.mem.Allocator) [32]u8 {
+    var arena = std.heap.ArenaAllocator.init(allocator);
+    defer arena.deinit();
+
+    var hasher = Blake3.init(.{});
+    for (staged_source_dirs) |dir_path| {
+        hasher.update(dir_path);
+        hasher.update("\x00");
+        // An unreadable tree still yields a key, just one no complete tree matches
+        hashSourceTree(arena.allocator(), &hasher, dir_path) catch hasher.update("\xff");
+    }
+
+    var hash: [32]u8 = undefined;
+    hasher.final(&hash);
+    return hash;
+}
+
+fn hashSourceTree(allocator: std.mem.Allocator, hasher: *Blake3, dir_path: []const u8) !void {
+    var dir = std.fs.cwd().openDir(dir_path, .{ .iterate = true }) catch |err| {
+        if (err == error.FileNotFound) return;
+        return err;
+    };
+    defer dir.close();
+
+    var paths = std.ArrayList([]const u8){};
+    var walker = try dir.walk(allocator);
+    defer walker.deinit();
+    while (try walker.next()) |entry| {
+        if (entry.kind != .file) continue;
+        try paths.append(allocator, try allocator.dupe(u8, entry.path));
+    }
+    std.mem.sort([]const u8, paths.items, {}, pathLessThan);
+
+    for (paths.items) |path| {
+        const contents = try dir.readFileAlloc(allocator, path, 64 * 1024 * 1024);
+        defer allocator.free(contents);
+        hasher.update(path);
+        hasher.update("\x00");
+        hasher.update(contents);
+    }
+}
+
+fn pathLessThan(_: void, a: []const u8, b: []const u8) bool {
+    return std.mem.lessThan(u8, a, b);
+}
+
+/// Key a build output by what Zig actually compiles rather than where the source lives:
+/// generated code, imported module sources, the staged runtime sources, linked C
+/// libraries, output kind, and the compiler fingerprint. Identical programs share one
+/// entry across paths and renames.
+pub fn computeCodeKey(
+    allocator: std.mem.Allocator,
+    zig_code: []const u8,
+    module_paths: []const []const u8,
+    c_libraries: []const []const u8,
+    output_kind: []const u8,
+) ![32]u8 {
+    const fingerprint = compilerFingerprint();
+    var hasher = Blake3.init(.{});
+    const staged_sources = stagedSourcesHash(allocator);
+    hasher.update(&fingerprint);
+    hasher.update(&staged_sources);
+    hasher.update(output_kind);
+    hasher.update(zig_code);
+    for (module_paths) |module_path| {
+        const module_source = std.fs.cwd().readFileAlloc(allocator, module_path, 10 * 1024 * 1024) catch continue;
+        defer allocator.free(module_source);
+        hasher.update(module_source);
+    }
+    for (c_libraries) |lib| {
+        hasher.update(lib);
+        hasher.update("\x00");
+    }
+    var key: [32]u8 = undefined;
+    hasher.final(&key);
+    return key;
+}
+
+/// Copy the stored output for `key` to out_path; returns false on a cache miss
+pub fn restoreOutput(allocator: std.mem.Allocator, key: [32]u8, out_path: []const u8) !bool {
+    const stored_path = try std.fmt.allocPrint(allocator, output_store_dir ++ "/{s}", .{toHex(key)});
+    defer allocator.free(stored_path);
+
+    std.fs.cwd().access(stored_path, .{}) catch |err| {
+        if (err == error.FileNotFound) return false;
+        return err;
+    };
+    try linkOrCopy(stored_path, out_path);
+    return true;
+}
+
+/// Store a freshly compiled output under `key` for reuse by later builds
+pub fn storeOutput(allocator: std.mem.Allocator, key: [32]u8, out_path: []const u8) !void {
+    std.fs.cwd().makePath(output_store_dir) catch |err| {
+        if (err != error.PathAlreadyExists) return err;
+    };
+
+    const stored_path = try std.fmt.allocPrint(allocator, output_store_dir ++ "/{s}", .{toHex(key)});
+    defer allocator.free(stored_path);
+
+    try linkOrCopy(out_path, stored_path);
+
+    pruneOutputStore(allocator) catch |err| {
+        std.debug.print("Warning: Failed to prune output cache: {}\n", .{err});
+    };
+}
+
+/// Upper bound on the output store's total size; oldest entries are evicted beyond it
+const output_store_max_bytes: u64 = 2 * 1024 * 1024 * 1024;
+
+/// Evict the oldest output store entries until the store fits output_store_max_bytes
+fn pruneOutputStore(allocator: std.mem.Allocator) !void {
+    var dir = std.fs.cwd().openDir(output_store_dir, .{ .iterate = true }) catch return;
+    defer dir.close();
+
+    const StoreEntry = struct {
+        name: []const u8,
+        size: u64,
+        mtime: i128,
+
+        fn olderThan(_: void, a: @This(), b: @This()) bool {
+            return a.mtime < b.mtime;
+        }
+    };
+    var entries = std.ArrayList(StoreEntry){};
+    defer {
+        for (entries.items) |entry| allocator.free(entry.name);
+        entries.deinit(allocator);
+    }
+
+    var total_bytes: u64 = 0;
+    var iter = dir.iterate();
+    while (try iter.next()) |entry| {
+        if (entry.kind != .file) continue;
+        const stat = dir.statFile(entry.name) catch continue;
+        const name = try allocator.dupe(u8, entry.name);
+        errdefer allocator.free(name);
+        try entries.append(allocator, .{ .name = name, .size = stat.size, .mtime = stat.mtime });
+        total_bytes += stat.size;
+    }
+    if (total_bytes <= output_store_max_bytes) return;
+
+    std.mem.sort(StoreEntry, entries.items, {}, StoreEntry.olderThan);
+    for (entries.items) |entry| {
+        if (total_bytes <= output_store_max_bytes) break;
+        dir.deleteFile(entry.name) catch continue;
+        total_bytes -= entry.size;
+    }
+}
+
+/// Materialize src at dst as a hardlink (no data copied), falling back to a copy when
+/// linking is unsupported (e.g. across filesystems). Outputs may therefore share an
+/// inode with their store entry: rebuilds must replace out_path, not write into it.
+fn linkOrCopy(src: []const u8, dst: []const u8) !void {
+    std.fs.cwd().deleteFile(dst) catch |err| {
+        if (err != error.FileNotFound) return err;
+    };
+    std.posix.link(src, dst) catch {
+        try std.fs.cwd().copyFile(src, std.fs.cwd(), dst, .{});
+    };
+}
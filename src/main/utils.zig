@@ -129,12 +129,14 @@ pub fn printUsage() !void {
         \\  metal0 build <file.py> --wasm       # Build WebAssembly module
         \\  metal0 build <file.py> <out>        # Custom output path
         \\  metal0 build <file.py> -f           # Force rebuild
+        \\  metal0 build <file.py> --watch      # Rebuild whenever the file changes
         \\  metal0 test                         # Run test suite
         \\
         \\Flags:
         \\  --binary, -b  Build standalone binary (default: shared library)
         \\  --wasm, -w    Build WebAssembly module (.wasm)
         \\  --force, -f   Force recompile (ignore cache)
+        \\  --watch       Keep running and recompile on every change
         \\
         \\Examples:
         \\  metal0 myapp.py                     # Fast: builds myapp_x86_64.so
@@ -0,0 +1,108 @@
+/// Process-wide cache of parsed Python modules
+/// A module is parsed more than once per build (compileModule generates its Zig,
+/// compileModuleAsStruct registers its function types) and again on every --watch
+/// rebuild. Trees are keyed by path and reused while the file's mtime and size match.
+const std = @import("std");
+const ast = @import("ast");
+const lexer = @import("lexer.zig");
+const parser = @import("parser.zig");
+const hashmap_helper = @import("hashmap_helper");
+
+const Entry = struct {
+    mtime: i128,
+    size: u64,
+    /// Owns the key, source and tree (names and literals in the AST slice into the source)
+    arena: *std.heap.ArenaAllocator,
+    tree: ast.Node,
+};
+
+// Module workers (compileModules) parse concurrently
+var mutex: std.Thread.Mutex = .{};
+var entries = hashmap_helper.StringHashMap(Entry).init(std.heap.page_allocator);
+
+/// Parse a Python file, reusing the tree from an earlier call while the file is unchanged
+/// The returned tree lives for the rest of the process (or until the file changes)
+pub fn parseFile(path: []const u8) !ast.Node {
+    const file = if (std.fs.path.isAbsolute(path))
+        try std.fs.openFileAbsolute(path, .{})
+    else
+        try std.fs.cwd().openFile(path, .{});
+    defer file.close();
+    const stat = try file.stat();
+
+    if (lookup(path, stat)) |tree| return tree;
+
+    const arena = try createArena();
+    errdefer destroyArena(arena);
+    const source = try file.readToEndAlloc(arena.allocator(), 10 * 1024 * 1024);
+    return parseAndInstall(path, stat, arena, source);
+}
+
+/// parseFile for a caller that already read the source (under `stat`):
+/// a miss parses a copy of it rather than reading the file a second time
+pub fn parseSource(path: []const u8, stat: std.fs.File.Stat, source: []const u8) !ast.Node {
+    if (lookup(path, stat)) |tree| return tree;
+
+    const arena = try createArena();
+    errdefer destroyArena(arena);
+    return parseAndInstall(path, stat, arena, try arena.allocator().dupe(u8, source));
+}
+
+/// Parse source (allocated in arena) and cache the tree; on success the cache
+/// owns arena. Parsing runs outside the lock so workers don't serialize.
+/// Tokens live in a scratch arena freed once the tree is built: the AST copies
+/// what it needs out of them, and a cached token array outweighs the source.
+fn parseAndInstall(
+    path: []const u8,
+    stat: std.fs.File.Stat,
+    arena: *std.heap.ArenaAllocator,
+    source: []const u8,
+) !ast.Node {
+    const aa = arena.allocator();
+    const key = try aa.dupe(u8, path);
+
+    var scratch = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer scratch.deinit();
+    var lex = try lexer.Lexer.init(scratch.allocator(), source);
+    const tokens = try lex.tokenize();
+    var p = parser.Parser.init(aa, tokens);
+    const tree = try p.parse();
+
+    mutex.lock();
+    defer mutex.unlock();
+
+    const entry = try entries.getOrPut(key);
+    if (entry.found_existing) {
+        const old = entry.value_ptr.*;
+        // Another worker parsed the same version first: keep theirs
+        if (old.mtime == stat.mtime and old.size == stat.size) {
+            destroyArena(arena);
+            return old.tree;
+        }
+        // The file changed, which only happens between (--watch) builds, so
+        // nothing still holds the old tree
+        destroyArena(old.arena);
+    }
+    entry.key_ptr.* = key;
+    entry.value_ptr.* = .{ .mtime = stat.mtime, .size = stat.size, .arena = arena, .tree = tree };
+    return tree;
+}
+
+fn createArena() !*std.heap.ArenaAllocator {
+    const arena = try std.heap.page_allocator.create(std.heap.ArenaAllocator);
+    arena.* = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    return arena;
+}
+
+fn destroyArena(arena: *std.heap.ArenaAllocator) void {
+    arena.deinit();
+    std.heap.page_allocator.destroy(arena);
+}
+
+fn lookup(path: []const u8, stat: std.fs.File.Stat) ?ast.Node {
+    mutex.lock();
+    defer mutex.unlock();
+    const entry = entries.get(path) orelse return null;
+    if (entry.mtime != stat.mtime or entry.size != stat.size) return null;
+    return entry.tree;
+}
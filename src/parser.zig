@@ -62,6 +62,7 @@ pub const Parser = struct {
             try stmts.append(self.allocator, stmt);
             self.is_first_statement = false;
         }
+        statements.dropDocstring(self, &stmts);
 
         // Success path - transfer ownership, don't clean up
         const body = try stmts.toOwnedSlice(self.allocator);
@@ -23,6 +23,8 @@ pub const parseAssert = misc.parseAssert;
 pub const parseImport = imports.parseImport;
 pub const parseImportFrom = imports.parseImportFrom;
 pub const parseBlock = misc.parseBlock;
+pub const parseBodyBlock = misc.parseBodyBlock;
+pub const dropDocstring = misc.dropDocstring;
 pub const parseTry = misc.parseTry;
 pub const parseRaise = misc.parseRaise;
 pub const parsePass = misc.parsePass;
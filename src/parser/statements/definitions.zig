@@ -738,7 +738,7 @@ pub fn parseFunctionDefInternal(self: *Parser, is_async: bool) ParseError!ast.No
             _ = try self.expect(.Indent);
 
             self.function_depth += 1;
-            body = try misc.parseBlock(self);
+            body = try misc.parseBodyBlock(self);
             self.function_depth -= 1;
 
             _ = try self.expect(.Dedent);
@@ -884,7 +884,7 @@ pub fn parseClassDef(self: *Parser) ParseError!ast.Node {
         } else {
             _ = try self.expect(.Newline);
             _ = try self.expect(.Indent);
-            body_alloc = try misc.parseBlock(self);
+            body_alloc = try misc.parseBodyBlock(self);
             _ = try self.expect(.Dedent);
         }
     } else {
@@ -76,6 +76,27 @@ pub fn parseAssert(self: *Parser) ParseError!ast.Node {
 }
 
 pub fn parseBlock(self: *Parser) ParseError![]ast.Node {
+    return parseBlockImpl(self, false);
+}
+
+/// Parse a def/class body, dropping a leading docstring like `python -OO`
+pub fn parseBodyBlock(self: *Parser) ParseError![]ast.Node {
+    return parseBlockImpl(self, true);
+}
+
+/// Remove a leading docstring (bare string constant) from a body, so no later pass
+/// (analysis, type inference, codegen) walks it. A body that is only a docstring
+/// keeps it as its one statement.
+pub fn dropDocstring(self: *Parser, statements: *std.ArrayList(ast.Node)) void {
+    if (statements.items.len < 2) return;
+    const first = statements.items[0];
+    if (first != .expr_stmt) return;
+    if (first.expr_stmt.value.* != .constant or first.expr_stmt.value.constant.value != .string) return;
+    const docstring = statements.orderedRemove(0);
+    docstring.deinit(self.allocator);
+}
+
+fn parseBlockImpl(self: *Parser, comptime strip_docstring: bool) ParseError![]ast.Node {
     var statements = std.ArrayList(ast.Node){};
     errdefer {
         // Clean up already parsed statements on error
@@ -95,6 +116,7 @@ pub fn parseBlock(self: *Parser) ParseError![]ast.Node {
         const stmt = try self.parseStatement();
         try statements.append(self.allocator, stmt);
     }
+    if (strip_docstring) dropDocstring(self, &statements);
 
     // Success - transfer ownership
     const result = try statements.toOwnedSlice(self.allocator);
@@ -0,0 +1,4 @@
+"""Package for test_import_scan_shapes: relative imports from a package"""
+from .leaf import value
+from . import leaf
+from .sub import twice
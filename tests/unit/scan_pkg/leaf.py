@@ -0,0 +1,4 @@
+"""Leaf module for test_import_scan_shapes"""
+
+def value() -> int:
+    return 21
@@ -0,0 +1,2 @@
+"""Nested package: `..pkg.mod` climbs to scan_pkg before descending"""
+from ..sub.helpers import twice
@@ -0,0 +1,4 @@
+"""Helpers for test_import_scan_shapes"""
+
+def twice(x: int) -> int:
+    return x * 2
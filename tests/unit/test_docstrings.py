@@ -0,0 +1,33 @@
+"""Test docstrings dropped at parse time: module, def and class bodies"""
+import test_utils
+
+
+def only_docstring():
+    """Body is only a docstring"""
+
+
+def docstring_then_code(x: int) -> int:
+    """Docstring followed by code"""
+    return x + 1
+
+
+class Counter:
+    """Class docstring followed by methods"""
+
+    def __init__(self, start: int):
+        """Method docstring followed by code"""
+        self.value = start
+
+    def bump(self) -> int:
+        self.value = self.value + 1
+        return self.value
+
+
+only_docstring()
+print(docstring_then_code(41))  # Should print 42
+
+counter = Counter(1)
+print(counter.bump())  # Should print 2
+
+# Module docstring followed by imports: the import still resolves
+print(test_utils.double(21))  # Should print 42
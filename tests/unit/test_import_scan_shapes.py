@@ -0,0 +1,31 @@
+"""Test the import scanner on each import statement shape
+Only top-level imports are collected, matching what the parser records"""
+# `import a.b, c` records its first module only (scan_pkg.leaf)
+import scan_pkg.leaf, test_utils
+
+# A `;`-separated top-level import is collected (test_mymodule is used below)
+count = 1; import test_mymodule
+
+# scan_pkg uses `from .mod import x` and `from . import x`; scan_pkg/sub uses
+# `from ..pkg.mod import x`. Each resolves against the importing file's directory
+import scan_pkg
+
+# Imports nested under if/def/try, or after a `:` on the same line, are not
+# top-level statements, so the scanner does not collect them
+if count == 0:
+    import test_math
+
+if count == 0: import test_math
+
+
+def nested_import() -> int:
+    import test_math
+    return 0
+
+
+try:
+    import test_math
+except ImportError:
+    pass
+
+print(test_mymodule.add(2, 3))  # Should print 5